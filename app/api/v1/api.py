@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 from app.api.v1.endpoints import (
     auth, users, campaigns, social_channels, reviews,
-    payments, categories, coupons, points
+    payments, categories, coupons, points, hashtags, influencers
 )
 
 api_router = APIRouter()
@@ -14,4 +14,6 @@ api_router.include_router(reviews.router, prefix="/reviews", tags=["reviews"])
 api_router.include_router(payments.router, prefix="/payments", tags=["payments"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(coupons.router, prefix="/coupons", tags=["coupons"])
-api_router.include_router(points.router, prefix="/points", tags=["points"]) 
\ No newline at end of file
+api_router.include_router(points.router, prefix="/points", tags=["points"])
+api_router.include_router(hashtags.router, prefix="/hashtags", tags=["hashtags"])
+api_router.include_router(influencers.router, prefix="/influencers", tags=["influencers"]) 
\ No newline at end of file
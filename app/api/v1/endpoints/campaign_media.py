@@ -1,5 +1,5 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.models.user import User, UserType
@@ -11,11 +11,14 @@ from app.schemas.campaign_media import (
     MediaType
 )
 from app.db.database import get_db
+from app.core.response_cache import response_cache
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+CAMPAIGN_MEDIA_CACHE_TTL = 300
+
 @router.post("/", response_model=CampaignMediaResponse)
 def create_campaign_media(
     *,
@@ -50,6 +53,7 @@ def create_campaign_media(
         db.add(media)
         db.commit()
         db.refresh(media)
+        response_cache.invalidate(f"campaign_media:{media.campaign_id}")
         
         return media
         
@@ -63,6 +67,7 @@ def create_campaign_media(
 
 @router.get("/campaign/{campaign_id}", response_model=List[CampaignMediaResponse])
 def read_campaign_media(
+    request: Request,
     campaign_id: int,
     current_user: User = Depends(deps.get_current_active_user),
     db: Session = Depends(get_db),
@@ -70,11 +75,20 @@ def read_campaign_media(
     """
     캠페인의 매체별 요구사항을 조회합니다.
     """
-    media_list = db.query(CampaignMedia).filter(
-        CampaignMedia.campaign_id == campaign_id
-    ).all()
+    key = response_cache.key(request)
+    cached = response_cache.get(key)
+    if cached is None:
+        media_list = db.query(CampaignMedia).filter(
+            CampaignMedia.campaign_id == campaign_id
+        ).all()
+        cached = response_cache.put(
+            key,
+            [CampaignMediaResponse.from_orm(media) for media in media_list],
+            ttl=CAMPAIGN_MEDIA_CACHE_TTL,
+            tags=[f"campaign_media:{campaign_id}"],
+        )
     
-    return media_list
+    return cached.to_response(request)
 
 @router.get("/{media_id}", response_model=CampaignMediaResponse)
 def read_campaign_media_detail(
@@ -132,6 +146,7 @@ def update_campaign_media(
         db.add(media)
         db.commit()
         db.refresh(media)
+        response_cache.invalidate(f"campaign_media:{media.campaign_id}")
         
         return media
         
@@ -171,6 +186,7 @@ def delete_campaign_media(
         
         db.delete(media)
         db.commit()
+        response_cache.invalidate(f"campaign_media:{media.campaign_id}")
         
         return {"message": "매체 요구사항이 성공적으로 삭제되었습니다."}
         
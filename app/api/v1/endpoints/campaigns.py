@@ -1,10 +1,10 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app import crud, schemas
 from app.api import deps
 from app.models.user import User, UserType
-from app.models.campaign import Campaign, CampaignStatus, CampaignApplication
+from app.models.campaign import AdmissionStatus, Campaign, CampaignStatus, CampaignApplication, CampaignLocation, CampaignSchedule
 from app.schemas.campaign import (
     CampaignCreate,
     CampaignUpdate,
@@ -13,14 +13,30 @@ from app.schemas.campaign import (
     CampaignApplicationCreate,
     CampaignApplicationUpdate,
     CampaignApplicationResponse,
-    CampaignApplicationList
+    CampaignApplicationList,
+    CampaignSelectionResult
 )
+from app.schemas.review import CampaignReviewAnalytics
+from app.schemas.campaign_schedule import CampaignSchedule as CampaignScheduleIn, CampaignScheduleResponse
+from app.crud.crud_review_analytics import review_analytics
+from app.core.campaign_selection import run_selection
+from app.core.campaign_lifecycle import lifecycle_scheduler
+from app.core.campaign_feed import FeedOrder, campaign_feed
+from app.core.responses import etag_matches
+from app.core.export import ExportFormat, stream_export
+from app.core.regions import get_region_index
+from app.core.category_tree import category_tree
+from app.core.response_cache import response_cache
+from app.crud.crud_campaign_location import campaign_location as crud_campaign_location
+from app.schemas.location import Location, CampaignLocationResponse, NearbyCampaign, NearbyCampaignList
 from app.db.database import get_db
 from datetime import datetime
 from app.core.security import get_current_active_user
 
 router = APIRouter()
 
+CAMPAIGN_CACHE_TTL = 60
+
 @router.post("/", response_model=CampaignResponse)
 def create_campaign(
     *,
@@ -57,20 +73,41 @@ def create_campaign(
     db.add(campaign)
     db.commit()
     db.refresh(campaign)
+    campaign_feed.apply([campaign])
     return campaign
 
 @router.get("/", response_model=CampaignList)
 def read_campaigns(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     status: Optional[CampaignStatus] = None,
     campaign_type: Optional[str] = None,
+    order: FeedOrder = FeedOrder.RECENT,
+    region: Optional[str] = Query(None, description="지역 (예: 서울, 서울 강남구)"),
+    category_id: Optional[int] = Query(None, description="카테고리 (하위 카테고리 포함)"),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     캠페인 목록을 조회합니다.
+    인플루언서의 진행 중 캠페인 목록은 공유 피드 캐시에서 제공하며 ETag/304를 지원합니다.
+    지역을 지정하면 해당 지역과 하위 지역의 방문 캠페인만 조회합니다.
+    카테고리를 지정하면 하위 카테고리의 캠페인까지 함께 조회합니다.
     """
+    if (
+        current_user.user_type == UserType.INFLUENCER
+        and campaign_type is None
+        and region is None
+        and category_id is None
+        and status in (None, CampaignStatus.ACTIVE)
+    ):
+        etag, body = campaign_feed.page(db, order=order, skip=max(skip, 0), limit=max(limit, 0))
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+    
     query = db.query(Campaign)
     
     if current_user.user_type == UserType.BRAND:
@@ -82,6 +119,16 @@ def read_campaigns(
         query = query.filter(Campaign.status == status)
     if campaign_type:
         query = query.filter(Campaign.campaign_type == campaign_type)
+    if region:
+        matched = get_region_index().resolve(region)
+        if matched is None:
+            raise HTTPException(status_code=400, detail="알 수 없는 지역입니다.")
+        start, end = matched.code_range
+        query = query.join(CampaignLocation, CampaignLocation.campaign_id == Campaign.id).filter(
+            CampaignLocation.region_code.between(start, end)
+        )
+    if category_id is not None:
+        query = query.filter(Campaign.category_id.in_(sorted(category_tree.get(db).descendant_ids(category_id))))
     
     total = query.count()
     campaigns = query.offset(skip).limit(limit).all()
@@ -91,14 +138,83 @@ def read_campaigns(
         "items": campaigns
     }
 
+@router.get("/nearby", response_model=NearbyCampaignList)
+def read_nearby_campaigns(
+    *,
+    db: Session = Depends(get_db),
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(5.0, gt=0, le=100),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    기준 지점 반경 안의 진행 중 캠페인을 가까운 순으로 조회합니다. (지도 화면용)
+    """
+    rows = crud_campaign_location.search_nearby(
+        db, latitude=latitude, longitude=longitude, radius_km=radius_km, limit=limit
+    )
+    return NearbyCampaignList(
+        total=len(rows),
+        items=[
+            NearbyCampaign(
+                campaign_id=campaign.id,
+                title=campaign.title,
+                end_date=campaign.end_date,
+                distance_km=distance,
+                location=Location.from_orm(location)
+            )
+            for campaign, location, distance in rows
+        ]
+    )
+
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 def read_campaign(
+    request: Request,
     campaign_id: int,
     current_user: User = Depends(deps.get_current_active_user),
     db: Session = Depends(get_db),
 ) -> Any:
     """
     특정 캠페인의 정보를 조회합니다.
+    브랜드는 자기 캠페인만 볼 수 있으므로 브랜드의 응답은 사용자별로, 나머지는 공유로 캐시합니다.
+    """
+    key = response_cache.key(
+        request, user_id=current_user.id if current_user.user_type == UserType.BRAND else None
+    )
+    cached = response_cache.get(key)
+    if cached is None:
+        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        if not campaign:
+            raise HTTPException(
+                status_code=404,
+                detail="캠페인을 찾을 수 없습니다.",
+            )
+        
+        if current_user.user_type == UserType.BRAND and campaign.brand_id != current_user.id:
+            raise HTTPException(
+                status_code=403,
+                detail="해당 캠페인에 대한 접근 권한이 없습니다.",
+            )
+        
+        cached = response_cache.put(
+            key,
+            CampaignResponse.from_orm(campaign),
+            ttl=CAMPAIGN_CACHE_TTL,
+            tags=[f"campaign:{campaign_id}"],
+            updated_at=campaign.updated_at,
+        )
+    return cached.to_response(request)
+
+@router.get("/{campaign_id}/reviews/analytics", response_model=CampaignReviewAnalytics)
+def read_campaign_review_analytics(
+    campaign_id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    캠페인 리뷰 성과를 조회합니다. (상태별 건수, 조회수/반응 합계와 평균, 제출→완료 소요 시간)
+    집계 결과는 캠페인별로 캐시되며 리뷰 상태가 바뀌면 갱신됩니다.
     """
     campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
     if not campaign:
@@ -107,13 +223,13 @@ def read_campaign(
             detail="캠페인을 찾을 수 없습니다.",
         )
     
-    if current_user.user_type == UserType.BRAND and campaign.brand_id != current_user.id:
+    if current_user.user_type != UserType.ADMIN and campaign.user_id != current_user.id:
         raise HTTPException(
             status_code=403,
             detail="해당 캠페인에 대한 접근 권한이 없습니다.",
         )
     
-    return campaign
+    return review_analytics.get_campaign_summary(db, campaign_id=campaign_id)
 
 @router.put("/{campaign_id}", response_model=CampaignResponse)
 def update_campaign(
@@ -152,6 +268,8 @@ def update_campaign(
     db.add(campaign)
     db.commit()
     db.refresh(campaign)
+    campaign_feed.apply([campaign])
+    response_cache.invalidate(f"campaign:{campaign_id}")
     return campaign
 
 @router.delete("/{campaign_id}")
@@ -185,6 +303,8 @@ def delete_campaign(
     
     db.delete(campaign)
     db.commit()
+    campaign_feed.discard(campaign_id)
+    response_cache.invalidate(f"campaign:{campaign_id}")
     return {"message": "캠페인이 삭제되었습니다."}
 
 @router.post("/{campaign_id}/applications", response_model=CampaignApplicationResponse)
@@ -204,45 +324,34 @@ def create_campaign_application(
             detail="인플루언서만 캠페인에 신청할 수 있습니다.",
         )
     
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
+    admission, application = crud.campaign_application.admit(
+        db,
+        campaign_id=campaign_id,
+        user_id=current_user.id,
+        application_text=application_in.application_text
+    )
+    
+    if admission == AdmissionStatus.NOT_FOUND:
         raise HTTPException(
             status_code=404,
             detail="캠페인을 찾을 수 없습니다.",
         )
-    
-    if campaign.status != CampaignStatus.ACTIVE:
+    if admission == AdmissionStatus.NOT_ACTIVE:
         raise HTTPException(
             status_code=400,
             detail="활성화된 캠페인에만 신청할 수 있습니다.",
         )
-    
-    if campaign.current_applications >= campaign.max_applications:
+    if admission == AdmissionStatus.FULL:
         raise HTTPException(
             status_code=400,
             detail="신청 가능한 인원이 초과되었습니다.",
         )
-    
-    existing_application = db.query(CampaignApplication).filter(
-        CampaignApplication.campaign_id == campaign_id,
-        CampaignApplication.influencer_id == current_user.id
-    ).first()
-    
-    if existing_application:
+    if admission == AdmissionStatus.DUPLICATE:
         raise HTTPException(
             status_code=400,
             detail="이미 신청한 캠페인입니다.",
         )
     
-    application = CampaignApplication(
-        **application_in.dict(),
-        influencer_id=current_user.id,
-        status="pending"
-    )
-    db.add(application)
-    campaign.current_applications += 1
-    db.commit()
-    db.refresh(application)
     return application
 
 @router.get("/{campaign_id}/applications", response_model=CampaignApplicationList)
@@ -276,6 +385,167 @@ def read_campaign_applications(
         "items": applications
     }
 
+@router.get("/{campaign_id}/applications/export")
+def export_campaign_applications(
+    campaign_id: int,
+    format: ExportFormat = ExportFormat.NDJSON,
+    status: Optional[str] = None,
+    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    캠페인의 신청 목록 전체를 NDJSON 또는 CSV로 스트리밍합니다.
+    """
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(
+            status_code=404,
+            detail="캠페인을 찾을 수 없습니다.",
+        )
+    
+    if campaign.user_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 캠페인의 신청 목록을 내보낼 권한이 없습니다.",
+        )
+    
+    query = db.query(
+        CampaignApplication.id,
+        CampaignApplication.campaign_id,
+        CampaignApplication.user_id,
+        CampaignApplication.status,
+        CampaignApplication.application_text,
+        CampaignApplication.score,
+        CampaignApplication.waitlist_rank,
+        CampaignApplication.created_at,
+        CampaignApplication.updated_at,
+    ).filter(CampaignApplication.campaign_id == campaign_id)
+    
+    if status:
+        query = query.filter(CampaignApplication.status == status)
+    
+    return stream_export(
+        query.order_by(CampaignApplication.id), fmt=format, filename=f"campaign-{campaign_id}-applications"
+    )
+
+@router.put("/{campaign_id}/location", response_model=CampaignLocationResponse)
+def upsert_campaign_location(
+    *,
+    db: Session = Depends(get_db),
+    campaign_id: int,
+    location_in: Location,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    캠페인 방문 장소를 등록하거나 수정합니다.
+    """
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(
+            status_code=404,
+            detail="캠페인을 찾을 수 없습니다.",
+        )
+    
+    if campaign.user_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 캠페인을 수정할 권한이 없습니다.",
+        )
+    
+    return crud_campaign_location.upsert(db, campaign_id=campaign_id, obj_in=location_in)
+
+@router.put("/{campaign_id}/schedule", response_model=CampaignScheduleResponse)
+def upsert_campaign_schedule(
+    *,
+    db: Session = Depends(get_db),
+    campaign_id: int,
+    schedule_in: CampaignScheduleIn,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    캠페인 일정을 등록하거나 수정합니다.
+    등록된 날짜에 맞춰 스케줄러가 활성화/선정/완료 전환을 실행합니다.
+    """
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(
+            status_code=404,
+            detail="캠페인을 찾을 수 없습니다.",
+        )
+    
+    if campaign.user_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 캠페인을 수정할 권한이 없습니다.",
+        )
+    
+    if not (
+        schedule_in.application_start_date
+        <= schedule_in.application_end_date
+        <= schedule_in.influencer_announcement_date
+        <= schedule_in.result_announcement_date
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="신청 시작일 ≤ 신청 종료일 ≤ 인플루언서 발표일 ≤ 결과 발표일 순서여야 합니다.",
+        )
+    
+    schedule = db.query(CampaignSchedule).filter(CampaignSchedule.campaign_id == campaign_id).first()
+    if schedule and schedule.selected_at:
+        raise HTTPException(
+            status_code=400,
+            detail="선정이 완료된 캠페인의 일정은 수정할 수 없습니다.",
+        )
+    if schedule is None:
+        schedule = CampaignSchedule(campaign_id=campaign_id)
+    for field, value in schedule_in.dict().items():
+        setattr(schedule, field, value)
+    
+    db.add(schedule)
+    db.commit()
+    db.refresh(schedule)
+    lifecycle_scheduler.notify(campaign_id)
+    return schedule
+
+@router.post("/{campaign_id}/selection", response_model=CampaignSelectionResult)
+def run_campaign_selection(
+    *,
+    db: Session = Depends(get_db),
+    campaign_id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    대기 중인 신청자 전체를 점수화해 선정/대기/탈락을 한 번에 처리합니다.
+    발표일에는 주기 작업(app.core.campaign_selection)이 자동으로 실행합니다.
+    """
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(
+            status_code=404,
+            detail="캠페인을 찾을 수 없습니다.",
+        )
+    
+    if campaign.user_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 캠페인의 신청자를 선정할 권한이 없습니다.",
+        )
+    
+    if not db.query(CampaignSchedule.id).filter(CampaignSchedule.campaign_id == campaign_id).first():
+        raise HTTPException(
+            status_code=404,
+            detail="캠페인 일정이 등록되지 않았습니다.",
+        )
+    
+    result = run_selection(db, campaign_id=campaign_id)
+    if result is None:
+        raise HTTPException(
+            status_code=400,
+            detail="이미 선정이 완료된 캠페인입니다.",
+        )
+    
+    return result
+
 @router.put("/applications/{application_id}", response_model=CampaignApplicationResponse)
 def update_campaign_application(
     *,
@@ -304,6 +574,14 @@ def update_campaign_application(
         )
     
     update_data = application_in.dict(exclude_unset=True)
+    status = update_data.pop("status", None)
+    if status is not None and status != application.status:
+        if not crud.campaign_application.change_status(db, application=application, status=status):
+            db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="신청 상태가 이미 변경되었습니다. 다시 조회해 주세요.",
+            )
     for field, value in update_data.items():
         setattr(application, field, value)
     
@@ -1,14 +1,19 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.models.user import User, UserType
 from app.models.category import Category
-from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
+from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoryTreeNode
+from app.core.category_tree import category_tree
+from app.core.responses import etag_matches
+from app.core.response_cache import response_cache
 from app.db.database import get_db
 
 router = APIRouter()
 
+CATEGORY_CACHE_TTL = 300
+
 @router.post("/", response_model=CategoryResponse)
 def create_category(
     *,
@@ -22,14 +27,20 @@ def create_category(
     if current_user.user_type != UserType.ADMIN:
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
     
+    if category_in.parent_id is not None and category_in.parent_id not in category_tree.get(db):
+        raise HTTPException(status_code=400, detail="상위 카테고리를 찾을 수 없습니다.")
+    
     category = Category(**category_in.dict())
     db.add(category)
     db.commit()
     db.refresh(category)
+    category_tree.invalidate()
+    response_cache.invalidate("categories")
     return category
 
 @router.get("/", response_model=List[CategoryResponse])
 def read_categories(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
@@ -37,21 +48,57 @@ def read_categories(
     """
     카테고리 목록을 조회합니다.
     """
-    categories = db.query(Category).filter(Category.is_active == True).offset(skip).limit(limit).all()
-    return categories
+    key = response_cache.key(request)
+    cached = response_cache.get(key)
+    if cached is None:
+        categories = db.query(Category).filter(Category.is_active == True).offset(skip).limit(limit).all()
+        cached = response_cache.put(
+            key,
+            [CategoryResponse.from_orm(category) for category in categories],
+            ttl=CATEGORY_CACHE_TTL,
+            tags=["categories"],
+            public=True,
+        )
+    return cached.to_response(request)
+
+@router.get("/tree", response_model=List[CategoryTreeNode])
+def read_category_tree(
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    활성 카테고리 전체를 트리로 조회합니다.
+    메모리의 트리 스냅샷에서 미리 직렬화된 본문을 그대로 보내며 ETag/304를 지원합니다.
+    """
+    tree = category_tree.get(db)
+    headers = {"ETag": tree.etag, "Cache-Control": "public, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), tree.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=tree.body, media_type="application/json", headers=headers)
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 def read_category(
+    request: Request,
     category_id: int,
     db: Session = Depends(get_db),
 ) -> Any:
     """
     특정 카테고리를 조회합니다.
     """
-    category = db.query(Category).filter(Category.id == category_id).first()
-    if not category:
-        raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다.")
-    return category
+    key = response_cache.key(request)
+    cached = response_cache.get(key)
+    if cached is None:
+        category = db.query(Category).filter(Category.id == category_id).first()
+        if not category:
+            raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다.")
+        cached = response_cache.put(
+            key,
+            CategoryResponse.from_orm(category),
+            ttl=CATEGORY_CACHE_TTL,
+            tags=["categories"],
+            public=True,
+        )
+    return cached.to_response(request)
 
 @router.put("/{category_id}", response_model=CategoryResponse)
 def update_category(
@@ -71,12 +118,22 @@ def update_category(
     if not category:
         raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다.")
     
-    for field, value in category_in.dict(exclude_unset=True).items():
+    update_data = category_in.dict(exclude_unset=True)
+    parent_id = update_data.get("parent_id")
+    if parent_id is not None:
+        tree = category_tree.get(db)
+        # 자기 자신이나 하위 카테고리 밑으로 옮기면 순환이 생깁니다.
+        if parent_id not in tree or parent_id in tree.descendant_ids(category_id):
+            raise HTTPException(status_code=400, detail="상위 카테고리로 지정할 수 없습니다.")
+    
+    for field, value in update_data.items():
         setattr(category, field, value)
     
     db.add(category)
     db.commit()
     db.refresh(category)
+    category_tree.invalidate()
+    response_cache.invalidate("categories")
     return category
 
 @router.delete("/{category_id}")
@@ -99,4 +156,6 @@ def delete_category(
     category.is_active = False
     db.add(category)
     db.commit()
+    category_tree.invalidate()
+    response_cache.invalidate("categories")
     return {"message": "카테고리가 삭제되었습니다."} 
\ No newline at end of file
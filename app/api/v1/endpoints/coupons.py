@@ -1,15 +1,17 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.models.user import User, UserType
 from app.models.coupon import Coupon, CouponStatus, CouponType
+from app.models.campaign import Campaign
 from app.schemas.coupon import (
     CouponCreate, CouponUpdate, CouponResponse, CouponUse,
     CouponBatchCreate, CouponStats
 )
 from app.db.database import get_db
+from app.core.export import ExportFormat, stream_export
 import random
 import string
 
@@ -57,6 +59,47 @@ def read_coupons(
         coupons = db.query(Coupon).filter(Coupon.user_id == current_user.id).offset(skip).limit(limit).all()
     return coupons
 
+@router.get("/export")
+def export_coupons(
+    *,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    format: ExportFormat = ExportFormat.NDJSON,
+    campaign_id: Optional[int] = None,
+    status: Optional[CouponStatus] = None,
+) -> Any:
+    """
+    쿠폰 전체를 NDJSON 또는 CSV로 스트리밍합니다. (브랜드는 자신의 캠페인 쿠폰, 관리자는 전체)
+    """
+    if current_user.user_type not in (UserType.BRAND, UserType.ADMIN):
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    
+    query = db.query(
+        Coupon.id,
+        Coupon.code,
+        Coupon.type,
+        Coupon.value,
+        Coupon.min_purchase_amount,
+        Coupon.max_discount_amount,
+        Coupon.start_date,
+        Coupon.end_date,
+        Coupon.status,
+        Coupon.user_id,
+        Coupon.campaign_id,
+        Coupon.used_at,
+    )
+    
+    if current_user.user_type == UserType.BRAND:
+        query = query.filter(
+            Coupon.campaign_id.in_(db.query(Campaign.id).filter(Campaign.user_id == current_user.id))
+        )
+    if campaign_id:
+        query = query.filter(Coupon.campaign_id == campaign_id)
+    if status:
+        query = query.filter(Coupon.status == status)
+    
+    return stream_export(query.order_by(Coupon.id), fmt=format, filename="coupons")
+
 @router.post("/use", response_model=CouponResponse)
 def use_coupon(
     *,
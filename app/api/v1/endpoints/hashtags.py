@@ -0,0 +1,64 @@
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.models.user import User, UserType
+from app.schemas.hashtag import HashtagTrendItem, HashtagTrendList
+from app.crud.crud_hashtag import hashtag as crud_hashtag
+from app.core.hashtag_trends import TRENDING_WINDOWS
+from app.db.database import get_db
+
+router = APIRouter()
+
+@router.get("/trending", response_model=HashtagTrendList)
+def read_trending_hashtags(
+    *,
+    db: Session = Depends(get_db),
+    window_days: int = 7,
+    limit: int = Query(20, ge=1, le=100)
+) -> Any:
+    """
+    최근 window_days일 인기 해시태그를 조회합니다.
+    순위는 주기 작업(app.core.hashtag_trends)이 미리 계산해 둔 테이블에서 읽습니다.
+    """
+    if window_days not in TRENDING_WINDOWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"조회 구간은 {', '.join(map(str, TRENDING_WINDOWS))}일 중 하나여야 합니다.",
+        )
+    
+    rows = crud_hashtag.get_trending(db, window_days=window_days, limit=limit)
+    return HashtagTrendList(
+        window_days=window_days,
+        computed_at=rows[0][0].computed_at if rows else None,
+        items=[
+            HashtagTrendItem(
+                rank=trend.rank,
+                name=tag.tag_name,
+                usage_count=trend.usage_count,
+                total_usage_count=tag.usage_count
+            )
+            for trend, tag in rows
+        ]
+    )
+
+@router.post("/trending/rebuild", response_model=HashtagTrendList)
+def rebuild_trending_hashtags(
+    *,
+    db: Session = Depends(get_db),
+    window_days: int = 7,
+    current_user: User = Depends(deps.get_current_active_user)
+) -> Any:
+    """
+    인기 해시태그 순위를 즉시 다시 계산합니다. (관리자 전용)
+    """
+    if current_user.user_type != UserType.ADMIN:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    if window_days not in TRENDING_WINDOWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"조회 구간은 {', '.join(map(str, TRENDING_WINDOWS))}일 중 하나여야 합니다.",
+        )
+    
+    crud_hashtag.rebuild_trends(db, window_days=window_days)
+    return read_trending_hashtags(db=db, window_days=window_days, limit=100)
@@ -1,13 +1,22 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from app import crud, models, schemas
+from app import models, schemas
 from app.api import deps
 from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.core.responses import model_list_response
 from app.core.security import get_current_active_user
+from app.crud.crud_influencer import (
+    influencer as crud_influencer,
+    influencer_platform as crud_influencer_platform,
+    influencer_stats as crud_influencer_stats,
+)
 
 router = APIRouter()
 
+INFLUENCER_CACHE_TTL = 120
+
 @router.post("/", response_model=schemas.InfluencerResponse)
 def create_influencer(
     *,
@@ -24,7 +33,7 @@ def create_influencer(
             detail="인플루언서만 프로필을 생성할 수 있습니다.",
         )
     
-    influencer = crud.influencer.get_by_user_id(db, user_id=current_user.id)
+    influencer = crud_influencer.get_by_user_id(db, user_id=current_user.id)
     if influencer:
         raise HTTPException(
             status_code=400,
@@ -32,7 +41,7 @@ def create_influencer(
         )
     
     influencer_in.user_id = current_user.id
-    influencer = crud.influencer.create(db, obj_in=influencer_in)
+    influencer = crud_influencer.create(db, obj_in=influencer_in)
     return influencer
 
 @router.get("/", response_model=List[schemas.InfluencerResponse])
@@ -45,8 +54,8 @@ def read_influencers(
     """
     인플루언서 목록을 조회합니다.
     """
-    influencers = crud.influencer.get_multi(db, skip=skip, limit=limit)
-    return influencers
+    influencers = crud_influencer.get_multi(db, skip=skip, limit=limit)
+    return model_list_response(schemas.InfluencerResponse, influencers)
 
 @router.get("/me", response_model=schemas.InfluencerResponse)
 def read_influencer_me(
@@ -62,7 +71,7 @@ def read_influencer_me(
             detail="인플루언서만 프로필을 조회할 수 있습니다.",
         )
     
-    influencer = crud.influencer.get_by_user_id(db, user_id=current_user.id)
+    influencer = crud_influencer.get_by_user_id(db, user_id=current_user.id)
     if not influencer:
         raise HTTPException(
             status_code=404,
@@ -86,14 +95,15 @@ def update_influencer_me(
             detail="인플루언서만 프로필을 업데이트할 수 있습니다.",
         )
     
-    influencer = crud.influencer.get_by_user_id(db, user_id=current_user.id)
+    influencer = crud_influencer.get_by_user_id(db, user_id=current_user.id)
     if not influencer:
         raise HTTPException(
             status_code=404,
             detail="인플루언서 프로필이 존재하지 않습니다.",
         )
     
-    influencer = crud.influencer.update(db, db_obj=influencer, obj_in=influencer_in)
+    influencer = crud_influencer.update(db, db_obj=influencer, obj_in=influencer_in)
+    response_cache.invalidate(f"influencer:{influencer.id}")
     return influencer
 
 @router.delete("/me")
@@ -110,14 +120,15 @@ def delete_influencer_me(
             detail="인플루언서만 프로필을 삭제할 수 있습니다.",
         )
     
-    influencer = crud.influencer.get_by_user_id(db, user_id=current_user.id)
+    influencer = crud_influencer.get_by_user_id(db, user_id=current_user.id)
     if not influencer:
         raise HTTPException(
             status_code=404,
             detail="인플루언서 프로필이 존재하지 않습니다.",
         )
     
-    influencer = crud.influencer.remove(db, id=influencer.id)
+    influencer = crud_influencer.remove(db, id=influencer.id)
+    response_cache.invalidate(f"influencer:{influencer.id}")
     return {"ok": True}
 
 @router.get("/search", response_model=List[schemas.InfluencerResponse])
@@ -151,14 +162,15 @@ def search_influencers(
     if max_engagement_rate is not None:
         filters["max_engagement_rate"] = max_engagement_rate
     
-    influencers = crud.influencer.get_multi_by_filters(
+    influencers = crud_influencer.get_multi_by_filters(
         db, filters=filters, skip=skip, limit=limit
     )
-    return influencers
+    return model_list_response(schemas.InfluencerResponse, influencers)
 
 @router.get("/{influencer_id}", response_model=schemas.InfluencerResponse)
 def read_influencer(
     *,
+    request: Request,
     db: Session = Depends(deps.get_db),
     influencer_id: int,
     current_user: models.User = Depends(deps.get_current_active_user),
@@ -166,13 +178,23 @@ def read_influencer(
     """
     특정 인플루언서의 프로필을 조회합니다.
     """
-    influencer = crud.influencer.get(db, id=influencer_id)
-    if not influencer:
-        raise HTTPException(
-            status_code=404,
-            detail="인플루언서 프로필이 존재하지 않습니다.",
+    key = response_cache.key(request)
+    cached = response_cache.get(key)
+    if cached is None:
+        influencer = crud_influencer.get(db, id=influencer_id)
+        if not influencer:
+            raise HTTPException(
+                status_code=404,
+                detail="인플루언서 프로필이 존재하지 않습니다.",
+            )
+        # 통계/플랫폼이 함께 담기므로 ETag는 본문 해시로 만듭니다.
+        cached = response_cache.put(
+            key,
+            schemas.InfluencerResponse.from_orm(influencer),
+            ttl=INFLUENCER_CACHE_TTL,
+            tags=[f"influencer:{influencer_id}"],
         )
-    return influencer
+    return cached.to_response(request)
 
 # 인플루언서 통계 관련 엔드포인트
 @router.get("/{influencer_id}/stats", response_model=schemas.InfluencerStats)
@@ -184,7 +206,7 @@ def read_influencer_stats(
     """
     특정 인플루언서의 통계 정보를 조회합니다.
     """
-    stats = crud.influencer_stats.get_by_influencer_id(db, influencer_id=influencer_id)
+    stats = crud_influencer_stats.get_by_influencer_id(db, influencer_id=influencer_id)
     if not stats:
         raise HTTPException(
             status_code=404,
@@ -203,13 +225,14 @@ def update_influencer_stats(
     """
     특정 인플루언서의 통계 정보를 수정합니다.
     """
-    stats = crud.influencer_stats.get_by_influencer_id(db, influencer_id=influencer_id)
+    stats = crud_influencer_stats.get_by_influencer_id(db, influencer_id=influencer_id)
     if not stats:
         raise HTTPException(
             status_code=404,
             detail="통계 정보를 찾을 수 없습니다.",
         )
-    stats = crud.influencer_stats.update(db, db_obj=stats, obj_in=stats_in)
+    stats = crud_influencer_stats.update(db, db_obj=stats, obj_in=stats_in)
+    response_cache.invalidate(f"influencer:{influencer_id}")
     return stats
 
 # 인플루언서 플랫폼 관련 엔드포인트
@@ -222,7 +245,7 @@ def read_influencer_platforms(
     """
     특정 인플루언서의 플랫폼 정보를 조회합니다.
     """
-    platforms = crud.influencer_platform.get_by_influencer_id(db, influencer_id=influencer_id)
+    platforms = crud_influencer_platform.get_by_influencer_id(db, influencer_id=influencer_id)
     return platforms
 
 @router.post("/{influencer_id}/platforms", response_model=schemas.InfluencerPlatform)
@@ -236,7 +259,8 @@ def create_influencer_platform(
     """
     특정 인플루언서의 새로운 플랫폼 정보를 생성합니다.
     """
-    platform = crud.influencer_platform.create(db, obj_in=platform_in)
+    platform = crud_influencer_platform.create(db, obj_in=platform_in)
+    response_cache.invalidate(f"influencer:{influencer_id}")
     return platform
 
 @router.put("/{influencer_id}/platforms/{platform_id}", response_model=schemas.InfluencerPlatform)
@@ -251,11 +275,12 @@ def update_influencer_platform(
     """
     특정 인플루언서의 플랫폼 정보를 수정합니다.
     """
-    platform = crud.influencer_platform.get(db, id=platform_id)
+    platform = crud_influencer_platform.get(db, id=platform_id)
     if not platform:
         raise HTTPException(
             status_code=404,
             detail="플랫폼 정보를 찾을 수 없습니다.",
         )
-    platform = crud.influencer_platform.update(db, db_obj=platform, obj_in=platform_in)
+    platform = crud_influencer_platform.update(db, db_obj=platform, obj_in=platform_in)
+    response_cache.invalidate(f"influencer:{influencer_id}")
     return platform 
\ No newline at end of file
@@ -0,0 +1,41 @@
+from typing import Any
+import os
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import RedirectResponse
+from app.core.config import settings
+from app.core.responses import MediaFileResponse
+from app.core.storage import get_storage
+from app.core.uploads import content_type_for_key, is_public_media_key
+
+router = APIRouter()
+
+@router.api_route("/{key:path}", methods=["GET", "HEAD"], include_in_schema=False)
+def read_media(key: str, request: Request) -> Any:
+    """
+    업로드된 미디어 파일을 제공합니다.
+    키가 내용 해시이므로 ETag는 해시로 만들고 브라우저/CDN에 1년간 캐시됩니다.
+    공개 네임스페이스의 키만 제공하며, Content-Type은 업로드 때 내용으로 판별해 키에 남긴 형식을 씁니다.
+    """
+    if not is_public_media_key(key):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    storage = get_storage()
+    path = storage.local_path(key)
+    if path is None:
+        if settings.MEDIA_PUBLIC_BASE_URL:
+            return RedirectResponse(f"{settings.MEDIA_PUBLIC_BASE_URL.rstrip('/')}/{key}", status_code=307)
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    content_hash = os.path.splitext(os.path.basename(path))[0]
+    accel_redirect = None
+    if settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+        accel_redirect = f"{settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{key}"
+    
+    return MediaFileResponse(
+        path,
+        etag=f'"{content_hash}"',
+        media_type=content_type_for_key(key),
+        request_headers=request.headers,
+        accel_redirect=accel_redirect,
+    )
@@ -24,6 +24,7 @@ from app.db.database import get_db
 from datetime import datetime
 import httpx
 from app.core.config import settings
+from app.core.export import ExportFormat, stream_export
 import logging
 from app import crud, schemas
 from app.core.security import get_current_active_user
@@ -218,6 +219,49 @@ def read_payments(
         "items": payments
     }
 
+@router.get("/export")
+def export_payments(
+    db: Session = Depends(get_db),
+    format: ExportFormat = ExportFormat.NDJSON,
+    status: Optional[PaymentStatus] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    결제 내역 전체를 NDJSON 또는 CSV로 스트리밍합니다. (브랜드는 자신의 결제, 관리자는 전체)
+    """
+    if current_user.user_type not in (UserType.BRAND, UserType.ADMIN):
+        raise HTTPException(
+            status_code=403,
+            detail="결제 내역을 내보낼 권한이 없습니다.",
+        )
+    
+    query = db.query(
+        Payment.id,
+        Payment.campaign_application_id,
+        Payment.brand_id,
+        Payment.influencer_id,
+        Payment.amount,
+        Payment.status,
+        Payment.transaction_id,
+        Payment.payment_date,
+        Payment.refund_date,
+        Payment.created_at,
+        Payment.updated_at,
+    )
+    
+    if current_user.user_type == UserType.BRAND:
+        query = query.filter(Payment.brand_id == current_user.id)
+    if status:
+        query = query.filter(Payment.status == status)
+    if created_from:
+        query = query.filter(Payment.created_at >= created_from)
+    if created_to:
+        query = query.filter(Payment.created_at < created_to)
+    
+    return stream_export(query.order_by(Payment.id), fmt=format, filename="payments")
+
 @router.get("/{payment_id}", response_model=PaymentResponse)
 def read_payment(
     payment_id: int,
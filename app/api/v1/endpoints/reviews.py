@@ -1,10 +1,12 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, BackgroundTasks
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.models.user import User, UserType
-from app.models.review import ReviewContent, ReviewImage, ReviewStatus
-from app.models.campaign import CampaignApplication
+from app.models.review import ReviewContent, ReviewImage, ReviewMetricSnapshot, ReviewStatus
+from app.models.campaign import Campaign, CampaignApplication
 from app.models.point import Point, PointType
 from app.schemas.review import (
     ReviewContentCreate,
@@ -16,14 +18,28 @@ from app.schemas.review import (
     ReviewImageResponse,
     ReviewImageList,
     ReviewStats,
+    ReviewMetricSnapshotResponse,
+    ReviewSearchHit,
+    ReviewSearchResult,
     ReviewCreate,
     ReviewUpdate,
-    ReviewResponse
+    ReviewResponse,
+    ReviewModerationAction,
+    ReviewModerationRequest,
+    ReviewModerationItemResult,
+    ReviewModerationResult
 )
 from app.db.database import get_db
-from datetime import datetime
-import aiofiles
-import os
+from app.core.config import settings
+from app.core.uploads import save_upload
+from app.core.images import process_review_image
+from app.core.review_metrics import engagement_rate
+from app.core import search
+from app.core.responses import model_list_response
+from app.core.export import ExportFormat, stream_export
+from app.crud.crud_review_analytics import review_analytics
+from app.crud.crud_hashtag import hashtag as crud_hashtag
+from datetime import datetime, timedelta
 
 router = APIRouter()
 
@@ -46,6 +62,8 @@ def create_review(
         status=ReviewStatus.DRAFT
     )
     db.add(review)
+    db.flush()
+    crud_hashtag.sync_review(db, review=review)
     db.commit()
     db.refresh(review)
     return review
@@ -71,9 +89,13 @@ def update_review(
     if review.status not in [ReviewStatus.DRAFT, ReviewStatus.REJECTED]:
         raise HTTPException(status_code=400, detail="초안 또는 거절된 상태의 리뷰만 수정할 수 있습니다.")
     
-    for field, value in review_in.dict(exclude_unset=True).items():
+    update_data = review_in.dict(exclude_unset=True)
+    for field, value in update_data.items():
         setattr(review, field, value)
     
+    # 제목/본문/태그가 바뀐 경우에만 해시태그 연결과 사용 횟수를 갱신
+    if update_data.keys() & {"title", "content", "hashtags"}:
+        crud_hashtag.sync_review(db, review=review)
     db.add(review)
     db.commit()
     db.refresh(review)
@@ -103,6 +125,7 @@ def submit_review(
     review.submission_date = datetime.utcnow()
     db.add(review)
     db.commit()
+    review_analytics.invalidate(review.campaign_id)
     db.refresh(review)
     return review
 
@@ -139,11 +162,12 @@ def approve_review(
         description=f"리뷰 승인 보상: {campaign.title}",
         campaign_id=campaign.id,
         review_id=review.id,
-        expires_at=datetime.utcnow().replace(year=datetime.utcnow().year + 1)  # 1년 후 만료
+        expires_at=datetime.utcnow() + timedelta(days=365)  # 1년 후 만료
     )
     db.add(point)
     
     db.commit()
+    review_analytics.invalidate(review.campaign_id)
     db.refresh(review)
     return review
 
@@ -175,9 +199,110 @@ def reject_review(
     review.required_modifications = required_modifications
     db.add(review)
     db.commit()
+    review_analytics.invalidate(review.campaign_id)
     db.refresh(review)
     return review
 
+@router.post("/moderation", response_model=ReviewModerationResult)
+def moderate_reviews(
+    *,
+    db: Session = Depends(get_db),
+    moderation_in: ReviewModerationRequest,
+    current_user: User = Depends(deps.get_current_active_user)
+) -> Any:
+    """
+    여러 리뷰를 한 번에 승인/거절합니다. (관리자 또는 브랜드 전용)
+    리뷰와 캠페인은 한 번의 쿼리로 조회하고, 상태 변경과 포인트 적립은
+    벌크 UPDATE/INSERT로 하나의 트랜잭션에서 처리합니다. 항목별 결과를 반환합니다.
+    """
+    if current_user.user_type not in [UserType.ADMIN, UserType.BRAND]:
+        raise HTTPException(status_code=403, detail="리뷰를 검수할 권한이 없습니다.")
+    
+    # 같은 리뷰가 여러 번 들어오면 마지막 요청만 처리
+    requested = {item.review_id: item for item in moderation_in.items}
+    rows = db.query(ReviewContent, Campaign).join(
+        Campaign, ReviewContent.campaign_id == Campaign.id
+    ).filter(
+        ReviewContent.id.in_(list(requested))
+    ).with_for_update(of=ReviewContent).all()
+    found = {review.id: (review, campaign) for review, campaign in rows}
+    
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=365)  # 1년 후 만료
+    review_updates = []
+    points = []
+    results = []
+    
+    for review_id, item in requested.items():
+        def fail(detail: str) -> None:
+            results.append(ReviewModerationItemResult(
+                review_id=review_id, action=item.action, success=False, detail=detail
+            ))
+        
+        if review_id not in found:
+            fail("리뷰를 찾을 수 없습니다.")
+            continue
+        review, campaign = found[review_id]
+        if current_user.user_type != UserType.ADMIN and campaign.user_id != current_user.id:
+            fail("리뷰를 검수할 권한이 없습니다.")
+            continue
+        if review.status != ReviewStatus.SUBMITTED:
+            fail("제출된 상태의 리뷰만 검수할 수 있습니다.")
+            continue
+        
+        if item.action == ReviewModerationAction.APPROVE:
+            status = ReviewStatus.APPROVED
+            review_updates.append({
+                "id": review_id,
+                "status": status,
+                "approval_date": now,
+                "updated_at": now,
+            })
+            points.append({
+                "user_id": review.influencer_id,
+                "amount": campaign.reward_amount,
+                "type": PointType.EARN,
+                "description": f"리뷰 승인 보상: {campaign.title}",
+                "campaign_id": campaign.id,
+                "review_id": review_id,
+                "expires_at": expires_at,
+                "created_at": now,
+            })
+        else:
+            if not item.rejection_reason:
+                fail("거절 사유를 입력해야 합니다.")
+                continue
+            status = ReviewStatus.REJECTED
+            review_updates.append({
+                "id": review_id,
+                "status": status,
+                "rejection_reason": item.rejection_reason,
+                "required_modifications": item.required_modifications,
+                "updated_at": now,
+            })
+        results.append(ReviewModerationItemResult(
+            review_id=review_id, action=item.action, success=True, status=status
+        ))
+    
+    try:
+        if review_updates:
+            db.execute(update(ReviewContent), review_updates)
+        if points:
+            db.execute(insert(Point), points)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    review_analytics.invalidate(*{found[row["id"]][1].id for row in review_updates})
+    
+    succeeded = len(review_updates)
+    return ReviewModerationResult(
+        processed=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
+
 @router.post("/{review_id}/complete", response_model=ReviewResponse)
 def complete_review(
     *,
@@ -204,12 +329,15 @@ def complete_review(
     
     review.status = ReviewStatus.COMPLETED
     review.platform_url = platform_url
+    review.post_url = platform_url  # 지표 갱신 작업이 이 주소로 반응 지표를 다시 가져옵니다.
     review.views = views
     review.likes = likes
     review.comments = comments
+    review.engagement_rate = engagement_rate(views, likes, comments, review.shares or 0)
     review.completion_date = datetime.utcnow()
     db.add(review)
     db.commit()
+    review_analytics.invalidate(review.campaign_id)
     db.refresh(review)
     return review
 
@@ -239,7 +367,114 @@ def read_reviews(
         query = query.filter(ReviewContent.status == status)
     
     reviews = query.order_by(ReviewContent.id.desc()).offset(skip).limit(limit).all()
-    return reviews
+    return model_list_response(ReviewResponse, reviews)
+
+@router.get("/search", response_model=ReviewSearchResult)
+def search_reviews(
+    *,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    q: str = Query(..., min_length=1, max_length=100),
+    campaign_id: Optional[int] = None,
+    status: Optional[ReviewStatus] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
+) -> Any:
+    """
+    리뷰 제목/본문을 전문 검색합니다.
+    MySQL FULLTEXT(ngram) 색인을 사용하므로 생성/수정 시 색인이 자동으로 갱신되며,
+    관련도 점수 순으로 정렬하고 검색어 주변 발췌문을 함께 반환합니다.
+    """
+    terms = search.tokenize(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail=f"검색어는 {search.MIN_TERM_LENGTH}글자 이상이어야 합니다.")
+    
+    score = match(ReviewContent.title, ReviewContent.content, against=search.boolean_query(terms)).in_boolean_mode()
+    query = db.query(ReviewContent).filter(score > 0)
+    
+    if current_user.user_type == UserType.INFLUENCER:
+        query = query.filter(ReviewContent.influencer_id == current_user.id)
+    elif current_user.user_type == UserType.BRAND:
+        query = query.join(Campaign, ReviewContent.campaign_id == Campaign.id).filter(Campaign.user_id == current_user.id)
+    
+    if campaign_id:
+        query = query.filter(ReviewContent.campaign_id == campaign_id)
+    if status:
+        query = query.filter(ReviewContent.status == status)
+    
+    total = query.count()
+    rows = query.add_columns(score.label("score")).order_by(
+        score.desc(), ReviewContent.id.desc()
+    ).offset(skip).limit(limit).all()
+    
+    return ReviewSearchResult(
+        query=q,
+        terms=terms,
+        total=total,
+        items=[
+            ReviewSearchHit(
+                id=review.id,
+                campaign_id=review.campaign_id,
+                influencer_id=review.influencer_id,
+                title=review.title,
+                snippet=search.make_snippet(review.content, terms),
+                status=review.status,
+                score=round(float(row_score or 0), 4)
+            )
+            for review, row_score in rows
+        ]
+    )
+
+@router.get("/export")
+def export_reviews(
+    *,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    format: ExportFormat = ExportFormat.NDJSON,
+    campaign_id: int = None,
+    status: ReviewStatus = None
+) -> Any:
+    """
+    리뷰 전체를 NDJSON 또는 CSV로 스트리밍합니다. (브랜드는 자신의 캠페인 리뷰, 관리자는 전체)
+    """
+    if current_user.user_type not in (UserType.BRAND, UserType.ADMIN):
+        raise HTTPException(status_code=403, detail="리뷰를 내보낼 권한이 없습니다.")
+    
+    query = db.query(
+        ReviewContent.id,
+        ReviewContent.campaign_id,
+        ReviewContent.campaign_application_id,
+        ReviewContent.influencer_id,
+        ReviewContent.title,
+        ReviewContent.content,
+        ReviewContent.rating,
+        ReviewContent.hashtags,
+        ReviewContent.platform,
+        ReviewContent.post_url,
+        ReviewContent.views,
+        ReviewContent.likes,
+        ReviewContent.comments,
+        ReviewContent.shares,
+        ReviewContent.engagement_rate,
+        ReviewContent.status,
+        ReviewContent.submission_date,
+        ReviewContent.approval_date,
+        ReviewContent.completion_date,
+        ReviewContent.brand_rating,
+        ReviewContent.created_at,
+        ReviewContent.updated_at,
+    )
+    
+    if current_user.user_type == UserType.BRAND:
+        query = query.filter(
+            ReviewContent.campaign_id.in_(db.query(Campaign.id).filter(Campaign.user_id == current_user.id))
+        )
+    if campaign_id:
+        query = query.filter(ReviewContent.campaign_id == campaign_id)
+    if status:
+        query = query.filter(ReviewContent.status == status)
+    
+    return stream_export(query.order_by(ReviewContent.id), fmt=format, filename="reviews")
 
 @router.get("/{review_id}", response_model=ReviewResponse)
 def read_review(
@@ -300,6 +535,7 @@ def create_review_feedback(
     
     db.add(review)
     db.commit()
+    review_analytics.invalidate(review.campaign_id)
     db.refresh(review)
     return review
 
@@ -310,10 +546,12 @@ async def upload_review_image(
     review_id: int,
     file: UploadFile = File(...),
     caption: Optional[str] = None,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     리뷰 이미지를 업로드합니다.
+    썸네일/웹용 변형은 응답 이후 백그라운드에서 생성됩니다.
     """
     review = db.query(ReviewContent).filter(ReviewContent.id == review_id).first()
     if not review:
@@ -328,30 +566,61 @@ async def upload_review_image(
             detail="해당 리뷰에 이미지를 업로드할 권한이 없습니다.",
         )
     
-    # 이미지 저장 로직
-    upload_dir = "uploads/reviews"
-    os.makedirs(upload_dir, exist_ok=True)
-    
-    file_extension = os.path.splitext(file.filename)[1]
-    file_name = f"{review_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{file_extension}"
-    file_path = os.path.join(upload_dir, file_name)
-    
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await file.read()
-        await out_file.write(content)
+    # 이미지 저장 로직 (청크 단위 스트리밍, 내용 주소 저장소)
+    stored = await save_upload(
+        file,
+        "reviews",
+        allowed_types=settings.REVIEW_IMAGE_TYPES,
+    )
     
     # 이미지 정보 저장
     image = ReviewImage(
         review_content_id=review_id,
-        image_url=file_path,
+        image_url=stored.url,
+        storage_key=stored.key,
         caption=caption,
-        order=len(review.images)
+        order=len(review.images),
+        content_hash=stored.sha256,
+        content_type=stored.content_type,
+        file_size=stored.size,
+        variants_status="pending"
     )
     db.add(image)
     db.commit()
     db.refresh(image)
+    
+    background_tasks.add_task(process_review_image, image.id, stored.key, stored.sha256)
     return image
 
+@router.get("/{review_id}/images", response_model=ReviewImageList)
+def read_review_images(
+    review_id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    리뷰 이미지 목록을 조회합니다. 갤러리에서는 thumbnail_url을 사용합니다.
+    """
+    review = db.query(ReviewContent).filter(ReviewContent.id == review_id).first()
+    if not review:
+        raise HTTPException(
+            status_code=404,
+            detail="리뷰를 찾을 수 없습니다.",
+        )
+    
+    if (current_user.user_type == UserType.INFLUENCER and review.influencer_id != current_user.id) or \
+       (current_user.user_type == UserType.BRAND and review.campaign.user_id != current_user.id):
+        raise HTTPException(status_code=403, detail="리뷰를 조회할 권한이 없습니다.")
+    
+    images = db.query(ReviewImage).filter(
+        ReviewImage.review_content_id == review_id
+    ).order_by(ReviewImage.order).all()
+    
+    return {
+        "total": len(images),
+        "items": images
+    }
+
 @router.get("/{review_id}/stats", response_model=ReviewStats)
 def get_review_stats(
     review_id: int,
@@ -374,7 +643,10 @@ def get_review_stats(
             detail="해당 리뷰의 통계 정보를 조회할 권한이 없습니다.",
         )
     
-    # TODO: 실제 통계 데이터 계산 로직 구현
+    # 참여율은 지표 갱신 작업(app.core.review_metrics)이 묶음으로 계산해 저장해 둡니다.
+    rate = review.engagement_rate
+    if rate is None:
+        rate = engagement_rate(review.views or 0, review.likes or 0, review.comments or 0, review.shares or 0)
     stats = ReviewStats(
         total_reviews=1,
         average_rating=review.rating,
@@ -382,8 +654,35 @@ def get_review_stats(
         total_likes=review.likes,
         total_comments=review.comments,
         total_shares=review.shares,
-        average_engagement_rate=0.0,  # 계산 로직 필요
-        last_updated=review.updated_at
+        average_engagement_rate=rate,
+        last_updated=review.metrics_updated_at or review.updated_at
     )
     
-    return stats 
\ No newline at end of file
+    return stats
+
+@router.get("/{review_id}/stats/history", response_model=List[ReviewMetricSnapshotResponse])
+def get_review_stats_history(
+    review_id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(get_db),
+    limit: int = Query(100, ge=1, le=1000),
+) -> Any:
+    """
+    리뷰 반응 지표의 시점별 스냅샷을 최신순으로 조회합니다.
+    """
+    review = db.query(ReviewContent.id, ReviewContent.influencer_id).filter(ReviewContent.id == review_id).first()
+    if not review:
+        raise HTTPException(
+            status_code=404,
+            detail="리뷰를 찾을 수 없습니다.",
+        )
+    
+    if review.influencer_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 리뷰의 통계 정보를 조회할 권한이 없습니다.",
+        )
+    
+    return db.query(ReviewMetricSnapshot).filter(
+        ReviewMetricSnapshot.review_content_id == review_id
+    ).order_by(ReviewMetricSnapshot.fetched_at.desc()).limit(limit).all()
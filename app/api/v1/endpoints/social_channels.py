@@ -1,5 +1,6 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app import crud, schemas
 from app.api import deps
@@ -11,14 +12,28 @@ from app.schemas.social_channel import (
     SocialChannelResponse,
     SocialChannelList,
     SocialChannelStats,
-    SocialPlatform
+    SocialChannelSnapshot,
+    SocialPlatform,
+    ChannelRollupList,
+    ChannelRollupResponse,
+    BlogPostRankingBatch,
+    BlogPostRankingBatchResult,
+    BlogPostTopList
 )
+from app.models.social_channel import RankingMetric
+from app.models.channel_analytics import RollupPeriod
+from app.crud.crud_channel_analytics import channel_analytics, moving_average
+from app.schemas.ingest import IngestError, IngestResult
+from app.core.ingest import detect_format, iter_chunks
 from app.db.database import get_db
-from datetime import datetime
+from datetime import date, datetime
 from app.core.security import get_current_active_user
 
 router = APIRouter()
 
+# 응답에 포함할 최대 오류 건수 (failed 카운트는 전체 기준)
+MAX_REPORTED_ERRORS = 1000
+
 @router.post("/", response_model=SocialChannelResponse)
 def create_social_channel(
     *,
@@ -56,6 +71,62 @@ def create_social_channel(
     db.refresh(channel)
     return channel
 
+@router.post("/bulk-ingest", response_model=IngestResult)
+async def bulk_ingest_channel_metrics(
+    request: Request,
+    db: Session = Depends(get_db),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    NDJSON(application/x-ndjson) 또는 CSV(text/csv) 스트림으로 채널 지표 스냅샷을 대량 반영합니다. (관리자 전용)
+    chunk_size 단위로 검증 후 한 번의 트랜잭션으로 채널 지표를 갱신하고 ChannelAnalytics 이력을 추가합니다.
+    """
+    if current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="관리자만 채널 지표를 대량 반영할 수 있습니다.",
+        )
+    
+    fmt = detect_format(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=415,
+            detail="application/x-ndjson 또는 text/csv 형식만 지원합니다.",
+        )
+    
+    received = applied = failed = 0
+    errors: List[IngestError] = []
+    
+    def report(error: IngestError) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(error)
+    
+    async for chunk in iter_chunks(
+        request.stream(), fmt=fmt, model=SocialChannelSnapshot, chunk_size=chunk_size
+    ):
+        received += len(chunk.items) + len(chunk.errors)
+        for error in chunk.errors:
+            report(error)
+        if not chunk.items:
+            continue
+        
+        known_ids = await run_in_threadpool(
+            crud.social_channel.apply_snapshots, db, snapshots=chunk.items
+        )
+        for snapshot, line in zip(chunk.items, chunk.lines):
+            if snapshot.channel_id in known_ids:
+                applied += 1
+            else:
+                report(IngestError(
+                    line=line,
+                    detail=f"소셜 채널을 찾을 수 없습니다. (channel_id={snapshot.channel_id})",
+                ))
+    
+    return IngestResult(received=received, applied=applied, failed=failed, errors=errors)
+
 @router.get("/", response_model=SocialChannelList)
 def read_social_channels(
     db: Session = Depends(get_db),
@@ -190,20 +261,79 @@ def get_channel_stats(
             detail="해당 소셜 채널의 통계 정보를 조회할 권한이 없습니다.",
         )
     
-    # TODO: 실제 통계 데이터 계산 로직 구현
+    # 월간 롤업 합계로 누적 지표를 계산 (원본 이력 스캔 없음)
+    totals = channel_analytics.get_totals(db, channel_id=channel_id)
     stats = SocialChannelStats(
         platform=channel.platform,
         total_followers=channel.followers_count,
-        total_views=channel.average_views,
-        total_likes=channel.average_likes,
-        total_comments=channel.average_comments,
-        total_shares=channel.average_shares,
+        total_views=totals["views"],
+        total_likes=totals["likes"],
+        total_comments=totals["comments"],
+        total_shares=totals["shares"],
         average_engagement_rate=channel.engagement_rate,
-        last_updated=channel.updated_at
+        last_updated=totals["last_snapshot_at"] or channel.updated_at
     )
     
     return stats
 
+@router.get("/{channel_id}/stats/rollups", response_model=ChannelRollupList)
+def get_channel_rollups(
+    channel_id: int,
+    period: RollupPeriod = RollupPeriod.DAILY,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    window: int = Query(7, ge=1, le=90),
+    limit: int = Query(90, ge=1, le=366),
+    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    특정 소셜 채널의 일/주/월 롤업 통계를 조회합니다.
+    증감, 참여율과 window 구간 이동평균을 롤업 테이블만으로 계산합니다.
+    """
+    channel = db.query(SocialChannel).filter(SocialChannel.id == channel_id).first()
+    if not channel:
+        raise HTTPException(
+            status_code=404,
+            detail="소셜 채널을 찾을 수 없습니다.",
+        )
+    
+    if channel.user_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 소셜 채널의 통계 정보를 조회할 권한이 없습니다.",
+        )
+    
+    # 롤업의 조회수는 누적값이므로 구간별 증가량은 직전 구간과의 차이입니다.
+    # 첫 구간부터 증가량과 이동평균을 채우기 위해 window개 구간을 더 읽습니다.
+    rollups = channel_analytics.get_rollups(
+        db, channel_id=channel_id, period=period, end=end, limit=limit + window
+    )
+    # 누적값이 없는 구간이 끼면 증가량을 알 수 없으므로 None으로 두고, 이동평균에서는 0으로 봅니다.
+    views_gain = [None] + [
+        later.views - earlier.views if later.views is not None and earlier.views is not None else None
+        for earlier, later in zip(rollups, rollups[1:])
+    ]
+    views_ma = [None] + moving_average([gain or 0 for gain in views_gain[1:]], window)
+    delta_ma = moving_average([row.followers_delta or 0 for row in rollups], window)
+    
+    items = []
+    for row, gain, views_avg, delta_avg in zip(rollups, views_gain, views_ma, delta_ma):
+        if start and row.period_start < start:
+            continue
+        item = ChannelRollupResponse.model_validate(row)
+        item.views_gain = gain
+        item.views_moving_average = views_avg
+        item.followers_delta_moving_average = delta_avg
+        items.append(item)
+    
+    return ChannelRollupList(
+        channel_id=channel_id,
+        period=period,
+        window=window,
+        items=items[-limit:]
+    )
+
 @router.get("/me", response_model=List[schemas.SocialChannel])
 def read_social_channels_me(
     current_user: schemas.User = Depends(get_current_active_user),
@@ -218,15 +348,84 @@ def read_social_channels_me(
 @router.get("/{channel_id}/rankings", response_model=List[schemas.BlogPostRanking])
 def read_blog_post_rankings(
     channel_id: int,
+    skip: int = 0,
+    limit: int = 100,
     current_user: schemas.User = Depends(get_current_active_user),
     db: Session = Depends(deps.get_db),
 ):
     """
-    특정 소셜 채널의 블로그 포스트 순위 목록을 조회합니다.
+    특정 소셜 채널의 블로그 포스트 순위 목록을 최신 일자, 조회수 순으로 조회합니다.
     """
-    rankings = crud.blog_post_ranking.get_by_channel_id(db, channel_id=channel_id)
+    rankings = crud.blog_post_ranking.get_by_channel_id(
+        db, channel_id=channel_id, skip=skip, limit=limit
+    )
     return rankings
 
+@router.get("/{channel_id}/rankings/top", response_model=BlogPostTopList)
+def read_top_blog_posts(
+    channel_id: int,
+    start: date,
+    end: Optional[date] = None,
+    metric: RankingMetric = RankingMetric.VIEWS,
+    limit: int = Query(10, ge=1, le=100),
+    current_user: schemas.User = Depends(get_current_active_user),
+    db: Session = Depends(deps.get_db),
+):
+    """
+    기간 내 조회수/좋아요 상위 포스트를 일별 리더보드에서 조회합니다.
+    """
+    end = end or start
+    if end < start:
+        raise HTTPException(
+            status_code=400,
+            detail="종료일은 시작일보다 이후여야 합니다.",
+        )
+    items = crud.blog_post_ranking.get_top(
+        db, channel_id=channel_id, metric=metric, start=start, end=end, limit=limit
+    )
+    return {
+        "channel_id": channel_id,
+        "metric": metric,
+        "start": start,
+        "end": end,
+        "items": items
+    }
+
+@router.post("/{channel_id}/rankings/batch", response_model=BlogPostRankingBatchResult)
+def create_blog_post_rankings_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    channel_id: int,
+    batch_in: BlogPostRankingBatch,
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    특정 소셜 채널의 하루치 블로그 포스트 순위 스냅샷을 한 번에 등록합니다.
+    같은 일자의 기존 순위는 교체되고 일별 리더보드가 다시 계산됩니다.
+    """
+    channel = db.query(SocialChannel).filter(SocialChannel.id == channel_id).first()
+    if not channel:
+        raise HTTPException(
+            status_code=404,
+            detail="소셜 채널을 찾을 수 없습니다.",
+        )
+    
+    if channel.user_id != current_user.id and current_user.user_type != UserType.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="해당 소셜 채널의 순위를 등록할 권한이 없습니다.",
+        )
+    
+    inserted, replaced = crud.blog_post_ranking.replace_daily_snapshot(
+        db, channel_id=channel_id, ranking_date=batch_in.ranking_date, items=batch_in.items
+    )
+    return {
+        "channel_id": channel_id,
+        "ranking_date": batch_in.ranking_date,
+        "inserted": inserted,
+        "replaced": replaced
+    }
+
 @router.post("/{channel_id}/rankings", response_model=schemas.BlogPostRanking)
 def create_blog_post_ranking(
     *,
@@ -0,0 +1,133 @@
+from typing import Any, Awaitable, Callable, Dict, List
+from dataclasses import dataclass, field
+import asyncio
+import logging
+import time
+import httpx
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """플랫폼별 토큰 버킷. 초당 rate개, 최대 burst개까지 요청을 허용합니다."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+@dataclass
+class Lane:
+    """한 플랫폼(어댑터)의 작업 묶음. items는 앞에서부터 처리되며 limiter를 함께 씁니다."""
+    limiter: RateLimiter
+    fetch: Callable[[httpx.AsyncClient, Any], Awaitable[Any]]
+    items: List[Any] = field(default_factory=list)
+
+class BatchResult:
+    def __init__(self, name: str = "BatchResult") -> None:
+        self.name = name
+        self.scheduled = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.name}(scheduled={self.scheduled}, succeeded={self.succeeded}, "
+            f"failed={self.failed}, skipped={self.skipped})"
+        )
+
+class RateLimitedBatchRunner:
+    """
+    외부 API를 플랫폼별 속도 제한 아래 호출하고 결과를 묶어 반영하는 공용 실행기.
+    채널 동기화(channel_sync)와 리뷰 지표 갱신(review_metrics)이 함께 씁니다.
+
+    - 레인(플랫폼)마다 최대 workers개의 워커가 items를 앞에서부터 가져가므로 items 순서가 우선순위
+    - 호출 전에 레인의 토큰 버킷을 기다리며, 느린 레인이 다른 레인의 워커를 붙잡지 않음
+    - 성공한 결과는 flush_size개마다 apply(batch)로 스레드에서 반영하고, 실패는 기록만 하고 넘어감
+    - apply()가 예외를 내면 그 묶음을 실패로 집계하고 기록한 뒤 나머지 회차를 계속 진행
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[List[Any]], None],
+        *,
+        workers: int,
+        flush_size: int = 500,
+        name: str = "BatchResult",
+        describe: Callable[[Any], str] = repr,
+    ):
+        self.apply = apply
+        self.workers = workers
+        self.flush_size = flush_size
+        self.name = name
+        self.describe = describe
+
+    async def run(self, lanes: Dict[str, Lane], *, skipped: int = 0) -> BatchResult:
+        """한 회차를 실행합니다. skipped는 호출자가 처리할 어댑터가 없어 레인에 넣지 않은 대상 수입니다."""
+        result = BatchResult(self.name)
+        result.skipped = skipped
+        result.scheduled = skipped + sum(len(lane.items) for lane in lanes.values())
+
+        pending: List[Any] = []
+        flush_lock = asyncio.Lock()
+
+        async def flush() -> None:
+            async with flush_lock:
+                if not pending:
+                    return
+                batch = pending[:]
+                pending.clear()
+                try:
+                    await asyncio.to_thread(self.apply, batch)
+                except Exception as e:
+                    # 반영에 실패한 묶음만 실패로 돌리고, 다른 워커와 남은 묶음은 계속 처리합니다.
+                    result.succeeded -= len(batch)
+                    result.failed += len(batch)
+                    logger.error(f"{self.name} apply failed ({len(batch)} items): {str(e)}")
+
+        async def worker(client: httpx.AsyncClient, lane: Lane, queue: asyncio.Queue) -> None:
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await lane.limiter.acquire()
+                try:
+                    value = await lane.fetch(client, item)
+                except Exception as e:
+                    result.failed += 1
+                    logger.error(f"{self.name} item failed ({self.describe(item)}): {str(e)}")
+                    continue
+                result.succeeded += 1
+                pending.append(value)
+                if len(pending) >= self.flush_size:
+                    await flush()
+
+        queues = []
+        for lane in lanes.values():
+            queue: asyncio.Queue = asyncio.Queue()
+            for item in lane.items:
+                queue.put_nowait(item)
+            queues.append((lane, queue))
+
+        async with httpx.AsyncClient() as client:
+            await asyncio.gather(*(
+                worker(client, lane, queue)
+                for lane, queue in queues
+                for _ in range(max(1, min(self.workers, queue.qsize())))
+            ))
+        await flush()
+        return result
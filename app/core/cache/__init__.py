@@ -0,0 +1,33 @@
+from .backends import CacheBackend, CacheError, NullBackend, SQLiteBackend
+from .redis import RedisBackend
+from .fake_redis import FakeRedisServer
+from .tiered import LRUCache, TieredCache
+from app.core.config import settings
+
+def build_cache() -> TieredCache:
+    """
+    CACHE_BACKEND 설정으로 공유 계층을 고릅니다.
+    - memory: 공유 계층 없음 (워커 1개)
+    - sqlite: CACHE_SQLITE_PATH 파일을 같은 서버의 워커들이 공유
+    - redis: CACHE_REDIS_URL의 Redis 서버
+    - fakeredis: 프로세스 안에 RESP 서버를 띄워 Redis 경로를 그대로 사용 (개발용)
+    """
+    backend = settings.CACHE_BACKEND
+    if backend == "redis":
+        shared: CacheBackend = RedisBackend(settings.CACHE_REDIS_URL)
+    elif backend == "fakeredis":
+        shared = RedisBackend(FakeRedisServer().start().url)
+    elif backend == "sqlite":
+        shared = SQLiteBackend(settings.CACHE_SQLITE_PATH)
+    elif backend == "memory":
+        shared = NullBackend()
+    else:
+        raise ValueError(f"Unknown CACHE_BACKEND: {backend}")
+    return TieredCache(
+        shared,
+        prefix=settings.CACHE_KEY_PREFIX,
+        local_max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+        local_ttl=settings.CACHE_LOCAL_TTL,
+    )
+
+cache = build_cache()
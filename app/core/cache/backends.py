@@ -0,0 +1,165 @@
+from typing import Optional
+import os
+import sqlite3
+import threading
+import time
+
+class CacheError(Exception):
+    """공유 캐시 계층과 통신하지 못했을 때 발생합니다."""
+
+class CacheBackend:
+    """
+    워커 사이에 공유되는 캐시 계층의 최소 인터페이스. 값은 직렬화된 bytes입니다.
+    ttl은 초 단위이며, add()는 키가 없을 때만 저장하고 저장 여부를 반환합니다. (잠금용)
+    delete_if_equals()는 값이 같을 때만 지우므로 자신이 잡은 잠금만 풀 수 있습니다.
+    clear(prefix)는 prefix로 시작하는 키만 지웁니다. (같은 Redis DB를 쓰는 다른 용도의 키는 남김)
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def delete_if_equals(self, key: str, value: bytes) -> bool:
+        raise NotImplementedError
+
+    def clear(self, prefix: str) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+class NullBackend(CacheBackend):
+    """공유 계층이 없는 배포(워커 1개)용. 프로세스 내 LRU만 사용합니다."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return True
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def delete_if_equals(self, key: str, value: bytes) -> bool:
+        return True
+
+    def clear(self, prefix: str) -> None:
+        pass
+
+class SQLiteBackend(CacheBackend):
+    """
+    한 서버의 워커들이 파일 하나를 공유하는 캐시 계층.
+    경로를 /dev/shm 아래로 잡으면 디스크를 거치지 않는 공유 메모리 캐시가 됩니다.
+    WAL 모드라 읽기는 쓰기를 기다리지 않으며, 만료된 행은 purge_every번 쓸 때마다 정리합니다.
+    """
+
+    def __init__(self, path: str, *, busy_timeout: float = 1.0, purge_every: int = 1000):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.purge_every = purge_every
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries(expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 사이에 공유하지 않습니다.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+        self._maybe_purge()
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        now = time.time()
+        try:
+            cursor = self._connection().execute(
+                "INSERT INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                "WHERE cache_entries.expires_at <= ?",
+                (key, value, now + ttl, now),
+            )
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+        return cursor.rowcount == 1
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._connection().execute(
+                f"DELETE FROM cache_entries WHERE key IN ({', '.join('?' for _ in keys)})", keys
+            )
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+
+    def delete_if_equals(self, key: str, value: bytes) -> bool:
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM cache_entries WHERE key = ? AND value = ?", (key, value)
+            )
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+        return cursor.rowcount == 1
+
+    def clear(self, prefix: str) -> None:
+        try:
+            self._connection().execute(
+                "DELETE FROM cache_entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _maybe_purge(self) -> None:
+        self._writes += 1
+        if self._writes % self.purge_every:
+            return
+        try:
+            self._connection().execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        except sqlite3.Error:
+            pass  # 정리는 다음 기회에 다시 시도합니다.
@@ -0,0 +1,196 @@
+from typing import Any, Dict, List, Optional, Tuple
+import re
+import socketserver
+import threading
+import time
+from app.core.cache.backends import CacheError
+from app.core.cache.redis import COMPARE_AND_DELETE_SCRIPT, read_reply
+
+def _encode_reply(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode_reply(item) for item in value)
+    return b"+%s\r\n" % str(value).encode("utf-8")
+
+def _glob_regex(pattern: str) -> "re.Pattern":
+    """Redis MATCH 패턴(*, ?, [..], \\ 이스케이프)을 정규식으로 바꿉니다."""
+    parts, index = [], 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            parts.append(re.escape(pattern[index + 1]))
+            index += 2
+            continue
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        elif char == "[":
+            end = pattern.find("]", index + 1)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1:end]
+                if body.startswith("^"):
+                    body = "^" + re.escape(body[1:]).replace("\\-", "-")
+                else:
+                    body = re.escape(body).replace("\\-", "-")
+                parts.append(f"[{body}]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile("".join(parts), re.DOTALL)
+
+class _ReplyError(Exception):
+    pass
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+class FakeRedisServer:
+    """
+    Redis 없이 개발/점검할 때 쓰는 프로세스 내장 RESP 서버.
+    RedisBackend가 쓰는 명령(PING, AUTH, SELECT, GET, SET [EX|PX] [NX], DEL, EXISTS, SCAN [MATCH] [COUNT], FLUSHDB)과
+    EVAL은 COMPARE_AND_DELETE_SCRIPT만 지원하며 데이터는 메모리에만 있습니다. 운영 환경에서는 실제 Redis를 사용합니다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        command = read_reply(self.rfile)
+                    except (CacheError, ValueError):
+                        return
+                    if not isinstance(command, list) or not command:
+                        return
+                    try:
+                        reply = _encode_reply(server.dispatch(command))
+                    except _ReplyError as e:
+                        reply = b"-ERR %s\r\n" % str(e).encode("utf-8")
+                    except IndexError:
+                        reply = b"-ERR wrong number of arguments\r\n"
+                    self.wfile.write(reply)
+
+        self._server = _ThreadingServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-redis", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _alive(self, key: bytes, now: float) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._data[key]
+            return None
+        return value
+
+    def dispatch(self, command: List[bytes]) -> Any:
+        name = command[0].decode("utf-8").upper()
+        args = command[1:]
+        now = time.time()
+        with self._lock:
+            if name == "PING":
+                return "PONG"
+            if name in ("AUTH", "SELECT"):
+                return "OK"
+            if name == "GET":
+                return self._alive(args[0], now)
+            if name == "SET":
+                key, value = args[0], args[1]
+                expires_at, only_new = None, False
+                options = [arg.decode("utf-8").upper() for arg in args[2:]]
+                index = 0
+                while index < len(options):
+                    option = options[index]
+                    if option in ("EX", "PX"):
+                        try:
+                            amount = int(options[index + 1])
+                        except (IndexError, ValueError):
+                            raise _ReplyError("syntax error")
+                        expires_at = now + (amount if option == "EX" else amount / 1000)
+                        index += 2
+                    elif option == "NX":
+                        only_new = True
+                        index += 1
+                    else:
+                        raise _ReplyError("syntax error")
+                if only_new and self._alive(key, now) is not None:
+                    return None
+                self._data[key] = (value, expires_at)
+                return "OK"
+            if name == "DEL":
+                deleted = 0
+                for key in args:
+                    if self._alive(key, now) is not None:
+                        del self._data[key]
+                        deleted += 1
+                return deleted
+            if name == "EXISTS":
+                return sum(1 for key in args if self._alive(key, now) is not None)
+            if name == "SCAN":
+                return self._scan(args, now)
+            if name == "EVAL":
+                if args[0].decode("utf-8") != COMPARE_AND_DELETE_SCRIPT or args[1] != b"1":
+                    raise _ReplyError("unsupported script")
+                key, expected = args[2], args[3]
+                if self._alive(key, now) != expected:
+                    return 0
+                del self._data[key]
+                return 1
+            if name == "FLUSHDB":
+                self._data.clear()
+                return "OK"
+        raise _ReplyError(f"unknown command '{name}'")
+
+    def _scan(self, args: List[bytes], now: float) -> List[Any]:
+        # 키를 정렬해 커서를 순번으로 씁니다. 순회 중 추가된 키는 놓칠 수 있다는 점은 Redis와 같습니다.
+        cursor = int(args[0])
+        regex, count = None, 10
+        options = args[1:]
+        index = 0
+        while index < len(options):
+            option = options[index].decode("utf-8").upper()
+            if option == "MATCH":
+                regex = _glob_regex(options[index + 1].decode("utf-8"))
+            elif option == "COUNT":
+                count = int(options[index + 1])
+            else:
+                raise _ReplyError("syntax error")
+            index += 2
+        keys = sorted(self._data)
+        batch = keys[cursor:cursor + count]
+        next_cursor = cursor + count if cursor + count < len(keys) else 0
+        matched = [
+            key for key in batch
+            if self._alive(key, now) is not None
+            and (regex is None or regex.fullmatch(key.decode("utf-8")))
+        ]
+        return [str(next_cursor).encode("utf-8"), matched]
@@ -0,0 +1,166 @@
+from typing import Any, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+import re
+import socket
+import threading
+from app.core.cache.backends import CacheBackend, CacheError
+
+def encode_command(*args: Any) -> bytes:
+    """RESP 배열로 명령을 직렬화합니다."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode("utf-8")
+        else:
+            data = str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+# 값이 같을 때만 지우는 스크립트 (잠금 해제용). FakeRedisServer도 이 스크립트를 인식합니다.
+COMPARE_AND_DELETE_SCRIPT = (
+    "if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) else return 0 end"
+)
+
+def glob_escape(text: str) -> str:
+    """SCAN MATCH 패턴에서 문자 그대로 비교되도록 글롭 특수문자를 이스케이프합니다."""
+    return re.sub(r"([\\*?\[\]])", r"\\\1", text)
+
+class RedisReplyError(CacheError):
+    """서버가 -ERR 응답을 보낸 경우"""
+
+def read_reply(stream) -> Any:
+    """RESP2 응답 하나를 읽습니다. (simple string, error, integer, bulk string, array)"""
+    line = stream.readline()
+    if not line.endswith(b"\r\n"):
+        raise CacheError("connection closed")
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        raise RedisReplyError(payload.decode("utf-8"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise CacheError("connection closed")
+        return data[:-2]
+    if prefix == b"*":
+        count = int(payload)
+        if count < 0:
+            return None
+        return [read_reply(stream) for _ in range(count)]
+    raise CacheError(f"unexpected reply: {line!r}")
+
+def parse_redis_url(url: str) -> Tuple[str, int, Optional[str], int]:
+    """redis://[:password@]host[:port][/db] → (host, port, password, db)"""
+    parsed = urlparse(url)
+    if parsed.scheme != "redis":
+        raise ValueError(f"unsupported redis url: {url}")
+    db = int(parsed.path.lstrip("/") or 0)
+    password = unquote(parsed.password) if parsed.password else None
+    return parsed.hostname or "localhost", parsed.port or 6379, password, db
+
+class _Connection:
+    def __init__(self, host: str, port: int, timeout: float):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stream = self.sock.makefile("rb")
+
+    def execute(self, *args: Any) -> Any:
+        self.sock.sendall(encode_command(*args))
+        return read_reply(self.stream)
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            self.sock.close()
+
+class RedisBackend(CacheBackend):
+    """
+    표준 라이브러리 소켓으로 구현한 최소 Redis(RESP2) 클라이언트.
+    연결은 풀에 보관해 재사용하고, 통신 오류가 난 연결은 버린 뒤 한 번만 다시 시도합니다.
+    """
+
+    def __init__(self, url: str, *, timeout: float = 0.5, max_idle: int = 16):
+        self.host, self.port, self.password, self.db = parse_redis_url(url)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: List[_Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> _Connection:
+        try:
+            conn = _Connection(self.host, self.port, self.timeout)
+            if self.password:
+                conn.execute("AUTH", self.password)
+            if self.db:
+                conn.execute("SELECT", self.db)
+        except OSError as e:
+            raise CacheError(str(e)) from e
+        return conn
+
+    def execute(self, *args: Any) -> Any:
+        for attempt in range(2):
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._connect()
+            try:
+                reply = conn.execute(*args)
+            except RedisReplyError:
+                self._release(conn)
+                raise
+            except (OSError, CacheError) as e:
+                conn.close()
+                if attempt:
+                    raise CacheError(str(e)) from e
+                continue
+            self._release(conn)
+            return reply
+
+    def _release(self, conn: _Connection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.execute("SET", key, value, "PX", max(int(ttl * 1000), 1))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return self.execute("SET", key, value, "PX", max(int(ttl * 1000), 1), "NX") is not None
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.execute("DEL", *keys)
+
+    def delete_if_equals(self, key: str, value: bytes) -> bool:
+        return bool(self.execute("EVAL", COMPARE_AND_DELETE_SCRIPT, 1, key, value))
+
+    def clear(self, prefix: str, *, batch_size: int = 500) -> None:
+        # FLUSHDB는 같은 DB를 쓰는 다른 키까지 지우므로 prefix로 SCAN해 찾은 키만 지웁니다.
+        pattern = f"{glob_escape(prefix)}*"
+        cursor = b"0"
+        while True:
+            cursor, keys = self.execute("SCAN", cursor, "MATCH", pattern, "COUNT", batch_size)
+            if keys:
+                self.execute("DEL", *keys)
+            if cursor == b"0":
+                break
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
@@ -0,0 +1,234 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from app.core.cache.backends import CacheBackend, CacheError
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+class LRUCache:
+    """프로세스 내 LRU 계층. 항목마다 만료 시각(time.time() 기준)을 함께 둡니다."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] <= now:
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+class _Flight:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = _MISSING
+        self.error: Optional[BaseException] = None
+
+class TieredCache:
+    """
+    프로세스 내 LRU 계층 + 워커 공유 계층(Redis/SQLite).
+
+    - 값은 {"v": 값, "d": 계산 소요 초, "e": 만료 시각} 봉투로 JSON 직렬화해 공유 계층에 둡니다.
+      따라서 datetime/Decimal은 각각 ISO 문자열/float로 돌아옵니다.
+    - 로컬 계층은 local_ttl까지만 보관하므로 다른 워커의 delete()는 최대 local_ttl 늦게 보입니다.
+    - get_or_set()의 캐시 스탬피드 방지:
+      1) single-flight: 같은 프로세스에서는 키마다 한 스레드만 계산하고 나머지는 결과를 기다리며,
+         워커 사이에서는 공유 계층의 add()(SET NX) 잠금을 잡은 워커만 계산합니다.
+      2) 확률적 조기 갱신(XFetch): now - d * beta * ln(rand) >= e 이면 만료 전이라도 미리 다시 계산합니다.
+         계산이 오래 걸리는 키일수록, 만료가 가까울수록 일찍 갱신되어 만료 순간에 요청이 몰리지 않습니다.
+    - 공유 계층 오류는 경고만 남기고 계산 결과를 그대로 돌려줍니다. (캐시 장애가 요청 실패가 되지 않도록)
+    """
+
+    def __init__(
+        self,
+        shared: CacheBackend,
+        *,
+        prefix: str = "",
+        local_max_entries: int = 10000,
+        local_ttl: float = 5.0,
+        beta: float = 1.0,
+        lock_ttl: float = 10.0,
+        lock_wait: float = 2.0,
+    ):
+        self.shared = shared
+        self.prefix = prefix
+        self.local = LRUCache(local_max_entries)
+        self.local_ttl = local_ttl
+        self.beta = beta
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _load_envelope(self, key: str, now: float) -> Optional[dict]:
+        envelope = self.local.get(key, now)
+        if envelope is not _MISSING:
+            return envelope
+        try:
+            raw = self.shared.get(key)
+        except CacheError as e:
+            logger.warning(f"Shared cache get failed ({key}): {str(e)}")
+            return None
+        if raw is None:
+            return None
+        envelope = json.loads(raw)
+        self.local.set(key, envelope, min(envelope["e"], now + self.local_ttl))
+        return envelope
+
+    def _store_envelope(self, key: str, value: Any, ttl: float, delta: float) -> Any:
+        """저장하고, 직렬화를 거친 값(캐시 적중 시 돌려줄 것과 같은 모양)을 반환합니다."""
+        now = time.time()
+        raw = json.dumps(
+            {"v": value, "d": delta, "e": now + ttl}, ensure_ascii=False, default=_default, separators=(",", ":")
+        ).encode("utf-8")
+        envelope = json.loads(raw)
+        self.local.set(key, envelope, min(envelope["e"], now + self.local_ttl))
+        try:
+            self.shared.set(key, raw, ttl)
+        except CacheError as e:
+            logger.warning(f"Shared cache set failed ({key}): {str(e)}")
+        return envelope["v"]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        envelope = self._load_envelope(self._key(key), time.time())
+        return envelope["v"] if envelope is not None else default
+
+    def set(self, key: str, value: Any, *, ttl: float) -> None:
+        self._store_envelope(self._key(key), value, ttl, 0.0)
+
+    def delete(self, *keys: str) -> None:
+        full_keys = [self._key(key) for key in keys]
+        self.local.delete(*full_keys)
+        try:
+            self.shared.delete(*full_keys)
+        except CacheError as e:
+            logger.warning(f"Shared cache delete failed: {str(e)}")
+
+    def clear(self) -> None:
+        self.local.clear()
+        try:
+            self.shared.clear(self.prefix)
+        except CacheError as e:
+            logger.warning(f"Shared cache clear failed: {str(e)}")
+
+    def _should_refresh(self, envelope: dict, now: float) -> bool:
+        if envelope["d"] <= 0 or self.beta <= 0:
+            return now >= envelope["e"]
+        return now - envelope["d"] * self.beta * math.log(1.0 - random.random()) >= envelope["e"]
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], *, ttl: float) -> Any:
+        full_key = self._key(key)
+        envelope = self._load_envelope(full_key, time.time())
+        if envelope is not None and not self._should_refresh(envelope, time.time()):
+            return envelope["v"]
+
+        with self._flights_lock:
+            flight = self._flights.get(full_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[full_key] = _Flight()
+
+        if not leader:
+            # 다른 스레드가 계산 중이면 남은 값(조기 갱신 중)을 바로 쓰고, 없으면 결과를 기다립니다.
+            if envelope is not None:
+                return envelope["v"]
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = self._compute(full_key, loader, ttl, envelope)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(full_key, None)
+            flight.event.set()
+
+    def _compute(self, full_key: str, loader: Callable[[], Any], ttl: float, stale: Optional[dict]) -> Any:
+        lock_key = f"{full_key}:lock"
+        # 잠금 값은 호출마다 고유합니다. lock_ttl이 지나 다른 워커가 잡은 잠금을 지우지 않도록 값이 같을 때만 풉니다.
+        token = uuid.uuid4().hex.encode("ascii")
+        try:
+            locked = self.shared.add(lock_key, token, self.lock_ttl)
+        except CacheError as e:
+            logger.warning(f"Shared cache lock failed ({full_key}): {str(e)}")
+            locked = True
+
+        if not locked:
+            # 다른 워커가 계산 중: 조기 갱신이면 기존 값을, 아니면 결과가 공유 계층에 올라올 때까지 잠시 기다립니다.
+            if stale is not None:
+                return stale["v"]
+            deadline = time.monotonic() + self.lock_wait
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                try:
+                    raw = self.shared.get(full_key)
+                except CacheError:
+                    break
+                if raw is not None:
+                    envelope = json.loads(raw)
+                    self.local.set(full_key, envelope, min(envelope["e"], time.time() + self.local_ttl))
+                    return envelope["v"]
+            # 기다려도 없으면 직접 계산합니다.
+
+        try:
+            started = time.monotonic()
+            value = loader()
+            return self._store_envelope(full_key, value, ttl, time.monotonic() - started)
+        finally:
+            if locked:
+                try:
+                    self.shared.delete_if_equals(lock_key, token)
+                except CacheError:
+                    pass
@@ -0,0 +1,169 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+import bisect
+import enum
+import hashlib
+import threading
+import time
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.responses import dumps_json
+from app.models.campaign import Campaign, CampaignStatus
+from app.schemas.campaign import CampaignResponse
+
+class FeedOrder(str, enum.Enum):
+    RECENT = "recent"  # 최신 등록순
+    DEADLINE = "deadline"  # 마감 임박순
+
+_FAR_FUTURE = date.max
+
+class CampaignFeed:
+    """
+    인플루언서용 진행 중(ACTIVE) 캠페인 피드의 공유 메모리 캐시.
+
+    - 캠페인은 직렬화된 dict로 보관하고, 정렬 순서별로 (정렬 키, id) 목록을 bisect로 유지합니다.
+    - 같은 프로세스의 변경은 apply()로 즉시 반영하고, 다른 워커/스케줄러의 변경은
+      refresh_interval마다 updated_at 워터마크 이후 행만 읽어 증분 반영합니다.
+      워터마크는 refresh()가 DB에서 읽은 max(updated_at)로만 옮기며, 늦게 커밋된 수정을 놓치지 않도록
+      overlap만큼 앞에서부터 다시 읽습니다. (upsert는 멱등)
+    - 다른 워커의 삭제는 updated_at에 남지 않으므로 reconcile_interval마다 ACTIVE 캠페인 id 전체와 대조합니다.
+    - 내용이 바뀔 때마다 version이 올라가며, 페이지 응답 본문과 ETag는 version별로 캐시됩니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_interval: float = settings.CAMPAIGN_FEED_REFRESH_SECONDS,
+        overlap: timedelta = timedelta(seconds=settings.CAMPAIGN_FEED_OVERLAP_SECONDS),
+        reconcile_interval: float = settings.CAMPAIGN_FEED_RECONCILE_SECONDS,
+        page_cache_size: int = 256,
+    ):
+        self.refresh_interval = refresh_interval
+        self.overlap = overlap
+        self.reconcile_interval = reconcile_interval
+        self.page_cache_size = page_cache_size
+        self.version = 0
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._keys: Dict[FeedOrder, Dict[int, tuple]] = {order: {} for order in FeedOrder}
+        self._sorted: Dict[FeedOrder, List[tuple]] = {order: [] for order in FeedOrder}
+        self._pages: "OrderedDict[tuple, Tuple[str, bytes]]" = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self._checked_at = 0.0
+        self._reconciled_at = 0.0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _sort_key(order: FeedOrder, campaign: Campaign) -> tuple:
+        if order == FeedOrder.DEADLINE:
+            end_date = campaign.end_date
+            if isinstance(end_date, datetime):
+                end_date = end_date.date()
+            return (end_date or _FAR_FUTURE, campaign.id)
+        # 최신순은 내림차순이므로 부호를 뒤집은 타임스탬프를 키로 씁니다.
+        created_at = campaign.created_at.timestamp() if campaign.created_at else 0.0
+        return (-created_at, -campaign.id)
+
+    def _upsert(self, campaign: Campaign) -> bool:
+        item = CampaignResponse.model_validate(campaign).model_dump(mode="json")
+        if self._items.get(campaign.id) == item:
+            return False
+        self._remove(campaign.id)
+        self._items[campaign.id] = item
+        for order in FeedOrder:
+            key = self._sort_key(order, campaign)
+            self._keys[order][campaign.id] = key
+            bisect.insort(self._sorted[order], key + (campaign.id,))
+        return True
+
+    def _remove(self, campaign_id: int) -> bool:
+        if campaign_id not in self._items:
+            return False
+        del self._items[campaign_id]
+        for order in FeedOrder:
+            entry = self._keys[order].pop(campaign_id) + (campaign_id,)
+            entries = self._sorted[order]
+            index = bisect.bisect_left(entries, entry)
+            if index < len(entries) and entries[index] == entry:
+                entries.pop(index)
+        return True
+
+    def apply(self, campaigns: List[Campaign]) -> None:
+        """변경된 캠페인을 피드에 반영합니다. ACTIVE면 추가/갱신, 아니면 제거합니다."""
+        with self._lock:
+            changed = False
+            for campaign in campaigns:
+                if campaign.status == CampaignStatus.ACTIVE:
+                    changed = self._upsert(campaign) or changed
+                else:
+                    changed = self._remove(campaign.id) or changed
+            if changed:
+                self._changed()
+
+    def discard(self, campaign_id: int) -> None:
+        with self._lock:
+            if self._remove(campaign_id):
+                self._changed()
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._pages.clear()
+
+    def refresh(self, db: Session, *, force: bool = False) -> None:
+        """refresh_interval이 지났으면 워터마크 이후 변경분만 읽어 반영합니다."""
+        now = time.monotonic()
+        if not force and self._watermark is not None and now - self._checked_at < self.refresh_interval:
+            return
+        with self._lock:
+            if not force and self._watermark is not None and now - self._checked_at < self.refresh_interval:
+                return
+            # 행을 읽기 전에 상한을 잡아야 읽는 도중 바뀐 행을 다음 갱신에서 다시 읽습니다.
+            latest = db.query(func.max(Campaign.updated_at)).scalar()
+            if self._watermark is None:
+                rows = db.query(Campaign).filter(Campaign.status == CampaignStatus.ACTIVE).all()
+                self._reconciled_at = now
+            else:
+                rows = db.query(Campaign).filter(
+                    Campaign.updated_at >= self._watermark - self.overlap
+                ).all()
+            self.apply(rows)
+            self._watermark = max(filter(None, [self._watermark, latest]), default=datetime.min)
+            if now - self._reconciled_at >= self.reconcile_interval:
+                self._reconcile(db)
+                self._reconciled_at = now
+            self._checked_at = now
+
+    def _reconcile(self, db: Session) -> None:
+        """ACTIVE 캠페인 id 전체와 대조해 다른 워커에서 삭제된 캠페인을 빼고, 빠진 캠페인을 채웁니다."""
+        active_ids = {row.id for row in db.query(Campaign.id).filter(Campaign.status == CampaignStatus.ACTIVE)}
+        removed = [self._remove(campaign_id) for campaign_id in list(self._items) if campaign_id not in active_ids]
+        if any(removed):
+            self._changed()
+        missing = active_ids.difference(self._items)
+        if missing:
+            self.apply(db.query(Campaign).filter(Campaign.id.in_(missing)).all())
+
+    def page(self, db: Session, *, order: FeedOrder, skip: int, limit: int) -> Tuple[str, bytes]:
+        """(ETag, 직렬화된 CampaignList 본문)을 반환합니다."""
+        self.refresh(db)
+        with self._lock:
+            cache_key = (self.version, order, skip, limit)
+            cached = self._pages.get(cache_key)
+            if cached is not None:
+                self._pages.move_to_end(cache_key)
+                return cached
+
+            entries = self._sorted[order][skip:skip + limit]
+            body = dumps_json({
+                "total": len(self._items),
+                "items": [self._items[entry[-1]] for entry in entries],
+            })
+            # 워커마다 version이 다를 수 있으므로 ETag는 본문 해시로 만듭니다.
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            self._pages[cache_key] = (etag, body)
+            if len(self._pages) > self.page_cache_size:
+                self._pages.popitem(last=False)
+            return etag, body
+
+campaign_feed = CampaignFeed()
@@ -0,0 +1,267 @@
+from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import asyncio
+import enum
+import heapq
+import logging
+import threading
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from app.core.campaign_selection import run_selection
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.db.database import SessionLocal
+from app.models.campaign import Campaign, CampaignSchedule, CampaignStatus
+
+logger = logging.getLogger(__name__)
+
+class TransitionKind(str, enum.Enum):
+    ACTIVATE = "activate"  # 신청 시작일: DRAFT → ACTIVE
+    SELECT = "select"  # 인플루언서 발표일: 신청자 선정
+    COMPLETE = "complete"  # 결과 발표일: ACTIVE → COMPLETED
+
+@dataclass(order=True)
+class Transition:
+    at: datetime
+    kind: TransitionKind = field(compare=False)
+    campaign_id: int = field(compare=False)
+
+class CampaignLifecycleScheduler:
+    """
+    CampaignSchedule 날짜로 캠페인 상태 전환을 예약 실행합니다.
+
+    - horizon 안에 도래하는 전환만 읽어 시각 순 힙에 넣고, 가장 이른 전환 시각까지 잠듭니다.
+    - 같은 시각대에 몰린 전환은 종류별로 묶어 UPDATE 한 번으로 반영합니다.
+    - UPDATE 조건에 현재 상태와 일정 날짜를 함께 걸어 두었으므로, 일정이 바뀌어 힙에 남은
+      오래된 항목이 실행되더라도 아무 행도 바뀌지 않습니다. 여러 프로세스가 동시에 돌아도 안전합니다.
+    - 일정이 생성/수정되면 같은 프로세스의 스케줄러에는 notify()로 바로 예약하고, 다른 프로세스의
+      스케줄러는 reload_interval마다 전체를 다시 읽을 때 반영합니다. (일정 반영 지연은 최대 reload_interval)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        horizon: timedelta = timedelta(hours=24),
+        reload_interval: timedelta = timedelta(minutes=settings.CAMPAIGN_SCHEDULER_RELOAD_MINUTES),
+    ):
+        self.session_factory = session_factory
+        self.horizon = horizon
+        self.reload_interval = reload_interval
+        self._heap: List[Transition] = []
+        # notify()는 요청 처리 스레드에서 호출되므로 힙 접근은 잠금으로 보호합니다.
+        self._heap_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def load(self, db: Session, *, now: Optional[datetime] = None, campaign_id: Optional[int] = None) -> int:
+        """horizon 안에 도래하는 전환을 힙에 넣고, 넣은 개수를 반환합니다."""
+        now = now or datetime.utcnow()
+        until = now + self.horizon
+        query = db.query(
+            CampaignSchedule.campaign_id,
+            Campaign.status,
+            CampaignSchedule.application_start_date,
+            CampaignSchedule.influencer_announcement_date,
+            CampaignSchedule.result_announcement_date,
+            CampaignSchedule.selected_at,
+        ).join(Campaign, Campaign.id == CampaignSchedule.campaign_id).filter(
+            Campaign.status.in_([CampaignStatus.DRAFT, CampaignStatus.ACTIVE]),
+        )
+        if campaign_id is not None:
+            query = query.filter(CampaignSchedule.campaign_id == campaign_id)
+        else:
+            # 전환 종류마다 해당 상태 조건을 함께 걸어, 이미 지난 날짜만으로 진행 중인 캠페인 전체가 다시 읽히지 않게 합니다.
+            query = query.filter(
+                ((Campaign.status == CampaignStatus.DRAFT) & (CampaignSchedule.application_start_date <= until))
+                | ((CampaignSchedule.selected_at == None) & (CampaignSchedule.influencer_announcement_date <= until))
+                | ((Campaign.status == CampaignStatus.ACTIVE) & (CampaignSchedule.result_announcement_date <= until))
+            )
+
+        transitions: List[Transition] = []
+        for row in query:
+            candidates = []
+            if row.status == CampaignStatus.DRAFT:
+                candidates.append((row.application_start_date, TransitionKind.ACTIVATE))
+            if row.selected_at is None:
+                candidates.append((row.influencer_announcement_date, TransitionKind.SELECT))
+            candidates.append((row.result_announcement_date, TransitionKind.COMPLETE))
+            for at, kind in candidates:
+                if at is not None and at <= until:
+                    transitions.append(Transition(at=at, kind=kind, campaign_id=row.campaign_id))
+        with self._heap_lock:
+            for transition in transitions:
+                heapq.heappush(self._heap, transition)
+        return len(transitions)
+
+    def notify(self, campaign_id: int) -> None:
+        """
+        일정이 생성/수정된 캠페인을 즉시 다시 예약합니다.
+        이 프로세스에서 run_forever()가 돌고 있을 때만 동작합니다. 스케줄러가 다른 프로세스
+        (CAMPAIGN_SCHEDULER_ENABLED인 워커나 별도 실행)에 있으면 아무 일도 하지 않으며,
+        새 일정은 그쪽의 다음 전체 로드(최대 CAMPAIGN_SCHEDULER_RELOAD_MINUTES 뒤)에 반영됩니다.
+        """
+        if self._loop is None or self._wakeup is None:
+            return
+        db = self.session_factory()
+        try:
+            self.load(db, campaign_id=campaign_id)
+        finally:
+            db.close()
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def next_due_at(self) -> Optional[datetime]:
+        with self._heap_lock:
+            return self._heap[0].at if self._heap else None
+
+    def pop_due(self, now: datetime) -> Dict[TransitionKind, List[int]]:
+        due: Dict[TransitionKind, List[int]] = {kind: [] for kind in TransitionKind}
+        with self._heap_lock:
+            while self._heap and self._heap[0].at <= now:
+                transition = heapq.heappop(self._heap)
+                if transition.campaign_id not in due[transition.kind]:
+                    due[transition.kind].append(transition.campaign_id)
+        return due
+
+    def clear(self) -> None:
+        with self._heap_lock:
+            self._heap.clear()
+
+    def apply(self, db: Session, due: Dict[TransitionKind, List[int]], *, now: datetime) -> Dict[TransitionKind, int]:
+        """
+        도래한 전환을 활성화 → 선정 → 종료 순서로 반영합니다. 활성화/종료는 종류별 UPDATE 한 번씩,
+        선정은 캠페인별로 실행합니다. 스케줄러가 멈춰 있다가 두 날짜가 모두 지난 뒤 돌아와도
+        신청자 선정이 끝난 다음에 캠페인이 종료됩니다.
+        """
+        applied = {kind: 0 for kind in TransitionKind}
+        if due[TransitionKind.ACTIVATE]:
+            applied[TransitionKind.ACTIVATE] = self._update_status(
+                db,
+                due[TransitionKind.ACTIVATE],
+                CampaignStatus.DRAFT,
+                CampaignStatus.ACTIVE,
+                CampaignSchedule.application_start_date <= now,
+                now=now,
+            )
+
+        # 발표일이 미뤄진 경우 힙에 남은 이전 항목으로 먼저 선정하지 않도록 다시 확인합니다.
+        select_ids = [
+            row.campaign_id for row in db.query(CampaignSchedule.campaign_id).filter(
+                CampaignSchedule.campaign_id.in_(due[TransitionKind.SELECT]),
+                CampaignSchedule.influencer_announcement_date <= now,
+                CampaignSchedule.selected_at == None,
+            )
+        ] if due[TransitionKind.SELECT] else []
+        for campaign_id in select_ids:
+            try:
+                if run_selection(db, campaign_id=campaign_id, now=now):
+                    applied[TransitionKind.SELECT] += 1
+            except Exception as e:
+                logger.error(f"Campaign selection failed (campaign_id={campaign_id}): {str(e)}")
+
+        if due[TransitionKind.COMPLETE]:
+            applied[TransitionKind.COMPLETE] = self._update_status(
+                db,
+                due[TransitionKind.COMPLETE],
+                CampaignStatus.ACTIVE,
+                CampaignStatus.COMPLETED,
+                and_(
+                    CampaignSchedule.result_announcement_date <= now,
+                    # 선정이 실패해 아직 남아 있으면 종료하지 않고 다음 로드에서 선정부터 다시 시도합니다.
+                    or_(
+                        CampaignSchedule.selected_at != None,
+                        CampaignSchedule.influencer_announcement_date == None,
+                        CampaignSchedule.influencer_announcement_date > now,
+                    ),
+                ),
+                now=now,
+            )
+        return applied
+
+    def _update_status(
+        self,
+        db: Session,
+        campaign_ids: List[int],
+        from_status: CampaignStatus,
+        to_status: CampaignStatus,
+        date_reached,
+        *,
+        now: datetime,
+    ) -> int:
+        try:
+            rowcount = db.execute(
+                update(Campaign)
+                .where(
+                    Campaign.id.in_(campaign_ids),
+                    Campaign.status == from_status,
+                    CampaignSchedule.campaign_id == Campaign.id,
+                    date_reached,
+                )
+                .values(status=to_status, updated_at=now)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        response_cache.invalidate(*(f"campaign:{campaign_id}" for campaign_id in campaign_ids))
+        return rowcount
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[TransitionKind, int]:
+        """지금까지 도래한 전환을 한 번 처리합니다. (cron 등 외부 스케줄러용)"""
+        now = now or datetime.utcnow()
+        db = self.session_factory()
+        try:
+            self.clear()
+            self.load(db, now=now)
+            return self.apply(db, self.pop_due(now), now=now)
+        finally:
+            db.close()
+
+    async def run_forever(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        reload_at = datetime.min
+        while True:
+            now = datetime.utcnow()
+            if now >= reload_at:
+                self.clear()
+                await asyncio.to_thread(self._load_in_session, now)
+                reload_at = now + self.reload_interval
+
+            due = self.pop_due(now)
+            if any(due.values()):
+                try:
+                    applied = await asyncio.to_thread(self._apply_in_session, due, now)
+                    logger.info(f"Campaign transitions applied: {applied}")
+                except Exception as e:
+                    logger.error(f"Campaign transitions failed: {str(e)}")
+
+            next_at = min(filter(None, [self.next_due_at(), reload_at]))
+            timeout = max((next_at - datetime.utcnow()).total_seconds(), 0)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _load_in_session(self, now: datetime) -> None:
+        db = self.session_factory()
+        try:
+            self.load(db, now=now)
+        finally:
+            db.close()
+
+    def _apply_in_session(self, due: Dict[TransitionKind, List[int]], now: datetime) -> Dict[TransitionKind, int]:
+        db = self.session_factory()
+        try:
+            return self.apply(db, due, now=now)
+        finally:
+            db.close()
+
+lifecycle_scheduler = CampaignLifecycleScheduler(SessionLocal)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(lifecycle_scheduler.run_forever())
@@ -0,0 +1,207 @@
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import math
+import random
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.campaign import ApplicationStatus, Campaign, CampaignApplication, CampaignSchedule, SelectionMethod
+from app.models.review import ReviewContent, ReviewStatus
+from app.models.social_channel import SocialChannel
+
+logger = logging.getLogger(__name__)
+
+# 점수 = 가중합(팔로워 규모, 참여율, 과거 리뷰 완료율). 각 항목은 0~1로 정규화합니다.
+SCORE_WEIGHTS = {"followers": 0.4, "engagement": 0.35, "completion": 0.25}
+ENGAGEMENT_CAP = 10.0  # 참여율 10% 이상은 만점
+# 리뷰 이력이 적은 신규 인플루언서의 완료율은 사전값(0.5, 리뷰 2건 분량)으로 보정합니다.
+COMPLETION_PRIOR = 0.5
+COMPLETION_PRIOR_WEIGHT = 2
+MIN_LOTTERY_WEIGHT = 0.01
+
+@dataclass
+class ApplicantFeatures:
+    application_id: int
+    user_id: int
+    followers: int = 0
+    engagement_rate: float = 0.0
+    reviews: int = 0
+    completed_reviews: int = 0
+
+@dataclass
+class SelectionResult:
+    campaign_id: int
+    method: SelectionMethod
+    selected: int
+    waitlisted: int
+    rejected: int
+    selected_at: datetime
+
+def load_features(db: Session, campaign_id: int) -> List[ApplicantFeatures]:
+    """대기 중인 신청자 전체의 점수 계산용 지표를 그룹 쿼리 세 번으로 가져옵니다."""
+    applicants = {
+        row.user_id: ApplicantFeatures(application_id=row.id, user_id=row.user_id)
+        for row in db.query(CampaignApplication.id, CampaignApplication.user_id).filter(
+            CampaignApplication.campaign_id == campaign_id,
+            CampaignApplication.status == ApplicationStatus.PENDING.value,
+        )
+    }
+    if not applicants:
+        return []
+    user_ids = list(applicants)
+
+    for row in db.query(
+        SocialChannel.user_id,
+        func.coalesce(func.sum(SocialChannel.followers_count), 0).label("followers"),
+        func.coalesce(func.max(SocialChannel.engagement_rate), 0).label("engagement_rate"),
+    ).filter(
+        SocialChannel.user_id.in_(user_ids),
+        SocialChannel.is_active == True,
+    ).group_by(SocialChannel.user_id):
+        applicants[row.user_id].followers = int(row.followers)
+        applicants[row.user_id].engagement_rate = float(row.engagement_rate)
+
+    # 완료율의 분모는 승인 이후 단계까지 간 리뷰 (초안/제출 중인 리뷰는 제외)
+    for row in db.query(
+        ReviewContent.influencer_id,
+        func.count(ReviewContent.id).label("reviews"),
+        func.sum(case((ReviewContent.status == ReviewStatus.COMPLETED, 1), else_=0)).label("completed"),
+    ).filter(
+        ReviewContent.influencer_id.in_(user_ids),
+        ReviewContent.status.in_([ReviewStatus.APPROVED, ReviewStatus.COMPLETED]),
+    ).group_by(ReviewContent.influencer_id):
+        applicants[row.influencer_id].reviews = int(row.reviews)
+        applicants[row.influencer_id].completed_reviews = int(row.completed or 0)
+
+    return list(applicants.values())
+
+def score_applicants(features: List[ApplicantFeatures]) -> Dict[int, float]:
+    """신청 id별 점수(0~1). 팔로워 수는 로그 스케일로 신청자 중 최댓값 대비 정규화합니다."""
+    max_followers = max((math.log1p(f.followers) for f in features), default=0.0)
+    scores: Dict[int, float] = {}
+    for f in features:
+        followers = math.log1p(f.followers) / max_followers if max_followers else 0.0
+        engagement = min(f.engagement_rate / ENGAGEMENT_CAP, 1.0)
+        completion = (f.completed_reviews + COMPLETION_PRIOR * COMPLETION_PRIOR_WEIGHT) / (
+            f.reviews + COMPLETION_PRIOR_WEIGHT
+        )
+        scores[f.application_id] = round(
+            SCORE_WEIGHTS["followers"] * followers
+            + SCORE_WEIGHTS["engagement"] * engagement
+            + SCORE_WEIGHTS["completion"] * completion,
+            6,
+        )
+    return scores
+
+def rank_applicants(scores: Dict[int, float], method: SelectionMethod, rng: random.Random) -> List[int]:
+    """
+    신청 id를 선정 순서대로 정렬합니다.
+
+    - TOP_N: 점수 내림차순 (동점은 먼저 신청한 순)
+    - LOTTERY: 점수 가중 비복원 추첨. 각 신청자에 u^(1/w) 키를 뽑아 내림차순 정렬하는
+      Efraimidis–Spirakis 방식이라 한 번의 정렬로 전체 추첨 순서가 정해집니다.
+    앞에서부터 선정 → 대기 → 탈락 순으로 나뉩니다.
+    """
+    if method == SelectionMethod.LOTTERY:
+        keys = {
+            application_id: rng.random() ** (1.0 / max(score, MIN_LOTTERY_WEIGHT))
+            for application_id, score in sorted(scores.items())
+        }
+        return sorted(keys, key=lambda application_id: -keys[application_id])
+    return sorted(scores, key=lambda application_id: (-scores[application_id], application_id))
+
+def run_selection(db: Session, *, campaign_id: int, now: Optional[datetime] = None) -> Optional[SelectionResult]:
+    """
+    캠페인 하나의 선정을 실행합니다. 이미 선정했거나 일정이 없으면 None을 반환합니다.
+    일정 행을 잠근 채로 점수를 계산하고 모든 신청의 상태를 한 번의 벌크 UPDATE로 기록합니다.
+    """
+    now = now or datetime.utcnow()
+    schedule = db.query(CampaignSchedule).filter(
+        CampaignSchedule.campaign_id == campaign_id,
+        CampaignSchedule.selected_at == None,
+    ).with_for_update().first()
+    if schedule is None:
+        db.rollback()
+        return None
+
+    scores = score_applicants(load_features(db, campaign_id))
+    # 추첨 결과를 재현할 수 있도록 캠페인과 발표일로 시드를 고정합니다.
+    rng = random.Random(f"{campaign_id}:{schedule.influencer_announcement_date.isoformat()}")
+    ordered = rank_applicants(scores, schedule.selection_method, rng)
+
+    selected_count = min(schedule.selected_applicants, len(ordered))
+    waitlist_end = min(selected_count + (schedule.waitlist_size or 0), len(ordered))
+    rows = []
+    for position, application_id in enumerate(ordered):
+        if position < selected_count:
+            status, waitlist_rank = ApplicationStatus.APPROVED, None
+        elif position < waitlist_end:
+            status, waitlist_rank = ApplicationStatus.WAITLISTED, position - selected_count + 1
+        else:
+            status, waitlist_rank = ApplicationStatus.REJECTED, None
+        rows.append({
+            "id": application_id,
+            "status": status.value,
+            "score": scores[application_id],
+            "waitlist_rank": waitlist_rank,
+            "updated_at": now,
+        })
+
+    rejected = len(ordered) - waitlist_end
+    try:
+        if rows:
+            db.execute(update(CampaignApplication), rows)
+        if rejected:
+            # 탈락한 신청은 정원에서 빠집니다. (crud_campaign.RELEASED_STATUSES와 같은 규칙)
+            db.execute(
+                update(Campaign)
+                .where(Campaign.id == campaign_id)
+                .values(current_applications=func.greatest(Campaign.current_applications - rejected, 0))
+                .execution_options(synchronize_session=False)
+            )
+        schedule.selected_at = now
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return SelectionResult(
+        campaign_id=campaign_id,
+        method=schedule.selection_method,
+        selected=selected_count,
+        waitlisted=waitlist_end - selected_count,
+        rejected=rejected,
+        selected_at=now,
+    )
+
+def run_due_selections(now: Optional[datetime] = None) -> List[SelectionResult]:
+    """발표 시각이 지났고 아직 선정하지 않은 모든 캠페인을 처리합니다. (주기 실행용)"""
+    now = now or datetime.utcnow()
+    db = SessionLocal()
+    results: List[SelectionResult] = []
+    try:
+        campaign_ids = [
+            row.campaign_id for row in db.query(CampaignSchedule.campaign_id).filter(
+                CampaignSchedule.influencer_announcement_date <= now,
+                CampaignSchedule.selected_at == None,
+            ).order_by(CampaignSchedule.influencer_announcement_date)
+        ]
+        for campaign_id in campaign_ids:
+            try:
+                result = run_selection(db, campaign_id=campaign_id, now=now)
+            except Exception as e:
+                logger.error(f"Campaign selection failed (campaign_id={campaign_id}): {str(e)}")
+                continue
+            if result:
+                results.append(result)
+    finally:
+        db.close()
+    logger.info(f"Campaign selection finished: {len(results)} campaigns")
+    return results
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for result in run_due_selections():
+        print(result)
@@ -0,0 +1,143 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass
+import hashlib
+import threading
+import time
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.responses import dumps_json
+from app.models.category import Category
+
+@dataclass(frozen=True)
+class CategoryNode:
+    id: int
+    name: str
+    description: Optional[str]
+    parent_id: Optional[int]
+    depth: int
+    lft: int  # 오일러 투어 진입 순번 (nested set 왼쪽 값)
+    rgt: int  # 오일러 투어 이탈 순번 (nested set 오른쪽 값)
+    children: Tuple[int, ...]
+
+class CategoryTree:
+    """
+    활성 카테고리 트리의 불변 스냅샷.
+
+    - 루트부터 깊이 우선으로 한 번 순회하며 각 노드에 [lft, rgt] 구간을 매기므로
+      "a가 b의 하위인가"는 구간 포함 비교 한 번입니다.
+    - 노드별 하위 id 집합(자기 자신 포함)을 미리 계산해 두어 상위 카테고리로 캠페인을
+      거를 때 재귀 쿼리 없이 IN 조건 하나로 끝납니다.
+    - 비활성(삭제) 카테고리와 그 하위는 트리에서 제외됩니다.
+    """
+
+    def __init__(self, rows: List[Tuple[int, str, Optional[str], Optional[int]]]):
+        by_parent: Dict[Optional[int], List[Tuple[int, str, Optional[str], Optional[int]]]] = {}
+        for row in sorted(rows, key=lambda row: (row[1] or "", row[0])):
+            by_parent.setdefault(row[3], []).append(row)
+
+        nodes: Dict[int, CategoryNode] = {}
+        descendants: Dict[int, FrozenSet[int]] = {}
+        counter = 0
+        # (row, depth, 진입 여부) 스택으로 순회하므로 트리가 깊어도 재귀 한도에 걸리지 않습니다.
+        stack: List[Tuple[Tuple[int, str, Optional[str], Optional[int]], int, bool]] = [
+            (row, 0, False) for row in reversed(by_parent.get(None, []))
+        ]
+        lft: Dict[int, int] = {}
+        while stack:
+            row, depth, exiting = stack.pop()
+            category_id = row[0]
+            if exiting:
+                children = tuple(child[0] for child in by_parent.get(category_id, []))
+                nodes[category_id] = CategoryNode(
+                    id=category_id,
+                    name=row[1],
+                    description=row[2],
+                    parent_id=row[3],
+                    depth=depth,
+                    lft=lft[category_id],
+                    rgt=counter,
+                    children=children,
+                )
+                descendants[category_id] = frozenset(
+                    {category_id}.union(*(descendants[child] for child in children))
+                )
+                counter += 1
+                continue
+            lft[category_id] = counter
+            counter += 1
+            stack.append((row, depth, True))
+            for child in reversed(by_parent.get(category_id, [])):
+                stack.append((child, depth + 1, False))
+
+        self.nodes = nodes
+        self.descendants = descendants
+        self.roots: Tuple[int, ...] = tuple(row[0] for row in by_parent.get(None, []))
+        self.body = dumps_json([self._serialize(root) for root in self.roots])
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+
+    def _serialize(self, category_id: int) -> dict:
+        node = self.nodes[category_id]
+        return {
+            "id": node.id,
+            "name": node.name,
+            "description": node.description,
+            "parent_id": node.parent_id,
+            "depth": node.depth,
+            "lft": node.lft,
+            "rgt": node.rgt,
+            "children": [self._serialize(child) for child in node.children],
+        }
+
+    def __contains__(self, category_id: int) -> bool:
+        return category_id in self.nodes
+
+    def is_descendant(self, category_id: int, ancestor_id: int) -> bool:
+        node, ancestor = self.nodes.get(category_id), self.nodes.get(ancestor_id)
+        if node is None or ancestor is None:
+            return False
+        return ancestor.lft <= node.lft and node.rgt <= ancestor.rgt
+
+    def descendant_ids(self, category_id: int) -> FrozenSet[int]:
+        """자기 자신을 포함한 모든 하위 카테고리 id. 트리에 없으면 빈 집합입니다."""
+        return self.descendants.get(category_id, frozenset())
+
+    def ancestor_ids(self, category_id: int) -> List[int]:
+        """루트부터 자기 자신까지의 경로"""
+        path = []
+        node = self.nodes.get(category_id)
+        while node is not None:
+            path.append(node.id)
+            node = self.nodes.get(node.parent_id) if node.parent_id is not None else None
+        return list(reversed(path))
+
+class CategoryTreeCache:
+    """
+    CategoryTree 스냅샷을 프로세스에 하나 두고 통째로 교체합니다.
+    읽기는 잠금 없이 현재 참조만 가져가며, 카테고리 쓰기 후 invalidate()로 다음 읽기에서 다시 만듭니다.
+    다른 워커의 쓰기는 ttl이 지나면 반영됩니다.
+    """
+
+    def __init__(self, *, ttl: float = settings.CATEGORY_TREE_TTL):
+        self.ttl = ttl
+        self._tree: Optional[CategoryTree] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> CategoryTree:
+        tree = self._tree
+        if tree is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return tree
+        with self._lock:
+            if self._tree is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._tree
+            rows = db.query(
+                Category.id, Category.name, Category.description, Category.parent_id
+            ).filter(Category.is_active == True).all()
+            self._tree = CategoryTree([tuple(row) for row in rows])
+            self._loaded_at = time.monotonic()
+            return self._tree
+
+    def invalidate(self) -> None:
+        self._loaded_at = 0.0
+
+category_tree = CategoryTreeCache()
@@ -0,0 +1,283 @@
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import asyncio
+import json
+import logging
+import random
+import xml.etree.ElementTree as ET
+import httpx
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+from app.core.batch_runner import BatchResult, Lane, RateLimitedBatchRunner, RateLimiter
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.crud.crud_social_channel import social_channel as crud_social_channel
+from app.models.campaign import Campaign, CampaignApplication, CampaignStatus
+from app.models.social_channel import SocialChannel, SocialPlatform
+from app.schemas.social_channel import SocialChannelSnapshot
+
+logger = logging.getLogger(__name__)
+
+@dataclass(order=True)
+class SyncTarget:
+    """동기화 대상 채널. 워커 간에 ORM 객체 대신 전달되는 값 객체입니다."""
+    priority: tuple
+    channel_id: int = field(compare=False)
+    platform: str = field(compare=False)
+    channel_url: str = field(compare=False)
+    channel_name: Optional[str] = field(default=None, compare=False)
+    platform_data: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+class ChannelAdapter:
+    """플랫폼 어댑터 기본 클래스. fetch()로 채널 지표 스냅샷을 가져옵니다."""
+    platform: str = ""
+    rate_per_second: float = 5.0
+    burst: int = 5
+    timeout: float = 10.0
+
+    async def fetch(self, client: httpx.AsyncClient, target: SyncTarget) -> SocialChannelSnapshot:
+        raise NotImplementedError
+
+class NaverBlogAdapter(ChannelAdapter):
+    """
+    네이버 블로그 RSS로 채널이 살아 있는지만 확인합니다. (공개 통계 API 없음)
+    RSS는 최근 글 일부만 담고 있어 전체 포스트 수를 알 수 없으므로 posts는 갱신하지 않습니다.
+    """
+    platform = SocialPlatform.NAVER.value
+    rate_per_second = 2.0
+    burst = 2
+
+    async def fetch(self, client: httpx.AsyncClient, target: SyncTarget) -> SocialChannelSnapshot:
+        blog_id = target.platform_data.get("blog_id") or target.channel_url.rstrip("/").rsplit("/", 1)[-1]
+        response = await client.get(f"https://rss.blog.naver.com/{blog_id}.xml", timeout=self.timeout)
+        response.raise_for_status()
+        ET.fromstring(response.content)  # 올바른 RSS인지만 확인
+        return SocialChannelSnapshot(
+            channel_id=target.channel_id,
+            synced_at=datetime.utcnow(),
+        )
+
+class InstagramAdapter(ChannelAdapter):
+    """Instagram Graph API (비즈니스/크리에이터 계정)"""
+    platform = SocialPlatform.INSTAGRAM.value
+    rate_per_second = 1.0
+    burst = 3
+
+    async def fetch(self, client: httpx.AsyncClient, target: SyncTarget) -> SocialChannelSnapshot:
+        user_id = target.platform_data["ig_user_id"]
+        response = await client.get(
+            f"https://graph.facebook.com/v19.0/{user_id}",
+            params={
+                "fields": "followers_count,media_count",
+                "access_token": target.platform_data["access_token"],
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return SocialChannelSnapshot(
+            channel_id=target.channel_id,
+            followers_count=data.get("followers_count", 0),
+            posts=data.get("media_count", 0),
+            synced_at=datetime.utcnow(),
+        )
+
+class YouTubeAdapter(ChannelAdapter):
+    """YouTube Data API v3 channels.list(statistics)"""
+    platform = SocialPlatform.YOUTUBE.value
+    rate_per_second = 10.0
+    burst = 10
+
+    async def fetch(self, client: httpx.AsyncClient, target: SyncTarget) -> SocialChannelSnapshot:
+        response = await client.get(
+            "https://www.googleapis.com/youtube/v3/channels",
+            params={
+                "part": "statistics",
+                "id": target.platform_data["channel_id"],
+                "key": settings.YOUTUBE_API_KEY,
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        items = response.json().get("items") or []
+        if not items:
+            raise ValueError(f"YouTube 채널을 찾을 수 없습니다. (channel_id={target.channel_id})")
+        statistics = items[0]["statistics"]
+        video_count = int(statistics.get("videoCount", 0))
+        view_count = int(statistics.get("viewCount", 0))
+        return SocialChannelSnapshot(
+            channel_id=target.channel_id,
+            followers_count=int(statistics.get("subscriberCount", 0)),
+            posts=video_count,
+            average_views=view_count // video_count if video_count else 0,
+            total_views=view_count,
+            synced_at=datetime.utcnow(),
+        )
+
+class FakeChannelAdapter(ChannelAdapter):
+    """
+    오프라인 테스트용 어댑터. 네트워크 없이 채널 id 기반의 결정적인 지표를 반환하며
+    지연 시간과 실패 확률을 설정할 수 있습니다. 호출된 채널 id는 calls에 기록됩니다.
+    """
+    rate_per_second = 1000.0
+    burst = 1000
+
+    def __init__(self, platform: str, *, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.platform = platform
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls: List[int] = []
+        self._random = random.Random(seed)
+
+    async def fetch(self, client: httpx.AsyncClient, target: SyncTarget) -> SocialChannelSnapshot:
+        self.calls.append(target.channel_id)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._random.random() < self.failure_rate:
+            raise RuntimeError(f"fake failure (channel_id={target.channel_id})")
+        return SocialChannelSnapshot(
+            channel_id=target.channel_id,
+            followers_count=1000 + target.channel_id * 10,
+            posts=target.channel_id % 500,
+            average_views=100 + target.channel_id,
+            engagement_rate=round((target.channel_id % 100) / 10, 2),
+            synced_at=datetime.utcnow(),
+        )
+
+DEFAULT_ADAPTERS: List[ChannelAdapter] = [NaverBlogAdapter(), InstagramAdapter(), YouTubeAdapter()]
+
+class ChannelSyncScheduler:
+    """
+    오래된(stale) 채널을 찾아 플랫폼 어댑터로 지표를 새로 가져옵니다.
+
+    - 우선순위: 진행 중인 캠페인에 참여한 인플루언서의 채널 → 마지막 동기화가 오래된 순 (SQL ORDER BY)
+    - 대상을 불러올 때 last_sync_attempt_at을 찍어 두므로, 실패한 채널은 retry_after가 지나야 다시 시도
+    - 플랫폼별 레인과 토큰 버킷은 RateLimitedBatchRunner(app.core.batch_runner)가 처리
+    - 수집된 스냅샷은 social_channel.apply_snapshots()로 묶음 반영 (ChannelAnalytics/롤업 포함)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        adapters: Optional[List[ChannelAdapter]] = None,
+        workers: int = settings.CHANNEL_SYNC_WORKERS,
+        stale_after: timedelta = timedelta(hours=settings.CHANNEL_SYNC_STALE_HOURS),
+        batch_size: int = settings.CHANNEL_SYNC_BATCH_SIZE,
+        retry_after: timedelta = timedelta(minutes=settings.CHANNEL_SYNC_RETRY_MINUTES),
+        flush_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.adapters = {adapter.platform: adapter for adapter in (adapters or DEFAULT_ADAPTERS)}
+        self.limiters = {
+            platform: RateLimiter(adapter.rate_per_second, adapter.burst)
+            for platform, adapter in self.adapters.items()
+        }
+        self.stale_after = stale_after
+        self.batch_size = batch_size
+        self.retry_after = retry_after
+        self.runner = RateLimitedBatchRunner(
+            self._apply_in_session,
+            workers=workers,
+            flush_size=flush_size,
+            name="ChannelSync",
+            describe=lambda target: f"channel_id={target.channel_id}",
+        )
+
+    def load_targets(self, db: Session, *, now: Optional[datetime] = None) -> List[SyncTarget]:
+        """동기화가 필요한 채널을 우선순위와 함께 조회합니다."""
+        now = now or datetime.utcnow()
+        threshold = now - self.stale_after
+        active_users = select(CampaignApplication.user_id).join(
+            Campaign, Campaign.id == CampaignApplication.campaign_id
+        ).where(Campaign.status == CampaignStatus.ACTIVE)
+        campaign_priority = case((SocialChannel.user_id.in_(active_users), 0), else_=1)
+        channels = db.query(
+            SocialChannel.id,
+            SocialChannel.platform,
+            SocialChannel.channel_url,
+            SocialChannel.channel_name,
+            SocialChannel.last_sync_at,
+            SocialChannel.platform_specific_data,
+            campaign_priority.label("campaign_priority"),
+        ).filter(
+            SocialChannel.is_active == True,
+            SocialChannel.platform.in_(list(self.adapters)),
+            (SocialChannel.last_sync_at == None) | (SocialChannel.last_sync_at < threshold),
+            (SocialChannel.last_sync_attempt_at == None)
+            | (SocialChannel.last_sync_attempt_at < now - self.retry_after),
+        ).order_by(campaign_priority, SocialChannel.last_sync_at.asc()).limit(self.batch_size).all()
+
+        targets = []
+        for channel in channels:
+            try:
+                platform_data = json.loads(channel.platform_specific_data or "{}")
+            except ValueError:
+                platform_data = {}
+            platform = getattr(channel.platform, "value", channel.platform)
+            targets.append(SyncTarget(
+                priority=(channel.campaign_priority, channel.last_sync_at or datetime.min),
+                channel_id=channel.id,
+                platform=platform,
+                channel_url=channel.channel_url or "",
+                channel_name=channel.channel_name,
+                platform_data=platform_data,
+            ))
+        return targets
+
+    def mark_attempted(self, db: Session, targets: List[SyncTarget], *, now: Optional[datetime] = None) -> None:
+        """
+        불러온 대상에 시도 시각을 기록합니다. 실패한 채널이 매 회차 맨 앞에 다시 오지 않고,
+        겹쳐 실행된 회차가 같은 채널을 중복으로 가져가지도 않습니다.
+        """
+        if not targets:
+            return
+        db.execute(
+            update(SocialChannel)
+            .where(SocialChannel.id.in_([target.channel_id for target in targets]))
+            .values(last_sync_attempt_at=now or datetime.utcnow())
+        )
+        db.commit()
+
+    async def run(self, targets: Optional[List[SyncTarget]] = None) -> BatchResult:
+        """동기화 한 회차를 실행합니다."""
+        if targets is None:
+            targets = await asyncio.to_thread(self._load_targets_in_session)
+
+        lanes: Dict[str, Lane] = {}
+        skipped = 0
+        for target in sorted(targets):
+            adapter = self.adapters.get(target.platform)
+            if adapter is None:
+                skipped += 1
+                continue
+            lane = lanes.setdefault(target.platform, Lane(self.limiters[target.platform], adapter.fetch))
+            lane.items.append(target)
+
+        result = await self.runner.run(lanes, skipped=skipped)
+        logger.info(f"Channel sync finished: {result}")
+        return result
+
+    def _load_targets_in_session(self) -> List[SyncTarget]:
+        db = self.session_factory()
+        try:
+            targets = self.load_targets(db)
+            self.mark_attempted(db, targets)
+            return targets
+        finally:
+            db.close()
+
+    def _apply_in_session(self, snapshots: List[SocialChannelSnapshot]) -> None:
+        db = self.session_factory()
+        try:
+            crud_social_channel.apply_snapshots(db, snapshots=snapshots)
+        finally:
+            db.close()
+
+async def run_channel_sync() -> BatchResult:
+    return await ChannelSyncScheduler(SessionLocal).run()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(asyncio.run(run_channel_sync()))
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
 import os
+import tempfile
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -31,6 +32,66 @@ class Settings(BaseSettings):
     KAKAO_CLIENT_ID: Optional[str] = os.getenv("KAKAO_CLIENT_ID")
     KAKAO_CLIENT_SECRET: Optional[str] = os.getenv("KAKAO_CLIENT_SECRET")
 
+    # 소셜 채널 동기화 설정
+    YOUTUBE_API_KEY: Optional[str] = os.getenv("YOUTUBE_API_KEY")
+    CHANNEL_SYNC_STALE_HOURS: int = int(os.getenv("CHANNEL_SYNC_STALE_HOURS", "24"))
+    CHANNEL_SYNC_WORKERS: int = int(os.getenv("CHANNEL_SYNC_WORKERS", "16"))  # 플랫폼별 워커 수
+    CHANNEL_SYNC_BATCH_SIZE: int = int(os.getenv("CHANNEL_SYNC_BATCH_SIZE", "5000"))
+    CHANNEL_SYNC_RETRY_MINUTES: int = int(os.getenv("CHANNEL_SYNC_RETRY_MINUTES", "60"))  # 실패한 채널 재시도 간격
+
+    # 리뷰 반응 지표 갱신 설정
+    REVIEW_METRICS_STALE_HOURS: int = int(os.getenv("REVIEW_METRICS_STALE_HOURS", "6"))
+    REVIEW_METRICS_WORKERS: int = int(os.getenv("REVIEW_METRICS_WORKERS", "16"))
+    REVIEW_METRICS_BATCH_SIZE: int = int(os.getenv("REVIEW_METRICS_BATCH_SIZE", "5000"))
+    REVIEW_METRICS_RETRY_MINUTES: int = int(os.getenv("REVIEW_METRICS_RETRY_MINUTES", "60"))  # 실패한 리뷰 재시도 간격
+    REVIEW_ANALYTICS_CACHE_TTL: int = int(os.getenv("REVIEW_ANALYTICS_CACHE_TTL", "300"))
+
+    # 캠페인 일정 스케줄러 설정
+    CAMPAIGN_SCHEDULER_ENABLED: bool = os.getenv("CAMPAIGN_SCHEDULER_ENABLED", "false").lower() == "true"
+    CAMPAIGN_SCHEDULER_RELOAD_MINUTES: int = int(os.getenv("CAMPAIGN_SCHEDULER_RELOAD_MINUTES", "5"))  # 다른 프로세스에서 바꾼 일정의 최대 반영 지연
+    CAMPAIGN_FEED_REFRESH_SECONDS: float = float(os.getenv("CAMPAIGN_FEED_REFRESH_SECONDS", "5"))
+    CAMPAIGN_FEED_OVERLAP_SECONDS: float = float(os.getenv("CAMPAIGN_FEED_OVERLAP_SECONDS", "30"))  # 늦게 커밋된 수정을 다시 읽는 구간
+    CAMPAIGN_FEED_RECONCILE_SECONDS: float = float(os.getenv("CAMPAIGN_FEED_RECONCILE_SECONDS", "300"))  # 삭제 반영용 전체 id 대조 주기
+    CATEGORY_TREE_TTL: float = float(os.getenv("CATEGORY_TREE_TTL", "60"))
+
+    # 공유 캐시 설정 (memory / sqlite / redis / fakeredis)
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "sqlite")
+    CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    # /dev/shm이 있으면 공유 메모리 위에 두어 디스크를 거치지 않습니다.
+    CACHE_SQLITE_PATH: str = os.getenv(
+        "CACHE_SQLITE_PATH",
+        os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "locain-cache.sqlite3"),
+    )
+    CACHE_KEY_PREFIX: str = os.getenv("CACHE_KEY_PREFIX", "locain:")
+    CACHE_LOCAL_MAX_ENTRIES: int = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "10000"))
+    CACHE_LOCAL_TTL: float = float(os.getenv("CACHE_LOCAL_TTL", "5"))
+
+    # 읽기 응답 캐시 설정
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+
+    # 대량 내보내기 설정 (서버 측 커서로 한 번에 가져올 행 수)
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # 행정구역 설정 (읍/면/동 CSV: 시도,시군구,읍면동,행정동코드)
+    REGION_DONG_DATA_PATH: Optional[str] = os.getenv("REGION_DONG_DATA_PATH")
+
+    # 업로드 설정
+    UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads")
+    MEDIA_URL: str = os.getenv("MEDIA_URL", "/media")
+    MEDIA_ACCEL_REDIRECT_PREFIX: Optional[str] = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX")  # nginx internal location
+    MEDIA_PUBLIC_BASE_URL: Optional[str] = os.getenv("MEDIA_PUBLIC_BASE_URL")  # S3/CDN 공개 주소
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "local")  # local / s3 / fakes3 (개발용 프로세스 내장 S3)
+    S3_ENDPOINT_URL: str = os.getenv("S3_ENDPOINT_URL", "http://localhost:9000")
+    S3_BUCKET: str = os.getenv("S3_BUCKET", "locain-uploads")
+    S3_ACCESS_KEY: Optional[str] = os.getenv("S3_ACCESS_KEY")
+    S3_SECRET_KEY: Optional[str] = os.getenv("S3_SECRET_KEY")
+    S3_REGION: str = os.getenv("S3_REGION", "us-east-1")
+    UPLOAD_MAX_BYTES: int = int(os.getenv("UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    REVIEW_IMAGE_TYPES: list = ["image/jpeg", "image/png", "image/webp", "image/gif", "image/heic", "image/heif"]
+    IMAGE_WORKERS: int = int(os.getenv("IMAGE_WORKERS", "2"))
+
     class Config:
         case_sensitive = True
 
@@ -0,0 +1,172 @@
+from typing import Dict, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import hmac
+import re
+import threading
+from app.core.storage import sigv4_signature
+
+_AUTHORIZATION = re.compile(
+    r"AWS4-HMAC-SHA256 Credential=(?P<access_key>[^/]+)/(?P<scope>[^,]+), "
+    r"SignedHeaders=(?P<signed_headers>[^,]+), Signature=(?P<signature>[0-9a-f]+)"
+)
+
+class _ThreadingServer(ThreadingHTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+class FakeS3Server:
+    """
+    S3 없이 개발/점검할 때 쓰는 프로세스 내장 S3 호환 서버.
+    S3Storage가 쓰는 path-style 요청(PUT, HEAD, GET /<bucket>/<key>)만 지원하며
+    Signature V4 서명과 x-amz-content-sha256을 실제 S3처럼 검증합니다.
+    데이터는 메모리에만 있습니다. 운영 환경에서는 실제 S3/MinIO를 사용합니다.
+    """
+
+    def __init__(self, access_key: str, secret_key: str, host: str = "127.0.0.1", port: int = 0):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self._objects: Dict[str, Tuple[bytes, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0], 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            break
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                    return b"".join(chunks)
+                return self.rfile.read(int(self.headers.get("Content-Length", "0")))
+
+            def _handle(self, body: bytes = b"") -> Optional[str]:
+                if not server.authorized(self.command, self.path, self.headers):
+                    self._reply(403)
+                    return None
+                if self.headers.get("x-amz-content-sha256") != hashlib.sha256(body).hexdigest():
+                    self._reply(400)
+                    return None
+                return self.path
+
+            def do_PUT(self):
+                body = self._read_body()
+                path = self._handle(body)
+                if path is not None:
+                    with server._lock:
+                        server._objects[path] = (body, self.headers.get("Content-Type"))
+                    self._reply(200, headers={"ETag": f'"{hashlib.md5(body).hexdigest()}"'})
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def do_GET(self):
+                path = self._handle()
+                if path is None:
+                    return
+                with server._lock:
+                    entry = server._objects.get(path)
+                if entry is None:
+                    self._reply(404)
+                    return
+                body, content_type = entry
+                self._reply(200, body, {"Content-Type": content_type or "application/octet-stream"})
+
+        self._server = _ThreadingServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeS3Server":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-s3", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def authorized(self, method: str, path: str, headers) -> bool:
+        match = _AUTHORIZATION.fullmatch(headers.get("Authorization", ""))
+        if match is None or match["access_key"] != self.access_key:
+            return False
+        datestamp, region = match["scope"].split("/")[:2]
+        amz_date = headers.get("x-amz-date", "")
+        if not amz_date.startswith(datestamp):
+            return False
+        names = match["signed_headers"].split(";")
+        if "host" not in names or any(headers.get(name) is None for name in names):
+            return False
+        expected = sigv4_signature(
+            self.secret_key,
+            method=method,
+            canonical_uri=path,
+            headers=[(name, headers[name].strip()) for name in names],
+            payload_hash=headers.get("x-amz-content-sha256", ""),
+            amz_date=amz_date,
+            region=region,
+        )
+        return hmac.compare_digest(expected, match["signature"])
+
+async def _round_trip() -> None:
+    import os
+    import tempfile
+    from app.core.storage import S3Storage
+
+    server = FakeS3Server(access_key="fake", secret_key="fake").start()
+    try:
+        storage = S3Storage(server.url, "check", "fake", "fake")
+        data = os.urandom(300 * 1024)
+        sha256 = hashlib.sha256(data).hexdigest()
+        with tempfile.TemporaryDirectory() as tmp:
+            for expected_dedup in (False, True):
+                source = os.path.join(tmp, "upload")
+                with open(source, "wb") as f:
+                    f.write(data)
+                stored = await storage.put_file(
+                    source, namespace="reviews", sha256=sha256, size=len(data),
+                    extension=".jpg", content_type="image/jpeg",
+                )
+                assert stored.deduplicated is expected_dedup
+                assert not os.path.exists(source)
+            assert await storage.exists(stored.key)
+            assert not await storage.exists(stored.key + ".missing")
+            target = os.path.join(tmp, "download")
+            await storage.fetch_to_path(stored.key, target)
+            with open(target, "rb") as f:
+                assert f.read() == data
+        forged = S3Storage(server.url, "check", "fake", "wrong-secret")
+        try:
+            await forged.exists(stored.key)
+        except Exception:
+            pass
+        else:
+            raise AssertionError("잘못된 서명이 통과했습니다.")
+        print(f"S3 round trip OK: {stored.key}")
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(_round_trip())
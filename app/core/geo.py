@@ -0,0 +1,77 @@
+from typing import List, Tuple
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9  # 저장 정밀도 (약 4.8m x 4.8m)
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # 짝수 번째 비트는 경도
+    while len(chars) < precision:
+        target, current = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (target[0] + target[1]) / 2
+        value <<= 1
+        if current >= mid:
+            value |= 1
+            target[0] = mid
+        else:
+            target[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = value = 0
+    return "".join(chars)
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """geohash 한 칸의 (위도 높이, 경도 너비)를 도 단위로 반환합니다."""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """반경을 감싸는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)"""
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    d_lng = min(math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)), 180.0)
+    return latitude - d_lat, latitude + d_lat, longitude - d_lng, longitude + d_lng
+
+def covering_cells(latitude: float, longitude: float, radius_km: float) -> List[str]:
+    """
+    반경 원을 덮는 geohash 접두사 목록.
+    칸 크기가 반경 이상인 가장 세밀한 정밀도를 골라 중심 칸과 주변 8칸을 반환하므로,
+    저장된 geohash에 대한 접두사(범위) 조건 최대 9개로 후보를 좁힐 수 있습니다.
+    """
+    d_lat_km = 2 * math.pi * EARTH_RADIUS_KM / 360.0
+    d_lng_km = d_lat_km * max(math.cos(math.radians(latitude)), 1e-6)
+    precision = 1
+    for candidate in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size_degrees(candidate)
+        if height * d_lat_km >= radius_km and width * d_lng_km >= radius_km:
+            precision = candidate
+            break
+
+    height, width = cell_size_degrees(precision)
+    cells: List[str] = []
+    for i in (-1, 0, 1):
+        lat = min(max(latitude + i * height, -90.0), 90.0)
+        for j in (-1, 0, 1):
+            lng = (longitude + j * width + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(lat, lng, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
@@ -0,0 +1,26 @@
+from typing import Dict
+import logging
+from app.crud.crud_hashtag import hashtag as crud_hashtag
+from app.db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 미리 계산해 두는 인기 태그 구간(일)
+TRENDING_WINDOWS = (1, 7, 30)
+
+def run_trend_rebuild() -> Dict[int, int]:
+    """모든 구간의 인기 태그 순위를 다시 계산합니다. (주기 실행용)"""
+    db = SessionLocal()
+    try:
+        counts = {
+            window_days: crud_hashtag.rebuild_trends(db, window_days=window_days)
+            for window_days in TRENDING_WINDOWS
+        }
+    finally:
+        db.close()
+    logger.info(f"Hashtag trends rebuilt: {counts}")
+    return counts
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(run_trend_rebuild())
@@ -0,0 +1,140 @@
+from typing import Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import logging
+import os
+import tempfile
+from app.core.config import settings
+from app.core.storage import StorageBackend, get_storage, media_url
+from app.core.uploads import hash_file
+from app.db.database import SessionLocal
+from app.models.review import ReviewImage
+
+logger = logging.getLogger(__name__)
+
+# 변형 이름 -> (최대 변 길이, 품질)
+IMAGE_VARIANTS: Dict[str, Tuple[int, int]] = {
+    "thumb": (320, 75),
+    "web": (1280, 82),
+}
+
+VARIANT_NAMESPACE = "reviews/variants"
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def get_pool() -> ProcessPoolExecutor:
+    """이미지 처리는 CPU 작업이므로 요청 경로와 분리된 프로세스 풀에서 실행합니다."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+    return _pool
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+def generate_variants(source_path: str, output_dir: str) -> Dict[str, str]:
+    """
+    원본 이미지로부터 썸네일/웹용 변형을 생성합니다. (프로세스 풀에서 실행)
+    EXIF 방향을 반영해 회전한 뒤 메타데이터 없이 WebP로 다시 압축하며,
+    변형 이름별로 output_dir에 만든 임시 파일 경로를 반환합니다.
+    """
+    from PIL import Image, ImageOps
+    from pillow_heif import register_heif_opener
+
+    # 아이폰 기본 형식(HEIC/HEIF)도 Pillow로 열 수 있게 합니다. (여러 번 호출해도 안전)
+    register_heif_opener()
+
+    results: Dict[str, str] = {}
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        # 큰 변형부터 만들어 작은 변형은 축소본에서 다시 축소합니다.
+        for name, (max_side, quality) in sorted(IMAGE_VARIANTS.items(), key=lambda item: -item[1][0]):
+            resized = image.copy()
+            resized.thumbnail((max_side, max_side), Image.LANCZOS)
+            fd, target = tempfile.mkstemp(dir=output_dir, prefix=f"variant-{name}-", suffix=".webp")
+            os.close(fd)
+            # exif 인자를 넘기지 않으므로 EXIF/GPS 정보는 저장되지 않습니다.
+            resized.save(target, format="WEBP", quality=quality, method=4)
+            results[name] = target
+            image = resized
+
+    return results
+
+async def build_variants(source_key: str, storage: Optional[StorageBackend] = None) -> Dict[str, str]:
+    """
+    저장소의 원본으로 변형을 만들어 다시 저장소에 기록하고 {변형 이름: 키}를 반환합니다.
+    변형도 내용 주소로 저장되므로 같은 결과물은 한 번만 저장됩니다.
+    """
+    storage = storage or get_storage()
+    staging = storage.staging_dir()
+    source_path = storage.local_path(source_key)
+    downloaded = None
+    if source_path is None:
+        fd, downloaded = tempfile.mkstemp(dir=staging, prefix="source-")
+        os.close(fd)
+        await storage.fetch_to_path(source_key, downloaded)
+        source_path = downloaded
+
+    outputs: Dict[str, str] = {}
+    try:
+        loop = asyncio.get_running_loop()
+        outputs = await loop.run_in_executor(get_pool(), generate_variants, source_path, staging)
+        keys: Dict[str, str] = {}
+        for name, path in outputs.items():
+            stored = await storage.put_file(
+                path,
+                namespace=VARIANT_NAMESPACE,
+                sha256=await hash_file(path),
+                size=os.path.getsize(path),
+                extension=".webp",
+                content_type="image/webp",
+            )
+            keys[name] = stored.key
+        return keys
+    finally:
+        for path in [downloaded, *outputs.values()]:
+            if path and os.path.exists(path):
+                os.remove(path)
+
+async def process_review_image(image_id: int, source_key: str, content_hash: str) -> None:
+    """업로드 이후 백그라운드에서 변형을 생성하고 ReviewImage에 기록합니다."""
+    try:
+        variants = await asyncio.to_thread(_find_existing_variants, image_id, content_hash)
+        if variants is None:
+            variants = await build_variants(source_key)
+    except Exception as e:
+        logger.error(f"Review image processing failed (image_id={image_id}): {str(e)}")
+        await asyncio.to_thread(_save_variants, image_id, None, "failed")
+        return
+    await asyncio.to_thread(_save_variants, image_id, variants, "ready")
+
+def _find_existing_variants(image_id: int, content_hash: str) -> Optional[Dict[str, str]]:
+    """같은 원본으로 이미 만들어 둔 변형이 있으면 재사용합니다."""
+    db = SessionLocal()
+    try:
+        existing = db.query(ReviewImage.variants).filter(
+            ReviewImage.content_hash == content_hash,
+            ReviewImage.variants_status == "ready",
+            ReviewImage.id != image_id,
+        ).first()
+        return existing.variants if existing else None
+    finally:
+        db.close()
+
+def _save_variants(image_id: int, variants: Optional[Dict[str, str]], status: str) -> None:
+    db = SessionLocal()
+    try:
+        db.query(ReviewImage).filter(ReviewImage.id == image_id).update({
+            ReviewImage.variants: variants,
+            ReviewImage.thumbnail_url: media_url(variants["thumb"]) if variants else None,
+            ReviewImage.variants_status: status,
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
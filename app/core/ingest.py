@@ -0,0 +1,103 @@
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Type, TypeVar
+import codecs
+import csv
+import json
+from pydantic import BaseModel, ValidationError
+from app.schemas.ingest import IngestError
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-seq")
+CSV_MEDIA_TYPES = ("text/csv", "application/csv")
+
+DEFAULT_CHUNK_SIZE = 1000
+
+class IngestChunk(Generic[ModelType]):
+    """검증을 통과한 레코드 묶음과 실패한 레코드 목록"""
+
+    def __init__(self) -> None:
+        self.items: List[ModelType] = []
+        self.lines: List[int] = []
+        self.errors: List[IngestError] = []
+
+def detect_format(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더에서 수집 포맷(ndjson/csv)을 판별합니다."""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        return "ndjson"
+    if media_type in CSV_MEDIA_TYPES:
+        return "csv"
+    return None
+
+async def iter_lines(stream: AsyncIterator[bytes], encoding: str = "utf-8") -> AsyncIterator[str]:
+    """바이트 스트림을 전체 본문을 메모리에 올리지 않고 줄 단위로 나눕니다."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    buffer = ""
+    async for chunk in stream:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+def _parse_ndjson(line: str) -> Dict[str, Any]:
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("JSON 객체가 아닙니다.")
+    return record
+
+def _parse_csv(line: str, header: List[str]) -> Dict[str, Any]:
+    values = next(csv.reader([line]))
+    if len(values) != len(header):
+        raise ValueError(f"컬럼 수가 헤더와 다릅니다. (expected={len(header)}, got={len(values)})")
+    # 빈 값은 필드 기본값을 사용하도록 제외합니다.
+    return {key: value for key, value in zip(header, values) if value != ""}
+
+async def iter_chunks(
+    stream: AsyncIterator[bytes],
+    *,
+    fmt: str,
+    model: Type[ModelType],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[IngestChunk[ModelType]]:
+    """
+    NDJSON/CSV 스트림을 chunk_size 단위로 읽어 스키마 검증 후 반환합니다.
+    잘못된 레코드는 전체 요청을 실패시키지 않고 줄 번호와 함께 errors에 기록됩니다.
+    """
+    header: Optional[List[str]] = None
+    chunk: IngestChunk[ModelType] = IngestChunk()
+    line_no = 0
+
+    async for line in iter_lines(stream):
+        line_no += 1
+        if not line.strip():
+            continue
+
+        if fmt == "csv" and header is None:
+            header = [column.strip() for column in next(csv.reader([line]))]
+            continue
+
+        try:
+            record = _parse_csv(line, header) if fmt == "csv" else _parse_ndjson(line)
+            chunk.items.append(model(**record))
+            chunk.lines.append(line_no)
+        except ValidationError as e:
+            chunk.errors.append(IngestError(line=line_no, detail=_format_validation_error(e)))
+        except (ValueError, csv.Error) as e:
+            chunk.errors.append(IngestError(line=line_no, detail=str(e)))
+
+        if len(chunk.items) + len(chunk.errors) >= chunk_size:
+            yield chunk
+            chunk = IngestChunk()
+
+    if chunk.items or chunk.errors:
+        yield chunk
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    )
+
@@ -0,0 +1,320 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+import csv
+import enum
+import logging
+import threading
+import unicodedata
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class RegionLevel(int, enum.Enum):
+    SIDO = 1  # 시/도
+    SIGUNGU = 2  # 시/군/구
+    DONG = 3  # 읍/면/동
+
+# 지역 코드는 SS GGG DDD 형태의 정수입니다.
+# SS는 행정표준코드의 시/도 코드, GGG는 시/도 안의 시/군/구 순번, DDD는 행정동 코드(행정기관코드 10자리)의
+# 읍/면/동 세 자리(6~8번째)이며, 하위 지역의 코드는 항상 상위 지역의 코드 구간 안에 들어가므로
+# "서울 전체"는 BETWEEN 조건 하나가 됩니다.
+# 코드는 DB에 저장되므로 아래 목록에는 항목을 끝에만 덧붙여야 합니다. 목록이나 읍/면/동 데이터를 바꾼 뒤에는
+# python -m app.db.backfill_regions 로 저장된 코드를 다시 계산합니다.
+SIGUNGU_SPAN = 1_000
+SIDO_SPAN = 1_000 * SIGUNGU_SPAN
+
+# (시/도 코드, 정식 명칭, 별칭, 시/군/구 목록)
+_SIDO_TABLE: Tuple[Tuple[int, str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (11, "서울특별시", ("서울", "서울시"), (
+        "종로구", "중구", "용산구", "성동구", "광진구", "동대문구", "중랑구", "성북구", "강북구",
+        "도봉구", "노원구", "은평구", "서대문구", "마포구", "양천구", "강서구", "구로구", "금천구",
+        "영등포구", "동작구", "관악구", "서초구", "강남구", "송파구", "강동구",
+    )),
+    (26, "부산광역시", ("부산", "부산시"), (
+        "중구", "서구", "동구", "영도구", "부산진구", "동래구", "남구", "북구", "해운대구",
+        "사하구", "금정구", "강서구", "연제구", "수영구", "사상구", "기장군",
+    )),
+    (27, "대구광역시", ("대구", "대구시"), (
+        "중구", "동구", "서구", "남구", "북구", "수성구", "달서구", "달성군", "군위군",
+    )),
+    (28, "인천광역시", ("인천", "인천시"), (
+        "중구", "동구", "미추홀구", "연수구", "남동구", "부평구", "계양구", "서구", "강화군", "옹진군",
+    )),
+    (29, "광주광역시", ("광주",), (
+        "동구", "서구", "남구", "북구", "광산구",
+    )),
+    (30, "대전광역시", ("대전", "대전시"), (
+        "동구", "중구", "서구", "유성구", "대덕구",
+    )),
+    (31, "울산광역시", ("울산", "울산시"), (
+        "중구", "남구", "동구", "북구", "울주군",
+    )),
+    (36, "세종특별자치시", ("세종", "세종시"), ()),
+    (41, "경기도", ("경기",), (
+        "수원시", "성남시", "의정부시", "안양시", "부천시", "광명시", "평택시", "동두천시", "안산시",
+        "고양시", "과천시", "구리시", "남양주시", "오산시", "시흥시", "군포시", "의왕시", "하남시",
+        "용인시", "파주시", "이천시", "안성시", "김포시", "화성시", "광주시", "양주시", "포천시",
+        "여주시", "연천군", "가평군", "양평군",
+    )),
+    (51, "강원특별자치도", ("강원", "강원도"), (
+        "춘천시", "원주시", "강릉시", "동해시", "태백시", "속초시", "삼척시", "홍천군", "횡성군",
+        "영월군", "평창군", "정선군", "철원군", "화천군", "양구군", "인제군", "고성군", "양양군",
+    )),
+    (43, "충청북도", ("충북",), (
+        "청주시", "충주시", "제천시", "보은군", "옥천군", "영동군", "증평군", "진천군", "괴산군",
+        "음성군", "단양군",
+    )),
+    (44, "충청남도", ("충남",), (
+        "천안시", "공주시", "보령시", "아산시", "서산시", "논산시", "계룡시", "당진시", "금산군",
+        "부여군", "서천군", "청양군", "홍성군", "예산군", "태안군",
+    )),
+    (52, "전북특별자치도", ("전북", "전라북도"), (
+        "전주시", "군산시", "익산시", "정읍시", "남원시", "김제시", "완주군", "진안군", "무주군",
+        "장수군", "임실군", "순창군", "고창군", "부안군",
+    )),
+    (46, "전라남도", ("전남",), (
+        "목포시", "여수시", "순천시", "나주시", "광양시", "담양군", "곡성군", "구례군", "고흥군",
+        "보성군", "화순군", "장흥군", "강진군", "해남군", "영암군", "무안군", "함평군", "영광군",
+        "장성군", "완도군", "진도군", "신안군",
+    )),
+    (47, "경상북도", ("경북",), (
+        "포항시", "경주시", "김천시", "안동시", "구미시", "영주시", "영천시", "상주시", "문경시",
+        "경산시", "의성군", "청송군", "영양군", "영덕군", "청도군", "고령군", "성주군", "칠곡군",
+        "예천군", "봉화군", "울진군", "울릉군",
+    )),
+    (48, "경상남도", ("경남",), (
+        "창원시", "진주시", "통영시", "사천시", "김해시", "밀양시", "거제시", "양산시", "의령군",
+        "함안군", "창녕군", "고성군", "남해군", "하동군", "산청군", "함양군", "거창군", "합천군",
+    )),
+    (50, "제주특별자치도", ("제주", "제주도"), (
+        "제주시", "서귀포시",
+    )),
+)
+
+def normalize_region_text(text: str) -> str:
+    """전각/호환 문자를 정규화하고 공백과 구분 기호를 하나의 공백으로 바꿉니다."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return " ".join(text.replace(",", " ").replace("/", " ").split())
+
+@dataclass(eq=False)
+class Region:
+    code: int
+    name: str
+    level: RegionLevel
+    parent: Optional["Region"] = field(default=None, repr=False)
+    children: List["Region"] = field(default_factory=list, repr=False)
+
+    @property
+    def full_name(self) -> str:
+        names = []
+        region: Optional[Region] = self
+        while region is not None:
+            names.append(region.name)
+            region = region.parent
+        return " ".join(reversed(names))
+
+    @property
+    def code_range(self) -> Tuple[int, int]:
+        """이 지역과 모든 하위 지역을 포함하는 [시작, 끝] 코드 구간"""
+        if self.level == RegionLevel.SIDO:
+            return self.code, self.code + SIDO_SPAN - 1
+        if self.level == RegionLevel.SIGUNGU:
+            return self.code, self.code + SIGUNGU_SPAN - 1
+        return self.code, self.code
+
+class _TrieNode:
+    __slots__ = ("children", "region")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.region: Optional[Region] = None
+
+def _insert(root: _TrieNode, key: str, region: Region) -> None:
+    node = root
+    for char in key:
+        node = node.children.setdefault(char, _TrieNode())
+    # 같은 상위 지역 안에서 별칭이 겹치면 먼저 등록된 (정식 명칭) 쪽을 유지합니다.
+    if node.region is None:
+        node.region = region
+
+def _longest_match(root: _TrieNode, text: str, start: int) -> Tuple[Optional[Region], int]:
+    node = root
+    matched: Tuple[Optional[Region], int] = (None, start)
+    for index in range(start, len(text)):
+        node = node.children.get(text[index])
+        if node is None:
+            break
+        if node.region is not None:
+            matched = (node.region, index + 1)
+    return matched
+
+def _short_name(name: str) -> Optional[str]:
+    """'강남구' → '강남'. 한 글자만 남는 이름('중구')은 별칭을 만들지 않습니다."""
+    if len(name) > 2 and name[-1] in "시군구읍면동":
+        return name[:-1]
+    return None
+
+class RegionIndex:
+    """
+    시/도 → 시/군/구 → 읍/면/동 행정구역 트리.
+
+    상위 지역마다 하위 지역 이름(별칭 포함)의 문자 트라이를 두고, 자유 입력 문자열을
+    공백 없이 이어 붙여 단계별 최장 일치로 내려갑니다. 따라서 "서울 강남구", "서울특별시강남구",
+    "강남구 역삼동"이 모두 같은 지역으로 해석됩니다.
+    """
+
+    def __init__(self):
+        self.root = Region(code=0, name="", level=RegionLevel.SIDO)
+        self._tries: Dict[int, _TrieNode] = {0: _TrieNode()}
+        self._by_code: Dict[int, Region] = {}
+        # 시/도 없이 시/군/구부터 쓴 입력을 위한 전역 트라이. 여러 시/도에 있는 이름은 제외합니다.
+        self._sigungu_trie = _TrieNode()
+        self._sigungu_names: Dict[str, List[Region]] = {}
+
+    def add(self, parent: Optional[Region], name: str, code: int, level: RegionLevel, aliases: Iterable[str] = ()) -> Region:
+        parent_code = parent.code if parent is not None else 0
+        region = Region(code=code, name=name, level=level, parent=parent)
+        self._by_code[code] = region
+        self._tries[code] = _TrieNode()
+        (parent or self.root).children.append(region)
+        keys = [name, *aliases]
+        short = _short_name(name)
+        if short and level != RegionLevel.SIDO:
+            keys.append(short)
+        for key in keys:
+            _insert(self._tries[parent_code], key.replace(" ", ""), region)
+            if level == RegionLevel.SIGUNGU:
+                self._sigungu_names.setdefault(key.replace(" ", ""), []).append(region)
+        return region
+
+    def finalize(self) -> None:
+        self._sigungu_trie = _TrieNode()
+        for key, regions in self._sigungu_names.items():
+            if len(regions) == 1:
+                _insert(self._sigungu_trie, key, regions[0])
+
+    def get(self, code: int) -> Optional[Region]:
+        return self._by_code.get(code)
+
+    def resolve(self, text: str) -> Optional[Region]:
+        """문자열이 가리키는 가장 깊은 지역. 아무 지역도 찾지 못하면 None을 반환합니다."""
+        tokens = normalize_region_text(text).split(" ")
+        joined = "".join(tokens)
+        if not joined:
+            return None
+        # 토큰 경계(이어 붙인 문자열 기준 위치)
+        boundaries = []
+        position = 0
+        for token in tokens:
+            boundaries.append(position)
+            position += len(token)
+
+        region, end = _longest_match(self._tries[0], joined, 0)
+        if region is None:
+            region, end = _longest_match(self._sigungu_trie, joined, 0)
+            if region is None:
+                return None
+
+        while region.level < RegionLevel.DONG and end < len(joined):
+            child, child_end = _longest_match(self._tries[region.code], joined, end)
+            if child is None:
+                # '수원시 장안구 연무동'처럼 중간에 색인하지 않은 단계(일반구)가 낀 경우 한 토큰을 건너뜁니다.
+                next_boundaries = [b for b in boundaries if b > end]
+                if next_boundaries:
+                    child, child_end = _longest_match(self._tries[region.code], joined, next_boundaries[0])
+            if child is None:
+                break
+            region, end = child, child_end
+        return region
+
+    def code_range(self, text: str) -> Optional[Tuple[int, int]]:
+        region = self.resolve(text)
+        return region.code_range if region else None
+
+    def __len__(self) -> int:
+        return len(self._by_code)
+
+def _dong_code(official_code: str) -> Optional[int]:
+    """행정동 코드(예: 1168064000)에서 읍/면/동 세 자리(640)를 꺼냅니다."""
+    official_code = official_code.strip()
+    if len(official_code) != 10 or not official_code.isdigit():
+        return None
+    return int(official_code[5:8]) or None
+
+def build_region_index(dong_path: Optional[str] = None) -> RegionIndex:
+    """
+    내장 시/도·시/군/구 표로 트리를 만들고, dong_path가 있으면 읍/면/동을 덧붙입니다.
+    dong_path는 '시도,시군구,읍면동,행정동코드' 열을 가진 UTF-8 CSV입니다. 읍/면/동 코드는 행정동 코드에서
+    가져오므로 CSV의 행 순서나 중간에 추가된 행과 관계없이 같은 동은 항상 같은 코드를 갖습니다.
+    일반구가 있는 시(수원시 장안구 등)에서 일반구끼리 세 자리가 겹치면 행정동 코드가 작은 쪽만 색인합니다.
+    """
+    index = RegionIndex()
+    for sido_code, sido_name, aliases, sigungu_names in _SIDO_TABLE:
+        sido = index.add(None, sido_name, sido_code * SIDO_SPAN, RegionLevel.SIDO, aliases)
+        for seq, sigungu_name in enumerate(sigungu_names, start=1):
+            index.add(sido, sigungu_name, sido.code + seq * SIGUNGU_SPAN, RegionLevel.SIGUNGU)
+    index.finalize()
+
+    if dong_path:
+        rows = []
+        skipped = 0
+        with open(dong_path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.reader(f):
+                if len(row) < 4 or row[0] == "시도":
+                    continue
+                dong_code = _dong_code(row[3])
+                if dong_code is None:
+                    skipped += 1
+                    continue
+                rows.append((row[3].strip(), dong_code, row))
+        # 겹치는 코드가 있어도 결과가 파일의 행 순서에 좌우되지 않도록 행정동 코드 순으로 넣습니다.
+        rows.sort(key=lambda item: item[0])
+        for _, dong_code, row in rows:
+            parent = index.resolve(f"{row[0]} {row[1]}")
+            # 세종처럼 시/군/구가 없는 시/도는 읍/면/동이 시/도 바로 아래에 붙습니다.
+            if parent is None or parent.level == RegionLevel.DONG or (
+                parent.level == RegionLevel.SIDO
+                and any(child.level == RegionLevel.SIGUNGU for child in parent.children)
+            ):
+                skipped += 1
+                continue
+            if index.get(parent.code + dong_code) is not None:
+                skipped += 1
+                continue
+            index.add(parent, normalize_region_text(row[2]), parent.code + dong_code, RegionLevel.DONG)
+        if skipped:
+            logger.warning(f"Region data rows skipped: {skipped}")
+    return index
+
+_index: Optional[RegionIndex] = None
+_index_lock = threading.Lock()
+
+def get_region_index() -> RegionIndex:
+    """프로세스당 한 번만 만들어 공유합니다."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_region_index(settings.REGION_DONG_DATA_PATH)
+    return _index
+
+def resolve_region_code(*parts: Optional[str]) -> Optional[int]:
+    """주소 구성 요소들을 이어 해석한 가장 깊은 지역 코드"""
+    region = get_region_index().resolve(" ".join(part for part in parts if part))
+    return region.code if region else None
+
+def preference_ranges(names: Iterable[str]) -> List[Tuple[int, int]]:
+    """선호 지역 이름 목록 → 겹치지 않게 합친 코드 구간 목록. 해석되지 않는 이름은 무시합니다."""
+    index = get_region_index()
+    ranges = sorted(
+        region.code_range
+        for region in (index.resolve(name) for name in names or [] if name)
+        if region is not None
+    )
+    merged: List[Tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
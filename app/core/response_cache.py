@@ -0,0 +1,157 @@
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+import hashlib
+import threading
+import time
+import uuid
+from fastapi import Request, Response
+from app.core.cache import cache as shared_cache
+from app.core.config import settings
+from app.core.responses import dumps_json, etag_matches
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    cache_control: str
+    expires_at: float
+    last_modified: Optional[str] = None
+    # 저장할 때 본 태그별 세대. 공유 캐시의 세대가 바뀌었으면 다른 프로세스에서 무효화된 것입니다.
+    generations: Tuple[Tuple[str, Optional[str]], ...] = ()
+
+    def to_response(self, request: Request) -> Response:
+        """If-None-Match가 ETag와 맞으면 본문 없이 304, 아니면 저장된 본문을 그대로 보냅니다."""
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+# 태그 세대 값의 보관 기간. 응답 캐시 TTL보다 충분히 길면 됩니다.
+GENERATION_TTL = 24 * 3600
+
+def _http_date(value: datetime) -> str:
+    # tzinfo가 없는 값은 datetime.utcnow()로 기록된 UTC 시각입니다.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+class ResponseCache:
+    """
+    읽기 엔드포인트의 직렬화된 응답 본문 캐시.
+
+    - 키는 경로 + 정렬된 쿼리 문자열이며, 사용자마다 결과가 다른 경로는 user_id를 키에 붙입니다.
+    - 항목마다 태그(예: "campaign:3")를 달아 두고 쓰기 엔드포인트가 invalidate(태그)로 지웁니다.
+    - ETag는 updated_at이 주어지면 (키, updated_at)으로, 아니면 본문 해시로 만듭니다.
+      하위 행(통계, 플랫폼 등)을 함께 담는 응답은 updated_at만으로 변경을 알 수 없으므로 본문 해시를 씁니다.
+    - invalidate()는 태그마다 공유 캐시(app.core.cache)의 세대 값을 바꾸고, get()은 저장 당시 세대와
+      비교합니다. 따라서 다른 워커나 스케줄러 프로세스의 무효화도 최대 CACHE_LOCAL_TTL 안에 반영됩니다.
+    """
+
+    def __init__(self, *, max_entries: int = settings.RESPONSE_CACHE_MAX_ENTRIES, enabled: bool = settings.RESPONSE_CACHE_ENABLED):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: Request, *, user_id: Optional[int] = None) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        key = f"{request.url.path}?{query}"
+        return f"{key}#u{user_id}" if user_id is not None else key
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if cached.expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+        if any(self._generation(tag) != generation for tag, generation in cached.generations):
+            with self._lock:
+                if self._entries.get(key) is cached:
+                    self._drop(key)
+            return None
+        return cached
+
+    @staticmethod
+    def _generation_key(tag: str) -> str:
+        return f"response_tag:{tag}"
+
+    def _generation(self, tag: str) -> Optional[str]:
+        return shared_cache.get(self._generation_key(tag))
+
+    def put(
+        self,
+        key: str,
+        content: Any,
+        *,
+        ttl: int,
+        tags: Iterable[str] = (),
+        public: bool = False,
+        updated_at: Optional[datetime] = None,
+    ) -> CachedResponse:
+        """content를 JSON으로 한 번 직렬화해 저장하고 CachedResponse를 반환합니다."""
+        body = dumps_json(content)
+        key_tags = set(tags)
+        if updated_at is not None:
+            etag = f'W/"{hashlib.sha1(f"{key}|{updated_at.isoformat()}".encode()).hexdigest()}"'
+        else:
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        cached = CachedResponse(
+            body=body,
+            etag=etag,
+            cache_control=f"{'public' if public else 'private'}, max-age={ttl}",
+            expires_at=time.monotonic() + ttl,
+            last_modified=_http_date(updated_at) if updated_at is not None else None,
+            generations=tuple((tag, self._generation(tag)) for tag in sorted(key_tags)) if self.enabled else (),
+        )
+        if not self.enabled:
+            return cached
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = cached
+            self._key_tags[key] = key_tags
+            for tag in key_tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+        return cached
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._drop(key)
+        if not self.enabled:
+            return
+        for tag in set(tags):
+            shared_cache.set(self._generation_key(tag), uuid.uuid4().hex, ttl=GENERATION_TTL)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._key_tags.clear()
+
+    def _drop(self, key: str) -> None:
+        self._entries.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+response_cache = ResponseCache()
@@ -0,0 +1,197 @@
+from typing import Any, Iterable, Mapping, Optional, Tuple, Type
+from decimal import Decimal
+import os
+import re
+import anyio
+import orjson
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+
+# 내용 주소 파일은 내용이 바뀌면 키도 바뀌므로 1년간 캐시해도 안전합니다.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def _orjson_default(value: Any) -> Any:
+    # orjson이 직접 처리하지 못하는 타입만 여기로 옵니다. (datetime/date/Enum/UUID/dataclass는 기본 지원)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def dumps_json(content: Any) -> bytes:
+    """응답 본문용 JSON 직렬화. 한글은 이스케이프하지 않고 공백 없는 UTF-8로 만듭니다."""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson으로 렌더링하는 기본 응답 클래스. (app.main에서 default_response_class로 지정)
+    response_model이 있는 경로는 FastAPI가 이미 JSON 호환 값으로 바꿔 넘기므로 직렬화만 빨라지고,
+    model_list_response()처럼 직접 만든 응답은 검증/변환 단계까지 건너뜁니다.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+def model_list_response(model: Type[BaseModel], rows: Iterable[Any], **kwargs: Any) -> ORJSONResponse:
+    """
+    ORM 행 목록을 model로 한 번만 검증해 model_dump(mode="json") 결과를 그대로 보냅니다.
+    response_model을 거치면 반환값을 다시 검증하고 jsonable_encoder로 한 번 더 순회하므로,
+    큰 목록 응답에서는 이 경로가 그 두 단계를 생략합니다.
+    """
+    return ORJSONResponse(
+        [model.model_validate(row).model_dump(mode="json") for row in rows],
+        **kwargs,
+    )
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 Range 헤더를 (start, end) 포함 구간으로 해석합니다.
+    헤더가 없거나 다중 구간이면 None(전체 응답), 만족할 수 없으면 ValueError를 발생시킵니다.
+    """
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    start, end = match.groups()
+    if start == "" and end == "":
+        return None
+    if start == "":
+        # bytes=-N : 마지막 N바이트
+        length = int(end)
+        if length == 0:
+            raise ValueError("unsatisfiable range")
+        return max(size - length, 0), size - 1
+    first = int(start)
+    last = min(int(end), size - 1) if end else size - 1
+    if first >= size or first > last:
+        raise ValueError("unsatisfiable range")
+    return first, last
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match는 약한 비교를 사용합니다.
+    etag = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+class MediaFileResponse(Response):
+    """
+    업로드 파일 전용 응답.
+
+    - ETag는 파일명(내용 sha256)으로 만든 강한 ETag이며 If-None-Match가 맞으면 304를 반환합니다.
+    - 단일 Range 요청은 206으로, 만족할 수 없는 Range는 416으로 응답합니다.
+    - ASGI 서버가 zerocopysend 확장을 지원하면 os.sendfile 기반으로 전송하고,
+      accel_redirect가 지정되면 본문 없이 X-Accel-Redirect 헤더만 보내 nginx가 직접 전송합니다.
+      둘 다 아니면 고정 크기 청크로 스트리밍합니다.
+    """
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        etag: str,
+        request_headers: Headers,
+        media_type: Optional[str] = None,
+        accel_redirect: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        self.path = path
+        self.accel_redirect = accel_redirect
+        # 형식은 호출자가 검증된 값으로 넘깁니다. 경로 확장자로 추측하지 않습니다.
+        self.media_type = media_type or "application/octet-stream"
+        self.background = None
+        self.body = b""
+
+        size = os.stat(path).st_size
+        self.offset, self.length = 0, size
+        status_code = 200
+        base_headers = {
+            "etag": etag,
+            "cache-control": IMMUTABLE_CACHE_CONTROL,
+            "accept-ranges": "bytes",
+            "x-content-type-options": "nosniff",
+            **(headers or {}),
+        }
+        if not self.media_type.startswith("image/") or self.media_type == "image/svg+xml":
+            # 이미지가 아니면 API 도메인에서 렌더링되지 않도록 내려받기로만 제공합니다.
+            base_headers["content-disposition"] = "attachment"
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            status_code, self.length = 304, 0
+        else:
+            if_range = request_headers.get("if-range")
+            range_header = request_headers.get("range") if not if_range or if_range == etag else None
+            try:
+                byte_range = parse_range(range_header, size)
+            except ValueError:
+                byte_range = None
+                status_code, self.length = 416, 0
+                base_headers["content-range"] = f"bytes */{size}"
+            if byte_range:
+                start, end = byte_range
+                status_code = 206
+                self.offset, self.length = start, end - start + 1
+                base_headers["content-range"] = f"bytes {start}-{end}/{size}"
+
+        self.status_code = status_code
+        if status_code not in (304, 416):
+            base_headers["content-length"] = str(self.length)
+        self.init_headers(base_headers)
+        if status_code == 416:
+            self.headers["content-length"] = "0"
+        if accel_redirect and status_code in (200, 206):
+            self.headers["x-accel-redirect"] = accel_redirect
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if (
+            scope["method"] == "HEAD"
+            or self.length == 0
+            or self.accel_redirect
+        ):
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            with open(self.path, "rb") as f:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": f.fileno(),
+                    "offset": self.offset,
+                    "count": self.length,
+                    "more_body": False,
+                })
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as f:
+            await f.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,293 @@
+from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from urllib.parse import parse_qs, urlparse
+import asyncio
+import logging
+import random
+import httpx
+from sqlalchemy import insert, or_, update
+from sqlalchemy.orm import Session
+from app.core.batch_runner import BatchResult, Lane, RateLimitedBatchRunner, RateLimiter
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.review import ReviewContent, ReviewMetricSnapshot, ReviewStatus
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ReviewMetrics:
+    """어댑터가 가져온 게시물 반응 지표"""
+    review_id: int
+    views: int = 0
+    likes: int = 0
+    comments: int = 0
+    shares: int = 0
+
+def engagement_rate(views: int, likes: int, comments: int, shares: int) -> float:
+    """(좋아요+댓글+공유) / 조회수 * 100, 조회수가 없으면 0"""
+    if not views:
+        return 0.0
+    return round((likes + comments + shares) / views * 100, 2)
+
+class ReviewMetricsAdapter:
+    """
+    게시 플랫폼 어댑터 기본 클래스.
+    matches()로 처리할 수 있는 URL인지 판단하고 fetch()로 지표를 가져옵니다.
+    url_patterns는 matches()가 받아들이는 URL을 SQL LIKE 패턴으로 적은 것으로,
+    대상 조회 단계에서 처리할 수 없는 URL을 걸러 내는 데 씁니다.
+    """
+    name: str = ""
+    url_patterns: List[str] = []
+    rate_per_second: float = 5.0
+    burst: int = 5
+    timeout: float = 10.0
+
+    def matches(self, url: str) -> bool:
+        raise NotImplementedError
+
+    async def fetch(self, client: httpx.AsyncClient, review_id: int, url: str) -> ReviewMetrics:
+        raise NotImplementedError
+
+class YouTubeReviewAdapter(ReviewMetricsAdapter):
+    """YouTube Data API v3 videos.list(statistics)"""
+    name = "youtube"
+    url_patterns = [
+        f"http%://{host}/%"
+        for host in ("youtube.com", "www.youtube.com", "m.youtube.com", "youtu.be", "www.youtu.be", "m.youtu.be")
+    ]
+    rate_per_second = 10.0
+    burst = 10
+
+    def matches(self, url: str) -> bool:
+        return urlparse(url).netloc.lower().removeprefix("www.").removeprefix("m.") in ("youtube.com", "youtu.be")
+
+    @staticmethod
+    def video_id(url: str) -> Optional[str]:
+        parsed = urlparse(url)
+        if parsed.netloc.lower().endswith("youtu.be"):
+            return parsed.path.lstrip("/") or None
+        if parsed.path.startswith("/shorts/"):
+            return parsed.path.split("/")[2] or None
+        return (parse_qs(parsed.query).get("v") or [None])[0]
+
+    async def fetch(self, client: httpx.AsyncClient, review_id: int, url: str) -> ReviewMetrics:
+        video_id = self.video_id(url)
+        if not video_id:
+            raise ValueError(f"YouTube 영상 주소가 아닙니다. ({url})")
+        response = await client.get(
+            "https://www.googleapis.com/youtube/v3/videos",
+            params={"part": "statistics", "id": video_id, "key": settings.YOUTUBE_API_KEY},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        items = response.json().get("items") or []
+        if not items:
+            raise ValueError(f"YouTube 영상을 찾을 수 없습니다. (review_id={review_id})")
+        statistics = items[0]["statistics"]
+        return ReviewMetrics(
+            review_id=review_id,
+            views=int(statistics.get("viewCount", 0)),
+            likes=int(statistics.get("likeCount", 0)),
+            comments=int(statistics.get("commentCount", 0)),
+        )
+
+class FakeReviewMetricsAdapter(ReviewMetricsAdapter):
+    """
+    오프라인 테스트용 어댑터. 모든 URL을 처리하며 리뷰 id 기반의 결정적인 지표를 반환합니다.
+    지연 시간과 실패 확률을 설정할 수 있고, 호출된 리뷰 id는 calls에 기록됩니다.
+    """
+    name = "fake"
+    url_patterns = ["%"]
+    rate_per_second = 1000.0
+    burst = 1000
+
+    def __init__(self, *, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls: List[int] = []
+        self._random = random.Random(seed)
+
+    def matches(self, url: str) -> bool:
+        return True
+
+    async def fetch(self, client: httpx.AsyncClient, review_id: int, url: str) -> ReviewMetrics:
+        self.calls.append(review_id)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._random.random() < self.failure_rate:
+            raise RuntimeError(f"fake failure (review_id={review_id})")
+        views = 1000 + review_id * 7
+        return ReviewMetrics(
+            review_id=review_id,
+            views=views,
+            likes=views // 20,
+            comments=views // 100,
+            shares=views // 200,
+        )
+
+DEFAULT_REVIEW_ADAPTERS: List[ReviewMetricsAdapter] = [YouTubeReviewAdapter()]
+
+async def _fetch(adapter: ReviewMetricsAdapter, client: httpx.AsyncClient, target: tuple) -> ReviewMetrics:
+    review_id, url = target
+    return await adapter.fetch(client, review_id, url)
+
+def apply_review_metrics(db: Session, *, metrics: List[ReviewMetrics], fetched_at: Optional[datetime] = None) -> None:
+    """
+    수집된 지표를 한 번에 반영합니다.
+    참여율은 여기서 묶음으로 계산해 ReviewContent에 저장하고, 시점별 스냅샷을 함께 적재합니다.
+    """
+    if not metrics:
+        return
+    fetched_at = fetched_at or datetime.utcnow()
+    review_rows = []
+    snapshot_rows = []
+    for item in metrics:
+        rate = engagement_rate(item.views, item.likes, item.comments, item.shares)
+        review_rows.append({
+            "id": item.review_id,
+            "views": item.views,
+            "likes": item.likes,
+            "comments": item.comments,
+            "shares": item.shares,
+            "engagement_rate": rate,
+            "metrics_updated_at": fetched_at,
+        })
+        snapshot_rows.append({
+            "review_content_id": item.review_id,
+            "views": item.views,
+            "likes": item.likes,
+            "comments": item.comments,
+            "shares": item.shares,
+            "engagement_rate": rate,
+            "fetched_at": fetched_at,
+        })
+    try:
+        db.execute(update(ReviewContent), review_rows)
+        db.execute(insert(ReviewMetricSnapshot), snapshot_rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+class ReviewMetricsRefresher:
+    """
+    완료된 리뷰의 게시물 URL에서 반응 지표를 다시 가져옵니다.
+
+    - 대상: 어댑터가 처리할 수 있는 게시 URL이 있고 마지막 갱신이 stale_after보다 오래된 완료 리뷰 (오래된 순)
+    - 대상을 불러올 때 metrics_attempted_at을 찍어 두므로, 실패한 리뷰는 retry_after가 지나야 다시 시도
+    - 어댑터별 레인과 토큰 버킷은 RateLimitedBatchRunner(app.core.batch_runner)가 처리
+    - 결과는 flush_size 단위로 apply_review_metrics()에 묶어 반영
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        adapters: Optional[List[ReviewMetricsAdapter]] = None,
+        workers: int = settings.REVIEW_METRICS_WORKERS,
+        stale_after: timedelta = timedelta(hours=settings.REVIEW_METRICS_STALE_HOURS),
+        batch_size: int = settings.REVIEW_METRICS_BATCH_SIZE,
+        retry_after: timedelta = timedelta(minutes=settings.REVIEW_METRICS_RETRY_MINUTES),
+        flush_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.adapters = adapters or DEFAULT_REVIEW_ADAPTERS
+        self.limiters: Dict[str, RateLimiter] = {
+            adapter.name: RateLimiter(adapter.rate_per_second, adapter.burst)
+            for adapter in self.adapters
+        }
+        self.stale_after = stale_after
+        self.batch_size = batch_size
+        self.retry_after = retry_after
+        self.runner = RateLimitedBatchRunner(
+            self._apply_in_session,
+            workers=workers,
+            flush_size=flush_size,
+            name="ReviewMetricsRefresh",
+            describe=lambda target: f"review_id={target[0]}",
+        )
+
+    def adapter_for(self, url: str) -> Optional[ReviewMetricsAdapter]:
+        for adapter in self.adapters:
+            if adapter.matches(url):
+                return adapter
+        return None
+
+    def load_targets(self, db: Session, *, now: Optional[datetime] = None) -> List[tuple]:
+        """갱신이 필요한 (리뷰 id, 게시 URL) 목록을 조회합니다."""
+        now = now or datetime.utcnow()
+        threshold = now - self.stale_after
+        supported = or_(*(
+            ReviewContent.post_url.like(pattern)
+            for adapter in self.adapters
+            for pattern in adapter.url_patterns
+        ))
+        rows = db.query(ReviewContent.id, ReviewContent.post_url).filter(
+            ReviewContent.status == ReviewStatus.COMPLETED,
+            ReviewContent.post_url != None,
+            supported,
+            (ReviewContent.metrics_updated_at == None) | (ReviewContent.metrics_updated_at < threshold),
+            (ReviewContent.metrics_attempted_at == None)
+            | (ReviewContent.metrics_attempted_at < now - self.retry_after),
+        ).order_by(ReviewContent.metrics_updated_at.asc()).limit(self.batch_size).all()
+        return [(row.id, row.post_url) for row in rows]
+
+    def mark_attempted(self, db: Session, targets: List[tuple], *, now: Optional[datetime] = None) -> None:
+        """
+        불러온 대상에 시도 시각을 기록합니다. 가져오지 못한 리뷰(삭제된 게시물 등)나
+        URL 패턴만 맞고 matches()는 통과하지 못한 리뷰가 매 회차 맨 앞을 차지하지 않습니다.
+        """
+        if not targets:
+            return
+        db.execute(
+            update(ReviewContent)
+            .where(ReviewContent.id.in_([review_id for review_id, _ in targets]))
+            .values(metrics_attempted_at=now or datetime.utcnow())
+        )
+        db.commit()
+
+    async def run(self, targets: Optional[List[tuple]] = None) -> BatchResult:
+        """갱신 한 회차를 실행합니다."""
+        if targets is None:
+            targets = await asyncio.to_thread(self._load_targets_in_session)
+
+        lanes: Dict[str, Lane] = {}
+        skipped = 0
+        for review_id, url in targets:
+            adapter = self.adapter_for(url)
+            if adapter is None:
+                skipped += 1
+                continue
+            lane = lanes.get(adapter.name)
+            if lane is None:
+                lane = lanes[adapter.name] = Lane(self.limiters[adapter.name], partial(_fetch, adapter))
+            lane.items.append((review_id, url))
+
+        result = await self.runner.run(lanes, skipped=skipped)
+        logger.info(f"Review metrics refresh finished: {result}")
+        return result
+
+    def _load_targets_in_session(self) -> List[tuple]:
+        db = self.session_factory()
+        try:
+            targets = self.load_targets(db)
+            self.mark_attempted(db, targets)
+            return targets
+        finally:
+            db.close()
+
+    def _apply_in_session(self, metrics: List[ReviewMetrics]) -> None:
+        db = self.session_factory()
+        try:
+            apply_review_metrics(db, metrics=metrics)
+        finally:
+            db.close()
+
+async def run_review_metrics_refresh() -> BatchResult:
+    return await ReviewMetricsRefresher(SessionLocal).run()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(asyncio.run(run_review_metrics_refresh()))
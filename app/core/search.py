@@ -0,0 +1,53 @@
+from typing import List, Optional
+import re
+import unicodedata
+
+# MySQL ngram 파서의 기본 토큰 길이(ngram_token_size)와 맞춥니다.
+MIN_TERM_LENGTH = 2
+MAX_TERMS = 8
+
+# 불리언 모드 연산자로 해석되는 문자는 검색어에서 제거합니다.
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]+')
+
+def normalize(text: str) -> str:
+    """
+    검색용 정규화. NFKC로 전각/호환 문자를 통일하고 소문자로 바꿉니다.
+    한글은 NFKC에서 완성형으로 합쳐지므로 자모 분리 입력도 같은 토큰이 됩니다.
+    """
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+def tokenize(query: str) -> List[str]:
+    """검색어를 공백 단위로 나눕니다. 한 글자 토큰은 ngram 색인에 없으므로 버립니다."""
+    terms: List[str] = []
+    for term in _BOOLEAN_OPERATORS.sub(" ", normalize(query)).split():
+        if len(term) >= MIN_TERM_LENGTH and term not in terms:
+            terms.append(term)
+    return terms[:MAX_TERMS]
+
+def boolean_query(terms: List[str]) -> str:
+    """
+    MATCH ... AGAINST 불리언 모드 검색식.
+    각 검색어를 구(phrase)로 감싸 ngram이 연속으로 나타나는 문서만 찾고, 모든 검색어를 필수로 둡니다.
+    """
+    return " ".join(f'+"{term}"' for term in terms)
+
+def make_snippet(text: Optional[str], terms: List[str], width: int = 120) -> str:
+    """가장 먼저 나오는 검색어를 중심으로 width 글자 내외의 발췌문을 만듭니다."""
+    if not text:
+        return ""
+    text = " ".join(text.split())
+    lowered = normalize(text)
+    positions = [pos for pos in (lowered.find(term) for term in terms) if pos >= 0]
+    if not positions or len(text) <= width:
+        return text if len(text) <= width else text[:width].rstrip() + "…"
+
+    first = min(positions)
+    start = max(first - width // 3, 0)
+    end = min(start + width, len(text))
+    start = max(end - width, 0)
+    snippet = text[start:end].strip()
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(text):
+        snippet = snippet + "…"
+    return snippet
@@ -0,0 +1,316 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from urllib.parse import quote, urlparse
+import asyncio
+import hashlib
+import hmac
+import os
+import aiofiles
+import httpx
+from app.core.config import settings
+
+class StoredObject:
+    """저장소에 기록된 객체 정보"""
+
+    def __init__(self, key: str, sha256: str, size: int, content_type: Optional[str], deduplicated: bool):
+        self.key = key
+        self.sha256 = sha256
+        self.size = size
+        self.content_type = content_type
+        self.deduplicated = deduplicated
+
+    @property
+    def url(self) -> str:
+        return media_url(self.key)
+
+def media_url(key: str) -> str:
+    return f"{settings.MEDIA_URL.rstrip('/')}/{key}"
+
+def content_key(namespace: str, sha256: str, extension: str = "") -> str:
+    """sha256 앞 4글자로 2단계 fan-out 한 내용 주소 키 (예: reviews/ab/cd/abcd...jpg)"""
+    return f"{namespace}/{sha256[:2]}/{sha256[2:4]}/{sha256}{extension.lower()}"
+
+class StorageBackend:
+    """업로드 파일 저장소 인터페이스. 키는 항상 content_key()로 만든 내용 주소입니다."""
+
+    async def put_file(
+        self,
+        source_path: str,
+        *,
+        namespace: str,
+        sha256: str,
+        size: int,
+        extension: str = "",
+        content_type: Optional[str] = None,
+    ) -> StoredObject:
+        """
+        임시 파일을 저장소로 옮깁니다. 같은 내용이 이미 있으면 다시 쓰지 않고
+        deduplicated=True를 반환합니다. 호출 후 source_path는 삭제됩니다.
+        """
+        raise NotImplementedError
+
+    async def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    async def fetch_to_path(self, key: str, target_path: str) -> None:
+        """객체를 로컬 파일로 내려받습니다. (이미지 변형 생성 등)"""
+        raise NotImplementedError
+
+    def local_path(self, key: str) -> Optional[str]:
+        """로컬 디스크에서 직접 읽을 수 있으면 경로를, 아니면 None을 반환합니다."""
+        return None
+
+    def staging_dir(self) -> str:
+        """업로드 임시 파일을 쓸 디렉터리"""
+        path = os.path.join(settings.UPLOAD_DIR, ".staging")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+class LocalContentAddressedStorage(StorageBackend):
+    """
+    로컬 파일시스템 내용 주소 저장소.
+
+    실제 데이터는 objects/ab/cd/<sha256> 에 한 번만 저장하고, 네임스페이스별 경로
+    (reviews/ab/cd/<sha256>.jpg, campaign_media/...)는 하드 링크로 만듭니다.
+    같은 이미지가 여러 리뷰나 네임스페이스에 올라와도 디스크에는 한 벌만 남습니다.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _object_path(self, sha256: str) -> str:
+        return os.path.join(self.root, "objects", sha256[:2], sha256[2:4], sha256)
+
+    def local_path(self, key: str) -> Optional[str]:
+        path = os.path.normpath(os.path.join(self.root, key))
+        # 키 조작으로 루트 밖의 파일에 접근하지 못하도록 제한
+        if not path.startswith(os.path.normpath(self.root) + os.sep):
+            return None
+        return path
+
+    def staging_dir(self) -> str:
+        # os.replace/os.link가 같은 파일시스템에서 동작하도록 루트 아래에 둡니다.
+        path = os.path.join(self.root, ".staging")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    async def put_file(
+        self,
+        source_path: str,
+        *,
+        namespace: str,
+        sha256: str,
+        size: int,
+        extension: str = "",
+        content_type: Optional[str] = None,
+    ) -> StoredObject:
+        key = content_key(namespace, sha256, extension)
+        deduplicated = await asyncio.to_thread(self._put, source_path, sha256, key)
+        return StoredObject(key, sha256, size, content_type, deduplicated)
+
+    def _put(self, source_path: str, sha256: str, key: str) -> bool:
+        object_path = self._object_path(sha256)
+        link_path = self.local_path(key)
+        deduplicated = os.path.exists(object_path)
+        try:
+            if not deduplicated:
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                os.replace(source_path, object_path)
+            if not os.path.exists(link_path):
+                os.makedirs(os.path.dirname(link_path), exist_ok=True)
+                try:
+                    os.link(object_path, link_path)
+                except FileExistsError:
+                    pass
+        finally:
+            if os.path.exists(source_path):
+                os.remove(source_path)
+        return deduplicated
+
+    async def exists(self, key: str) -> bool:
+        path = self.local_path(key)
+        return bool(path) and os.path.exists(path)
+
+    async def fetch_to_path(self, key: str, target_path: str) -> None:
+        path = self.local_path(key)
+        if not path or not os.path.exists(path):
+            raise FileNotFoundError(key)
+        await asyncio.to_thread(_link_or_copy, path, target_path)
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        import shutil
+        shutil.copyfile(source, target)
+
+def sigv4_signature(
+    secret_key: str,
+    *,
+    method: str,
+    canonical_uri: str,
+    headers: List[Tuple[str, str]],
+    payload_hash: str,
+    amz_date: str,
+    region: str,
+) -> str:
+    """
+    AWS Signature V4 서명값을 계산합니다. (쿼리 문자열 없는 S3 요청)
+    headers는 서명에 넣을 (소문자 이름, 값) 목록을 이름순으로 정렬한 것입니다.
+    """
+    datestamp = amz_date[:8]
+    canonical_request = "\n".join([
+        method,
+        canonical_uri,
+        "",
+        "".join(f"{name}:{value}\n" for name, value in headers),
+        ";".join(name for name, _ in headers),
+        payload_hash,
+    ])
+    scope = f"{datestamp}/{region}/s3/aws4_request"
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256",
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode()).hexdigest(),
+    ])
+    signing_key = ("AWS4" + secret_key).encode()
+    for part in (datestamp, region, "s3", "aws4_request"):
+        signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+    return hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+class S3Storage(StorageBackend):
+    """
+    S3 호환 저장소 (AWS S3, MinIO, localstack 등).
+    endpoint_url을 로컬 MinIO나 FakeS3Server(app.core.fake_s3)로 지정하면 오프라인에서도 그대로 검증할 수 있습니다.
+    업로드 전에 HEAD로 같은 키가 있는지 확인해 중복 업로드를 건너뜁니다.
+    요청 서명은 AWS Signature V4를 직접 계산합니다. (path-style 주소)
+    """
+
+    def __init__(self, endpoint_url: str, bucket: str, access_key: str, secret_key: str, region: str = "us-east-1"):
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.host = urlparse(self.endpoint_url).netloc
+
+    def _object_url(self, key: str) -> str:
+        return f"{self.endpoint_url}/{self.bucket}/{quote(key, safe='/~')}"
+
+    def _signed_headers(self, method: str, key: str, payload_hash: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        now = datetime.utcnow()
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = now.strftime("%Y%m%d")
+        headers = {
+            **(headers or {}),
+            "host": self.host,
+            "x-amz-date": amz_date,
+            "x-amz-content-sha256": payload_hash,
+        }
+        items = sorted((name.lower(), str(value).strip()) for name, value in headers.items())
+        signed_headers = ";".join(name for name, _ in items)
+        scope = f"{datestamp}/{self.region}/s3/aws4_request"
+        signature = sigv4_signature(
+            self.secret_key,
+            method=method,
+            canonical_uri=f"/{self.bucket}/{quote(key, safe='/~')}",
+            headers=items,
+            payload_hash=payload_hash,
+            amz_date=amz_date,
+            region=self.region,
+        )
+        headers["Authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        return headers
+
+    async def exists(self, key: str) -> bool:
+        empty_hash = hashlib.sha256(b"").hexdigest()
+        async with httpx.AsyncClient() as client:
+            response = await client.head(
+                self._object_url(key), headers=self._signed_headers("HEAD", key, empty_hash)
+            )
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+
+    async def put_file(
+        self,
+        source_path: str,
+        *,
+        namespace: str,
+        sha256: str,
+        size: int,
+        extension: str = "",
+        content_type: Optional[str] = None,
+    ) -> StoredObject:
+        key = content_key(namespace, sha256, extension)
+        try:
+            if await self.exists(key):
+                return StoredObject(key, sha256, size, content_type, True)
+
+            headers = {"content-length": str(size)}
+            if content_type:
+                headers["content-type"] = content_type
+
+            async def body():
+                async with aiofiles.open(source_path, "rb") as f:
+                    while True:
+                        chunk = await f.read(settings.UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        yield chunk
+
+            async with httpx.AsyncClient(timeout=60) as client:
+                response = await client.put(
+                    self._object_url(key),
+                    content=body(),
+                    headers=self._signed_headers("PUT", key, sha256, headers),
+                )
+                response.raise_for_status()
+        finally:
+            if os.path.exists(source_path):
+                os.remove(source_path)
+        return StoredObject(key, sha256, size, content_type, False)
+
+    async def fetch_to_path(self, key: str, target_path: str) -> None:
+        empty_hash = hashlib.sha256(b"").hexdigest()
+        async with httpx.AsyncClient(timeout=60) as client:
+            async with client.stream(
+                "GET", self._object_url(key), headers=self._signed_headers("GET", key, empty_hash)
+            ) as response:
+                response.raise_for_status()
+                async with aiofiles.open(target_path, "wb") as out_file:
+                    async for chunk in response.aiter_bytes(settings.UPLOAD_CHUNK_SIZE):
+                        await out_file.write(chunk)
+
+_storage: Optional[StorageBackend] = None
+
+def get_storage() -> StorageBackend:
+    """설정(STORAGE_BACKEND)에 따른 저장소 인스턴스를 반환합니다."""
+    global _storage
+    if _storage is None:
+        if settings.STORAGE_BACKEND == "fakes3":
+            from app.core.fake_s3 import FakeS3Server
+            server = FakeS3Server(access_key="fake", secret_key="fake").start()
+            _storage = S3Storage(
+                endpoint_url=server.url,
+                bucket=settings.S3_BUCKET,
+                access_key="fake",
+                secret_key="fake",
+                region=settings.S3_REGION,
+            )
+        elif settings.STORAGE_BACKEND == "s3":
+            _storage = S3Storage(
+                endpoint_url=settings.S3_ENDPOINT_URL,
+                bucket=settings.S3_BUCKET,
+                access_key=settings.S3_ACCESS_KEY,
+                secret_key=settings.S3_SECRET_KEY,
+                region=settings.S3_REGION,
+            )
+        else:
+            _storage = LocalContentAddressedStorage(settings.UPLOAD_DIR)
+    return _storage
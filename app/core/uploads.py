@@ -0,0 +1,129 @@
+from typing import Optional, Sequence
+import hashlib
+import os
+import tempfile
+import aiofiles
+from fastapi import HTTPException, UploadFile
+from app.core.config import settings
+from app.core.storage import StorageBackend, StoredObject, get_storage
+
+# 내용으로 판별한 형식 -> 저장 확장자. 클라이언트가 보낸 파일명/Content-Type은 저장 키에 쓰지 않습니다.
+UPLOAD_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/heic": ".heic",
+    "image/heif": ".heif",
+}
+
+_HEIC_BRANDS = {b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis"}
+_HEIF_BRANDS = {b"mif1", b"msf1"}
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    """파일 앞부분의 매직 바이트로 형식을 판별합니다. 알 수 없으면 None을 반환합니다."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:8] == b"ftyp":
+        if head[8:12] in _HEIC_BRANDS:
+            return "image/heic"
+        if head[8:12] in _HEIF_BRANDS:
+            return "image/heif"
+    return None
+
+# /media 로 공개하는 네임스페이스 (리뷰 이미지와 그 변형). .staging, objects/ 등은 제공하지 않습니다.
+PUBLIC_MEDIA_NAMESPACES = ("reviews",)
+
+def is_public_media_key(key: str) -> bool:
+    parts = key.split("/")
+    if parts[0] not in PUBLIC_MEDIA_NAMESPACES:
+        return False
+    # 빈 구간, "..", 숨김 파일(.part 등)은 내용 주소 키에 나오지 않습니다.
+    return all(part and not part.startswith(".") for part in parts)
+
+def content_type_for_key(key: str) -> Optional[str]:
+    """저장 키의 확장자(업로드 시 판별한 형식에서 만든 것)로 형식을 돌려줍니다."""
+    extension = os.path.splitext(key)[1].lower()
+    for content_type, known_extension in UPLOAD_TYPE_EXTENSIONS.items():
+        if known_extension == extension:
+            return content_type
+    return None
+
+async def save_upload(
+    file: UploadFile,
+    namespace: str,
+    *,
+    storage: Optional[StorageBackend] = None,
+    max_bytes: int = settings.UPLOAD_MAX_BYTES,
+    chunk_size: int = settings.UPLOAD_CHUNK_SIZE,
+    allowed_types: Optional[Sequence[str]] = None,
+) -> StoredObject:
+    """
+    UploadFile을 고정 크기 청크로 스테이징 파일에 복사한 뒤 저장소에 기록합니다.
+
+    - 파일 전체를 메모리에 올리지 않으며, max_bytes를 넘는 순간 중단하고 413을 반환합니다.
+    - 형식은 첫 청크의 매직 바이트로 판별하고 저장 확장자도 그 형식에서 정합니다.
+      (클라이언트가 보낸 파일명/Content-Type은 믿지 않음)
+    - 복사하면서 sha256을 계산하고, 저장 키는 내용 해시로 정해 동시 업로드 시 충돌하지 않습니다.
+    - 저장소는 같은 내용이 이미 있으면 다시 쓰지 않습니다. (StoredObject.deduplicated)
+    """
+    storage = storage or get_storage()
+    fd, temp_path = tempfile.mkstemp(dir=storage.staging_dir(), prefix="upload-", suffix=".part")
+    os.close(fd)
+
+    digest = hashlib.sha256()
+    size = 0
+    content_type: Optional[str] = None
+    try:
+        async with aiofiles.open(temp_path, "wb") as out_file:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                if size == 0:
+                    content_type = sniff_content_type(chunk)
+                    if allowed_types is not None and content_type not in allowed_types:
+                        raise HTTPException(
+                            status_code=415,
+                            detail=f"지원하지 않는 파일 형식입니다. ({content_type or file.content_type})",
+                        )
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"파일 크기는 {max_bytes // (1024 * 1024)}MB를 넘을 수 없습니다.",
+                    )
+                digest.update(chunk)
+                await out_file.write(chunk)
+
+        if size == 0:
+            raise HTTPException(status_code=400, detail="빈 파일은 업로드할 수 없습니다.")
+
+        return await storage.put_file(
+            temp_path,
+            namespace=namespace,
+            sha256=digest.hexdigest(),
+            size=size,
+            extension=UPLOAD_TYPE_EXTENSIONS.get(content_type, ""),
+            content_type=content_type or "application/octet-stream",
+        )
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        await file.close()
+
+async def hash_file(path: str, chunk_size: int = settings.UPLOAD_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    async with aiofiles.open(path, "rb") as f:
+        while True:
+            chunk = await f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,9 +1,16 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
-from app.models.campaign import Campaign, CampaignApplication
+from app.models.campaign import AdmissionStatus, ApplicationStatus, Campaign, CampaignApplication, CampaignStatus
 from app.schemas.campaign import CampaignCreate, CampaignUpdate, CampaignApplicationCreate, CampaignApplicationUpdate
 
+# 정원에서 빠지는 신청 상태. 이 상태로 바뀌면 current_applications를 줄입니다.
+RELEASED_STATUSES = (ApplicationStatus.REJECTED.value, ApplicationStatus.WITHDRAWN.value)
+
+_UNIQUE_APPLICATION = "uq_campaign_applications_campaign_user"
+
 class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
     def get_by_user_id(self, db: Session, *, user_id: int) -> List[Campaign]:
         return db.query(Campaign).filter(Campaign.user_id == user_id).all()
@@ -51,6 +58,105 @@ class CRUDCampaignApplication(CRUDBase[CampaignApplication, CampaignApplicationC
         db.refresh(db_obj)
         return db_obj
 
+    def admit(
+        self, db: Session, *, campaign_id: int, user_id: int, application_text: Optional[str] = None
+    ) -> Tuple[AdmissionStatus, Optional[CampaignApplication]]:
+        """
+        캠페인 신청을 원자적으로 접수합니다.
+
+        정원 확인과 증가는 조건부 UPDATE 한 문장으로 처리하고, 중복 신청은
+        (campaign_id, user_id) 유니크 제약으로 막습니다. 애플리케이션에서 읽고 비교하는
+        단계가 없으므로 동시에 몰려도 정원을 넘기지 않으며, 캠페인 행 잠금은
+        UPDATE부터 커밋까지만 유지됩니다.
+
+        INSERT보다 UPDATE를 먼저 하는 이유: 신청 INSERT의 외래 키 검사가 캠페인 행에
+        공유 잠금을 걸기 때문에, 반대 순서면 동시 요청끼리 잠금 승격 교착이 생깁니다.
+        """
+        # 잠금 없는 사전 확인. 정확성은 유니크 제약이 보장하며, 재신청이 인기 캠페인 행을 잠그지 않게 합니다.
+        if db.query(CampaignApplication.id).filter(
+            CampaignApplication.campaign_id == campaign_id,
+            CampaignApplication.user_id == user_id,
+        ).first():
+            return AdmissionStatus.DUPLICATE, None
+
+        result = db.execute(
+            update(Campaign)
+            .where(
+                Campaign.id == campaign_id,
+                Campaign.status == CampaignStatus.ACTIVE,
+                or_(
+                    Campaign.max_participants == None,
+                    Campaign.current_applications < Campaign.max_participants,
+                ),
+            )
+            .values(current_applications=Campaign.current_applications + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            return self._rejection_reason(db, campaign_id), None
+
+        application = CampaignApplication(
+            campaign_id=campaign_id,
+            user_id=user_id,
+            status=ApplicationStatus.PENDING.value,
+            application_text=application_text,
+        )
+        db.add(application)
+        try:
+            db.commit()
+        except IntegrityError as e:
+            # 동시에 들어온 같은 신청자의 중복 요청. 롤백하면 정원 증가도 함께 취소됩니다.
+            db.rollback()
+            if _UNIQUE_APPLICATION in str(e.orig):
+                return AdmissionStatus.DUPLICATE, None
+            raise
+        db.refresh(application)
+        return AdmissionStatus.ADMITTED, application
+
+    def change_status(self, db: Session, *, application: CampaignApplication, status: str) -> bool:
+        """
+        신청 상태를 바꾸고 정원 카운터(current_applications)를 맞춥니다. 커밋은 호출자가 합니다.
+
+        상태는 읽어 둔 이전 상태일 때만 바꾸는 조건부 UPDATE이므로, 같은 신청을 동시에 철회/거절해도
+        카운터는 한 번만 줄어듭니다. 다른 요청이 먼저 상태를 바꿨으면 False를 반환합니다.
+        """
+        previous = application.status
+        result = db.execute(
+            update(CampaignApplication)
+            .where(CampaignApplication.id == application.id, CampaignApplication.status == previous)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            return False
+
+        was_released = previous in RELEASED_STATUSES
+        is_released = status in RELEASED_STATUSES
+        if is_released and not was_released:
+            db.execute(
+                update(Campaign)
+                .where(Campaign.id == application.campaign_id, Campaign.current_applications > 0)
+                .values(current_applications=Campaign.current_applications - 1)
+                .execution_options(synchronize_session=False)
+            )
+        elif was_released and not is_released:
+            db.execute(
+                update(Campaign)
+                .where(Campaign.id == application.campaign_id)
+                .values(current_applications=Campaign.current_applications + 1)
+                .execution_options(synchronize_session=False)
+            )
+        return True
+
+    def _rejection_reason(self, db: Session, campaign_id: int) -> AdmissionStatus:
+        campaign = db.query(Campaign.status).filter(Campaign.id == campaign_id).first()
+        if campaign is None:
+            return AdmissionStatus.NOT_FOUND
+        if campaign.status != CampaignStatus.ACTIVE:
+            return AdmissionStatus.NOT_ACTIVE
+        return AdmissionStatus.FULL
+
     def update(
         self, db: Session, *, db_obj: CampaignApplication, obj_in: CampaignApplicationUpdate
     ) -> CampaignApplication:
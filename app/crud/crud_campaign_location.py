@@ -0,0 +1,84 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.core.geo import bounding_box, covering_cells, encode_geohash, haversine_km
+from app.core.regions import resolve_region_code
+from app.models.campaign import Campaign, CampaignLocation, CampaignStatus
+from app.schemas.location import Location
+
+class CRUDCampaignLocation:
+    def upsert(self, db: Session, *, campaign_id: int, obj_in: Location) -> CampaignLocation:
+        location = db.query(CampaignLocation).filter(CampaignLocation.campaign_id == campaign_id).first()
+        if location is None:
+            location = CampaignLocation(campaign_id=campaign_id)
+        for field, value in obj_in.dict().items():
+            setattr(location, field, value)
+        location.geohash = encode_geohash(obj_in.latitude, obj_in.longitude)
+        location.region_code = self._region_code(location)
+        db.add(location)
+        db.commit()
+        db.refresh(location)
+        return location
+
+    @staticmethod
+    def _region_code(location: CampaignLocation) -> Optional[int]:
+        # 구성 요소로 해석되지 않으면 전체 주소로 한 번 더 시도합니다.
+        return resolve_region_code(
+            location.city, location.district, location.region
+        ) or resolve_region_code(location.address)
+
+    def rebuild_region_codes(self, db: Session, *, batch_size: int = 500) -> int:
+        """저장된 주소로 region_code를 다시 계산합니다. (app.db.backfill_regions) 바뀐 행 수를 반환합니다."""
+        changed = 0
+        last_id = 0
+        while True:
+            locations = db.query(CampaignLocation).filter(
+                CampaignLocation.id > last_id
+            ).order_by(CampaignLocation.id).limit(batch_size).all()
+            if not locations:
+                break
+            for location in locations:
+                region_code = self._region_code(location)
+                if location.region_code != region_code:
+                    location.region_code = region_code
+                    changed += 1
+            db.commit()
+            last_id = locations[-1].id
+        return changed
+
+    def search_nearby(
+        self,
+        db: Session,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 50,
+    ) -> List[Tuple[Campaign, CampaignLocation, float]]:
+        """
+        반경 안의 진행 중 캠페인을 거리순으로 반환합니다.
+        geohash 접두사(인덱스 범위 조회)와 위경도 사각형으로 후보를 좁힌 뒤
+        하버사인 거리로 정확히 걸러 정렬합니다.
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+        cells = covering_cells(latitude, longitude, radius_km)
+        query = db.query(Campaign, CampaignLocation).join(
+            CampaignLocation, CampaignLocation.campaign_id == Campaign.id
+        ).filter(
+            Campaign.status == CampaignStatus.ACTIVE,
+            or_(*[CampaignLocation.geohash.like(f"{cell}%") for cell in cells]),
+            CampaignLocation.latitude.between(min_lat, max_lat),
+        )
+        # 날짜변경선을 넘는 사각형은 경도 조건을 생략하고 거리 계산에 맡깁니다.
+        if -180.0 <= min_lng and max_lng <= 180.0:
+            query = query.filter(CampaignLocation.longitude.between(min_lng, max_lng))
+
+        results = []
+        for campaign, location in query:
+            distance = haversine_km(latitude, longitude, location.latitude, location.longitude)
+            if distance <= radius_km:
+                results.append((campaign, location, round(distance, 3)))
+        results.sort(key=lambda row: (row[2], row[0].id))
+        return results[:limit]
+
+campaign_location = CRUDCampaignLocation()
@@ -0,0 +1,181 @@
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+from app.models.channel_analytics import ChannelAnalyticsRollup, RollupPeriod
+
+RollupKey = Tuple[int, RollupPeriod, date]
+
+def period_start(value: datetime, period: RollupPeriod) -> date:
+    """스냅샷 시각이 속한 집계 구간의 시작일을 반환합니다."""
+    day = value.date() if isinstance(value, datetime) else value
+    if period == RollupPeriod.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if period == RollupPeriod.MONTHLY:
+        return day.replace(day=1)
+    return day
+
+def _engagement_rate(row: Dict[str, Any]) -> float:
+    if not row["views"]:
+        return 0.0
+    interactions = (row["likes"] or 0) + (row["comments"] or 0) + (row["shares"] or 0)
+    return round(interactions / row["views"] * 100, 2)
+
+class CRUDChannelAnalytics:
+    def apply_snapshots(self, db: Session, *, snapshots: List[Dict[str, Any]]) -> None:
+        """
+        새로 추가된 ChannelAnalytics 스냅샷을 일/주/월 롤업에 반영합니다.
+        배치 안에서 구간별로 먼저 합친 뒤 INSERT ... ON DUPLICATE KEY UPDATE 한 번으로 병합하므로
+        동시에 들어온 수집끼리도 갱신을 잃지 않으며, 커밋은 호출자의 트랜잭션에 맡깁니다.
+
+        스냅샷의 조회수/좋아요/댓글/공유는 누적값이므로 구간의 마지막 스냅샷 값을,
+        팔로워 수는 구간의 첫/마지막 스냅샷 값을 저장합니다. (구간별 증가량은 이전 구간과의 차이)
+        누적값이 없는(None) 스냅샷은 저장된 값을 지우지 않습니다.
+        """
+        if not snapshots:
+            return
+
+        merged: Dict[RollupKey, Dict[str, Any]] = {}
+        for snapshot in sorted(snapshots, key=lambda s: s["date"]):
+            for period in RollupPeriod:
+                key = (snapshot["channel_id"], period, period_start(snapshot["date"], period))
+                row = merged.get(key)
+                if row is None:
+                    row = merged[key] = self._empty(key)
+                self._accumulate(row, snapshot)
+
+        now = datetime.utcnow()
+        rows = list(merged.values())
+        for row in rows:
+            row["followers_delta"] = (row["followers_end"] or 0) - (row["followers_start"] or 0)
+            row["engagement_rate"] = _engagement_rate(row)
+            row["created_at"] = now
+            row["updated_at"] = now
+
+        rollup = ChannelAnalyticsRollup
+        stmt = mysql_insert(rollup).values(rows)
+        incoming = stmt.inserted
+        # MySQL은 SET 절을 왼쪽부터 적용하므로, 기존 first/last_snapshot_at과 비교하는 항목을 먼저 둡니다.
+        is_later = incoming.last_snapshot_at >= rollup.last_snapshot_at
+        is_earlier = incoming.first_snapshot_at <= rollup.first_snapshot_at
+        db.execute(stmt.on_duplicate_key_update([
+            ("snapshot_count", rollup.snapshot_count + incoming.snapshot_count),
+            ("views", case((is_later, func.coalesce(incoming.views, rollup.views)), else_=rollup.views)),
+            ("likes", case((is_later, func.coalesce(incoming.likes, rollup.likes)), else_=rollup.likes)),
+            ("comments", case((is_later, func.coalesce(incoming.comments, rollup.comments)), else_=rollup.comments)),
+            ("shares", case((is_later, func.coalesce(incoming.shares, rollup.shares)), else_=rollup.shares)),
+            ("followers_end", case(
+                (and_(is_later, incoming.followers_end.isnot(None)), incoming.followers_end),
+                else_=rollup.followers_end,
+            )),
+            ("followers_start", case(
+                (and_(is_earlier, incoming.followers_start.isnot(None)), incoming.followers_start),
+                else_=rollup.followers_start,
+            )),
+            ("last_snapshot_at", func.greatest(rollup.last_snapshot_at, incoming.last_snapshot_at)),
+            ("first_snapshot_at", func.least(rollup.first_snapshot_at, incoming.first_snapshot_at)),
+            ("followers_delta", func.coalesce(rollup.followers_end, 0) - func.coalesce(rollup.followers_start, 0)),
+            ("engagement_rate", case(
+                (rollup.views > 0, func.round(
+                    (func.coalesce(rollup.likes, 0) + func.coalesce(rollup.comments, 0) + func.coalesce(rollup.shares, 0))
+                    / rollup.views * 100, 2,
+                )),
+                else_=0.0,
+            )),
+            ("updated_at", incoming.updated_at),
+        ]))
+
+    def _empty(self, key: RollupKey) -> Dict[str, Any]:
+        channel_id, period, start = key
+        return {
+            "channel_id": channel_id,
+            "period": period,
+            "period_start": start,
+            "snapshot_count": 0,
+            "first_snapshot_at": None,
+            "last_snapshot_at": None,
+            "followers_start": None,
+            "followers_end": None,
+            "views": None,
+            "likes": None,
+            "comments": None,
+            "shares": None,
+        }
+
+    def _accumulate(self, row: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
+        # snapshots는 시각 순으로 정렬되어 들어옵니다.
+        taken_at = snapshot["date"]
+        followers = snapshot.get("followers_count")
+
+        row["snapshot_count"] += 1
+        if row["first_snapshot_at"] is None:
+            row["first_snapshot_at"] = taken_at
+            row["followers_start"] = followers
+        elif row["followers_start"] is None:
+            row["followers_start"] = followers
+        row["last_snapshot_at"] = taken_at
+        if followers is not None:
+            row["followers_end"] = followers
+        for field, source in (
+            ("views", "total_views"), ("likes", "total_likes"),
+            ("comments", "total_comments"), ("shares", "total_shares"),
+        ):
+            if snapshot.get(source) is not None:
+                row[field] = snapshot[source]
+
+    def get_rollups(
+        self,
+        db: Session,
+        *,
+        channel_id: int,
+        period: RollupPeriod,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        limit: int = 90,
+    ) -> List[ChannelAnalyticsRollup]:
+        """구간 시작일 오름차순으로 롤업 행을 조회합니다."""
+        query = db.query(ChannelAnalyticsRollup).filter(
+            ChannelAnalyticsRollup.channel_id == channel_id,
+            ChannelAnalyticsRollup.period == period,
+        )
+        if start:
+            query = query.filter(ChannelAnalyticsRollup.period_start >= period_start(start, period))
+        if end:
+            query = query.filter(ChannelAnalyticsRollup.period_start <= end)
+        rows = query.order_by(ChannelAnalyticsRollup.period_start.desc()).limit(limit).all()
+        rows.reverse()
+        return rows
+
+    def get_totals(self, db: Session, *, channel_id: int) -> Dict[str, Any]:
+        """누적값이 기록된 가장 최근 월간 롤업의 값(마지막 스냅샷 기준)을 채널의 누적 지표로 반환합니다."""
+        row = db.query(
+            ChannelAnalyticsRollup.views,
+            ChannelAnalyticsRollup.likes,
+            ChannelAnalyticsRollup.comments,
+            ChannelAnalyticsRollup.shares,
+            ChannelAnalyticsRollup.last_snapshot_at,
+        ).filter(
+            ChannelAnalyticsRollup.channel_id == channel_id,
+            ChannelAnalyticsRollup.period == RollupPeriod.MONTHLY,
+            ChannelAnalyticsRollup.views.isnot(None),
+        ).order_by(ChannelAnalyticsRollup.last_snapshot_at.desc()).first()
+        if row is None:
+            return {"views": 0, "likes": 0, "comments": 0, "shares": 0, "last_snapshot_at": None}
+        totals = dict(row._mapping)
+        for key in ("views", "likes", "comments", "shares"):
+            totals[key] = totals[key] or 0
+        return totals
+
+def moving_average(values: List[float], window: int) -> List[Optional[float]]:
+    """window 길이의 단순 이동평균. 구간이 채워지기 전에는 None을 반환합니다."""
+    result: List[Optional[float]] = []
+    running = 0.0
+    for index, value in enumerate(values):
+        running += value
+        if index >= window:
+            running -= values[index - window]
+        result.append(round(running / window, 2) if index + 1 >= window else None)
+    return result
+
+channel_analytics = CRUDChannelAnalytics()
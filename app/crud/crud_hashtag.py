@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+import re
+import unicodedata
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+from app.models.content_hashtag import ContentHashtag
+from app.models.hashtag import Hashtag, HashtagDailyUsage, HashtagTrend
+from app.models.review import ReviewContent
+
+MAX_TAG_LENGTH = 100
+TRENDING_SIZE = 100
+
+# 본문의 #태그. \w는 한글/영문/숫자/밑줄을 모두 포함합니다.
+_HASHTAG_RE = re.compile(r"#(\w+)")
+
+def normalize_tag(tag: str) -> Optional[str]:
+    """'#맛집', '＃맛집', '맛집 ' 을 모두 '맛집'으로 통일합니다. 유효하지 않으면 None"""
+    tag = unicodedata.normalize("NFKC", tag or "").strip().lstrip("#").lower()
+    tag = "".join(tag.split())
+    if not tag or len(tag) > MAX_TAG_LENGTH or not re.fullmatch(r"\w+", tag):
+        return None
+    return tag
+
+def extract_hashtags(*texts: Optional[str]) -> List[str]:
+    """본문에서 #태그를 추출합니다. 순서를 유지하며 중복은 제거합니다."""
+    tags: List[str] = []
+    for text in texts:
+        for raw in _HASHTAG_RE.findall(unicodedata.normalize("NFKC", text or "")):
+            tag = normalize_tag(raw)
+            if tag and tag not in tags:
+                tags.append(tag)
+    return tags
+
+class CRUDHashtag:
+    def sync_review(self, db: Session, *, review: ReviewContent, now: Optional[datetime] = None) -> List[str]:
+        """
+        리뷰의 해시태그를 정규화해 ContentHashtag 연결과 사용 횟수에 반영합니다.
+
+        - 태그 = 리뷰의 hashtags 목록 + 본문에서 추출한 #태그 (정규화 후 중복 제거)
+        - 기존 연결과 비교해 추가/삭제된 태그만 처리하며, 없는 Hashtag는 INSERT ... ON DUPLICATE KEY UPDATE
+          한 번으로 만듭니다. usage_count는 연결이 실제로 추가/삭제된(rowcount 1) 태그만 바꿉니다.
+        - 일자별 사용량도 같은 방식으로 누적합니다. 커밋은 호출자의 트랜잭션에 맡깁니다.
+        """
+        now = now or datetime.utcnow()
+        desired: List[str] = []
+        for tag in [*(normalize_tag(t) for t in (review.hashtags or [])), *extract_hashtags(review.title, review.content)]:
+            if tag and tag not in desired:
+                desired.append(tag)
+        review.hashtags = desired
+
+        current: Dict[str, int] = {
+            row.tag_name: row.id
+            for row in db.query(Hashtag.tag_name, Hashtag.id).join(
+                ContentHashtag, ContentHashtag.hashtag_id == Hashtag.id
+            ).filter(ContentHashtag.content_id == review.id)
+        }
+        added = [tag for tag in desired if tag not in current]
+        removed_ids = [hashtag_id for tag, hashtag_id in current.items() if tag not in desired]
+
+        if added:
+            # 태그 행만 만들어 두고, 사용 횟수는 연결이 실제로 추가된 만큼만 올립니다.
+            stmt = mysql_insert(Hashtag).values([
+                {"tag_name": tag, "usage_count": 0, "last_used_at": now, "created_at": now, "updated_at": now}
+                for tag in added
+            ])
+            db.execute(stmt.on_duplicate_key_update(
+                last_used_at=stmt.inserted.last_used_at,
+                updated_at=stmt.inserted.updated_at,
+            ))
+            added_ids = [
+                row.id for row in db.query(Hashtag.id).filter(Hashtag.tag_name.in_(added))
+            ]
+            # 동시에 같은 리뷰를 저장한 요청이 먼저 연결했으면 INSERT IGNORE가 무시되어 rowcount가 0입니다.
+            linked_ids = [
+                hashtag_id for hashtag_id in added_ids
+                if db.execute(mysql_insert(ContentHashtag).prefix_with("IGNORE").values(
+                    content_id=review.id, hashtag_id=hashtag_id, created_at=now, updated_at=now,
+                )).rowcount
+            ]
+            self._change_usage(db, linked_ids, 1, now.date())
+
+        if removed_ids:
+            unlinked_ids = [
+                hashtag_id for hashtag_id in removed_ids
+                if db.query(ContentHashtag).filter(
+                    ContentHashtag.content_id == review.id,
+                    ContentHashtag.hashtag_id == hashtag_id,
+                ).delete(synchronize_session=False)
+            ]
+            self._change_usage(db, unlinked_ids, -1, now.date())
+
+        return desired
+
+    def _change_usage(self, db: Session, hashtag_ids: List[int], delta: int, usage_date: date) -> None:
+        """연결이 실제로 추가/삭제된 태그의 누적 및 일자별 사용 횟수를 delta만큼 바꿉니다."""
+        if not hashtag_ids:
+            return
+        db.query(Hashtag).filter(Hashtag.id.in_(hashtag_ids)).update(
+            {Hashtag.usage_count: func.greatest(Hashtag.usage_count + delta, 0)},
+            synchronize_session=False,
+        )
+        stmt = mysql_insert(HashtagDailyUsage).values([
+            {"hashtag_id": hashtag_id, "usage_date": usage_date, "usage_count": delta}
+            for hashtag_id in hashtag_ids
+        ])
+        db.execute(stmt.on_duplicate_key_update(
+            usage_count=HashtagDailyUsage.usage_count + stmt.inserted.usage_count,
+        ))
+
+    def rebuild_trends(
+        self,
+        db: Session,
+        *,
+        window_days: int,
+        size: int = TRENDING_SIZE,
+        today: Optional[date] = None,
+    ) -> int:
+        """
+        최근 window_days일 사용량으로 상위 size개 태그 순위를 다시 계산해 저장합니다.
+        조회는 get_trending()이 이 테이블만 읽습니다.
+        """
+        today = today or datetime.utcnow().date()
+        since = today - timedelta(days=window_days - 1)
+        total = func.sum(HashtagDailyUsage.usage_count)
+        rows = db.query(HashtagDailyUsage.hashtag_id, total.label("usage_count")).filter(
+            HashtagDailyUsage.usage_date >= since,
+            HashtagDailyUsage.usage_date <= today,
+        ).group_by(HashtagDailyUsage.hashtag_id).having(total > 0).order_by(
+            total.desc(), HashtagDailyUsage.hashtag_id
+        ).limit(size).all()
+
+        now = datetime.utcnow()
+        try:
+            db.query(HashtagTrend).filter(HashtagTrend.window_days == window_days).delete(synchronize_session=False)
+            if rows:
+                db.bulk_insert_mappings(HashtagTrend, [
+                    {
+                        "window_days": window_days,
+                        "rank": rank,
+                        "hashtag_id": row.hashtag_id,
+                        "usage_count": int(row.usage_count),
+                        "computed_at": now,
+                    }
+                    for rank, row in enumerate(rows, start=1)
+                ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows)
+
+    def get_trending(self, db: Session, *, window_days: int, limit: int = 20) -> List[Tuple[HashtagTrend, Hashtag]]:
+        return db.query(HashtagTrend, Hashtag).join(
+            Hashtag, Hashtag.id == HashtagTrend.hashtag_id
+        ).filter(
+            HashtagTrend.window_days == window_days
+        ).order_by(HashtagTrend.rank).limit(limit).all()
+
+hashtag = CRUDHashtag()
@@ -1,7 +1,9 @@
 from typing import Any, Dict, Optional, Union, List
+from sqlalchemy import and_, false, or_
 from sqlalchemy.orm import Session
+from app.core.regions import preference_ranges
 from app.crud.base import CRUDBase
-from app.models.influencer import Influencer, InfluencerPlatform, InfluencerStats
+from app.models.influencer import Influencer, InfluencerPlatform, InfluencerRegion, InfluencerStats
 from app.schemas.influencer import InfluencerCreate, InfluencerUpdate, InfluencerStatsCreate, InfluencerStatsUpdate, InfluencerPlatformCreate, InfluencerPlatformUpdate
 
 class CRUDInfluencer(CRUDBase[Influencer, InfluencerCreate, InfluencerUpdate]):
@@ -22,7 +24,17 @@ class CRUDInfluencer(CRUDBase[Influencer, InfluencerCreate, InfluencerUpdate]):
             query = query.filter(Influencer.categories.overlap(filters["categories"]))
         
         if "preferred_regions" in filters:
-            query = query.filter(Influencer.preferred_regions.overlap(filters["preferred_regions"]))
+            # 요청 지역 구간과 겹치는 선호 지역 구간이 있는 인플루언서 ("서울"이면 서울 안 어느 구를 선호해도 포함)
+            ranges = preference_ranges(filters["preferred_regions"])
+            if not ranges:
+                query = query.filter(false())
+            else:
+                query = query.filter(Influencer.id.in_(
+                    db.query(InfluencerRegion.influencer_id).filter(or_(*[
+                        and_(InfluencerRegion.region_code_start <= end, InfluencerRegion.region_code_end >= start)
+                        for start, end in ranges
+                    ]))
+                ))
         
         if "min_followers" in filters:
             query = query.filter(InfluencerStats.followers >= filters["min_followers"])
@@ -166,6 +178,7 @@ class CRUDInfluencer(CRUDBase[Influencer, InfluencerCreate, InfluencerUpdate]):
         )
         db.add(db_obj)
         db.flush()  # ID 생성을 위해 flush
+        self._sync_regions(db, influencer_id=db_obj.id, regions=obj_in.preferred_regions)
 
         # 통계 정보 생성
         stats = InfluencerStats(
@@ -208,13 +221,13 @@ class CRUDInfluencer(CRUDBase[Influencer, InfluencerCreate, InfluencerUpdate]):
         else:
             update_data = obj_in.dict(exclude_unset=True)
         
-        # 기본 정보 업데이트
+        # 기본 정보 업데이트 (값이 달라진 필드만)
         for field, value in update_data.items():
-            if field not in ["stats", "platforms"]:
+            if field not in ["stats", "platforms"] and getattr(db_obj, field) != value:
                 setattr(db_obj, field, value)
         
-        # 통계 정보 업데이트
-        if "stats" in update_data:
+        # 통계 정보 업데이트 (null은 필드를 보내지 않은 것과 같이 취급)
+        if update_data.get("stats") is not None:
             stats = db_obj.stats
             if not stats:
                 stats = InfluencerStats(influencer_id=db_obj.id)
@@ -223,29 +236,138 @@ class CRUDInfluencer(CRUDBase[Influencer, InfluencerCreate, InfluencerUpdate]):
             for field, value in update_data["stats"].items():
                 setattr(stats, field, value)
         
-        # 플랫폼 정보 업데이트
-        if "platforms" in update_data:
-            # 기존 플랫폼 정보 삭제
-            db.query(InfluencerPlatform).filter(
-                InfluencerPlatform.influencer_id == db_obj.id
-            ).delete()
-            
-            # 새로운 플랫폼 정보 추가
-            for platform in update_data["platforms"]:
-                platform_obj = InfluencerPlatform(
-                    influencer_id=db_obj.id,
-                    platform_name=platform.platform_name,
-                    username=platform.username,
-                    profile_url=platform.profile_url,
-                    followers=platform.followers,
-                    posts=platform.posts,
-                    engagement_rate=platform.engagement_rate,
-                )
-                db.add(platform_obj)
+        # 플랫폼 정보 업데이트 (변경분만 반영)
+        platforms_changed = False
+        if update_data.get("platforms") is not None:
+            platforms_changed = self._sync_platforms(
+                db, influencer_id=db_obj.id, platforms=update_data["platforms"]
+            )
+        
+        regions_changed = False
+        if "preferred_regions" in update_data:
+            regions_changed = self._sync_regions(
+                db, influencer_id=db_obj.id, regions=update_data["preferred_regions"]
+            )
+        
+        # 실제 변경이 없으면 커밋/리프레시 없이 반환
+        if not platforms_changed and not regions_changed and not db.new and not any(
+            db.is_modified(obj) for obj in db.dirty
+        ):
+            return db_obj
         
         db.commit()
-        db.refresh(db_obj)
         return db_obj
+    
+    def _sync_platforms(
+        self,
+        db: Session,
+        *,
+        influencer_id: int,
+        platforms: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        (platform_name, username) 기준으로 기존 플랫폼과 비교하여
+        추가/수정/삭제가 필요한 행만 벌크로 반영합니다.
+        변경 사항이 있었는지 여부를 반환합니다.
+        """
+        fields = ("profile_url", "followers", "posts", "engagement_rate")
+        existing = {
+            (row.platform_name, row.username): row
+            for row in db.query(
+                InfluencerPlatform.id,
+                InfluencerPlatform.platform_name,
+                InfluencerPlatform.username,
+                *(getattr(InfluencerPlatform, field) for field in fields)
+            ).filter(InfluencerPlatform.influencer_id == influencer_id)
+        }
+        
+        to_insert: List[Dict[str, Any]] = []
+        to_update: List[Dict[str, Any]] = []
+        seen = set()
+        for platform in platforms:
+            data = platform if isinstance(platform, dict) else platform.dict()
+            key = (data["platform_name"], data["username"])
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            current = existing.get(key)
+            if current is None:
+                to_insert.append({"influencer_id": influencer_id, **data})
+                continue
+            
+            changes = {
+                field: data[field]
+                for field in fields
+                if field in data and data[field] != getattr(current, field)
+            }
+            if changes:
+                to_update.append({"id": current.id, **changes})
+        
+        to_delete = [row.id for key, row in existing.items() if key not in seen]
+        
+        if to_delete:
+            db.query(InfluencerPlatform).filter(
+                InfluencerPlatform.id.in_(to_delete)
+            ).delete(synchronize_session=False)
+        if to_update:
+            db.bulk_update_mappings(InfluencerPlatform, to_update)
+        if to_insert:
+            db.bulk_insert_mappings(InfluencerPlatform, to_insert)
+        
+        return bool(to_insert or to_update or to_delete)
+    
+    def rebuild_regions(self, db: Session, *, batch_size: int = 500) -> int:
+        """
+        모든 인플루언서의 preferred_regions로 influencer_regions를 다시 만듭니다.
+        색인 도입 전의 행이나 행정구역 데이터가 바뀐 뒤의 코드를 맞출 때 씁니다. (app.db.backfill_regions)
+        id 순으로 batch_size명씩 처리하고 묶음마다 커밋하며, 바뀐 인플루언서 수를 반환합니다.
+        """
+        changed = 0
+        last_id = 0
+        while True:
+            rows = db.query(Influencer.id, Influencer.preferred_regions).filter(
+                Influencer.id > last_id
+            ).order_by(Influencer.id).limit(batch_size).all()
+            if not rows:
+                break
+            for row in rows:
+                if self._sync_regions(db, influencer_id=row.id, regions=row.preferred_regions):
+                    changed += 1
+            db.commit()
+            last_id = rows[-1].id
+        return changed
+    
+    def _sync_regions(
+        self,
+        db: Session,
+        *,
+        influencer_id: int,
+        regions: Optional[List[str]]
+    ) -> bool:
+        """
+        선호 지역 이름을 행정구역 코드 구간으로 바꿔 influencer_regions에 반영합니다.
+        구간이 그대로면 아무 것도 쓰지 않고, 변경 사항이 있었는지 여부를 반환합니다.
+        """
+        ranges = preference_ranges(regions or [])
+        existing = sorted(
+            (row.region_code_start, row.region_code_end)
+            for row in db.query(
+                InfluencerRegion.region_code_start, InfluencerRegion.region_code_end
+            ).filter(InfluencerRegion.influencer_id == influencer_id)
+        )
+        if existing == ranges:
+            return False
+        
+        db.query(InfluencerRegion).filter(
+            InfluencerRegion.influencer_id == influencer_id
+        ).delete(synchronize_session=False)
+        if ranges:
+            db.bulk_insert_mappings(InfluencerRegion, [
+                {"influencer_id": influencer_id, "region_code_start": start, "region_code_end": end}
+                for start, end in ranges
+            ])
+        return True
 
 class CRUDInfluencerStats(CRUDBase[InfluencerStats, InfluencerStatsCreate, InfluencerStatsUpdate]):
     def get_by_influencer_id(self, db: Session, *, influencer_id: int) -> Optional[InfluencerStats]:
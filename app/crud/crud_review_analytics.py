@@ -0,0 +1,80 @@
+from typing import Any, Dict, Optional
+from datetime import datetime
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from app.core.cache import cache
+from app.core.config import settings
+from app.models.review import ReviewContent, ReviewStatus
+
+class CRUDReviewAnalytics:
+    """
+    캠페인 단위 리뷰 성과 집계.
+    캠페인의 모든 리뷰를 상태별 GROUP BY 쿼리 한 번으로 집계하고, 결과는 캠페인별로
+    ttl초 동안 워커 공유 캐시(app.core.cache)에 보관합니다. 리뷰 상태가 바뀌면 invalidate()로 비웁니다.
+    """
+
+    def __init__(self, ttl: int = settings.REVIEW_ANALYTICS_CACHE_TTL):
+        self.ttl = ttl
+
+    def get_campaign_summary(self, db: Session, *, campaign_id: int) -> Dict[str, Any]:
+        return cache.get_or_set(
+            f"review_analytics:{campaign_id}",
+            lambda: self._aggregate(db, campaign_id),
+            ttl=self.ttl,
+        )
+
+    def invalidate(self, *campaign_ids: Optional[int]) -> None:
+        cache.delete(*(
+            f"review_analytics:{campaign_id}" for campaign_id in campaign_ids if campaign_id is not None
+        ))
+
+    def _aggregate(self, db: Session, campaign_id: int) -> Dict[str, Any]:
+        # 제출 → 완료까지 걸린 시간(초). 둘 중 하나라도 없으면 NULL이 되어 평균에서 제외됩니다.
+        latency = func.timestampdiff(text("SECOND"), ReviewContent.submission_date, ReviewContent.completion_date)
+        rows = db.query(
+            ReviewContent.status,
+            func.count(ReviewContent.id).label("count"),
+            func.coalesce(func.sum(ReviewContent.views), 0).label("views"),
+            func.coalesce(func.sum(ReviewContent.likes), 0).label("likes"),
+            func.coalesce(func.sum(ReviewContent.comments), 0).label("comments"),
+            func.coalesce(func.sum(ReviewContent.shares), 0).label("shares"),
+            func.count(latency).label("latency_count"),
+            func.coalesce(func.sum(latency), 0).label("latency_total"),
+        ).filter(
+            ReviewContent.campaign_id == campaign_id
+        ).group_by(ReviewContent.status).all()
+
+        status_counts = {status.value: 0 for status in ReviewStatus}
+        totals = {"views": 0, "likes": 0, "comments": 0, "shares": 0}
+        total_reviews = latency_count = latency_total = 0
+        for row in rows:
+            status = getattr(row.status, "value", row.status)
+            if status is not None:
+                status_counts[status] = row.count
+            total_reviews += row.count
+            # 조회수/반응 지표는 게시가 끝난(완료된) 리뷰만 합산합니다. 평균의 분모와 같은 집합입니다.
+            if status == ReviewStatus.COMPLETED.value:
+                for field in totals:
+                    totals[field] = int(getattr(row, field))
+            latency_count += row.latency_count
+            latency_total += int(row.latency_total)
+
+        published = status_counts[ReviewStatus.COMPLETED.value]
+        interactions = totals["likes"] + totals["comments"] + totals["shares"]
+        return {
+            "campaign_id": campaign_id,
+            "total_reviews": total_reviews,
+            "status_counts": status_counts,
+            "total_views": totals["views"],
+            "total_likes": totals["likes"],
+            "total_comments": totals["comments"],
+            "total_shares": totals["shares"],
+            "average_views": round(totals["views"] / published, 2) if published else 0.0,
+            "average_likes": round(totals["likes"] / published, 2) if published else 0.0,
+            "average_comments": round(totals["comments"] / published, 2) if published else 0.0,
+            "engagement_rate": round(interactions / totals["views"] * 100, 2) if totals["views"] else 0.0,
+            "average_completion_hours": round(latency_total / latency_count / 3600, 2) if latency_count else None,
+            "generated_at": datetime.utcnow(),
+        }
+
+review_analytics = CRUDReviewAnalytics()
@@ -1,8 +1,30 @@
-from typing import Optional, List
+from typing import Any, Optional, List, Set, Dict, Tuple
+from datetime import date, datetime, time, timedelta
+import heapq
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
-from app.models.social_channel import SocialChannel, BlogPostRanking
-from app.schemas.social_channel import SocialChannelCreate, SocialChannelUpdate, BlogPostRankingCreate, BlogPostRankingUpdate
+from app.models.social_channel import SocialChannel, BlogPostRanking, BlogPostLeaderboard, RankingMetric
+from app.models.channel_analytics import ChannelAnalytics
+from app.crud.crud_channel_analytics import channel_analytics
+from app.schemas.social_channel import (
+    SocialChannelCreate, SocialChannelUpdate, SocialChannelSnapshot,
+    BlogPostRankingCreate, BlogPostRankingUpdate, BlogPostRankingSnapshotItem
+)
+
+# 스냅샷으로 갱신 가능한 채널 지표 컬럼
+CHANNEL_METRIC_FIELDS = {
+    "followers_count",
+    "posts",
+    "average_views",
+    "average_likes",
+    "average_comments",
+    "average_shares",
+    "engagement_rate",
+}
+
+# 일별 리더보드에 저장하는 지표별 상위 포스트 수
+LEADERBOARD_SIZE = 100
 
 class CRUDSocialChannel(CRUDBase[SocialChannel, SocialChannelCreate, SocialChannelUpdate]):
     def get_by_user_id(self, db: Session, *, user_id: int) -> List[SocialChannel]:
@@ -28,9 +50,68 @@ class CRUDSocialChannel(CRUDBase[SocialChannel, SocialChannelCreate, SocialChann
         update_data = obj_in.dict(exclude_unset=True)
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
+    def apply_snapshots(self, db: Session, *, snapshots: List[SocialChannelSnapshot]) -> Set[int]:
+        """
+        채널 지표 스냅샷 묶음을 한 트랜잭션으로 반영합니다.
+        채널 행은 executemany UPDATE로 갱신하고, ChannelAnalytics 이력 행과
+        일/주/월 롤업은 같은 트랜잭션에서 함께 반영합니다.
+        존재하는 채널 id 집합을 반환합니다.
+        """
+        channel_ids = {snapshot.channel_id for snapshot in snapshots}
+        known_ids = {
+            row.id for row in db.query(SocialChannel.id).filter(SocialChannel.id.in_(channel_ids))
+        }
+        if not known_ids:
+            return known_ids
+
+        now = datetime.utcnow()
+        # 같은 채널이 한 묶음에 여러 번 들어오면 마지막 스냅샷으로 채널 행을 갱신
+        latest: Dict[int, SocialChannelSnapshot] = {}
+        history = []
+        for snapshot in snapshots:
+            if snapshot.channel_id not in known_ids:
+                continue
+            latest[snapshot.channel_id] = snapshot
+            history.append({
+                "channel_id": snapshot.channel_id,
+                "date": snapshot.synced_at or now,
+                "followers_count": snapshot.followers_count,
+                "posts_count": snapshot.posts,
+                "total_views": snapshot.total_views,
+                "total_likes": snapshot.total_likes,
+                "total_comments": snapshot.total_comments,
+                "total_shares": snapshot.total_shares,
+            })
+
+        channel_rows = [
+            {
+                "id": channel_id,
+                **snapshot.dict(include=CHANNEL_METRIC_FIELDS, exclude_none=True),
+                "last_sync_at": snapshot.synced_at or now,
+                "updated_at": now,
+            }
+            for channel_id, snapshot in latest.items()
+        ]
+
+        try:
+            db.execute(update(SocialChannel), channel_rows)
+            db.execute(insert(ChannelAnalytics.__table__), history)
+            channel_analytics.apply_snapshots(db, snapshots=history)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return known_ids
+
 class CRUDBlogPostRanking(CRUDBase[BlogPostRanking, BlogPostRankingCreate, BlogPostRankingUpdate]):
-    def get_by_channel_id(self, db: Session, *, channel_id: int) -> List[BlogPostRanking]:
-        return db.query(BlogPostRanking).filter(BlogPostRanking.channel_id == channel_id).all()
+    def get_by_channel_id(
+        self, db: Session, *, channel_id: int, skip: int = 0, limit: int = 100
+    ) -> List[BlogPostRanking]:
+        return db.query(BlogPostRanking).filter(
+            BlogPostRanking.channel_id == channel_id
+        ).order_by(
+            BlogPostRanking.ranking_date.desc(), BlogPostRanking.views.desc()
+        ).offset(skip).limit(limit).all()
 
     def create(self, db: Session, *, obj_in: BlogPostRankingCreate) -> BlogPostRanking:
         db_obj = BlogPostRanking(
@@ -43,16 +124,174 @@ class CRUDBlogPostRanking(CRUDBase[BlogPostRanking, BlogPostRankingCreate, BlogP
             shares=obj_in.shares,
             ranking_date=obj_in.ranking_date
         )
-        db.add(db_obj)
-        db.commit()
+        try:
+            db.add(db_obj)
+            db.flush()
+            self.rebuild_leaderboards(db, channel_id=db_obj.channel_id, ranking_date=_as_date(db_obj.ranking_date))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
         db.refresh(db_obj)
         return db_obj
 
     def update(
         self, db: Session, *, db_obj: BlogPostRanking, obj_in: BlogPostRankingUpdate
     ) -> BlogPostRanking:
+        # 순위 행 변경과 리더보드 재계산을 한 트랜잭션으로 커밋합니다. (CRUDBase.update는 바로 커밋하므로 쓰지 않음)
+        previous_date = _as_date(db_obj.ranking_date)
         update_data = obj_in.dict(exclude_unset=True)
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        try:
+            for field, value in update_data.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            db.flush()
+            for ranking_date in {previous_date, _as_date(db_obj.ranking_date)}:
+                self.rebuild_leaderboards(db, channel_id=db_obj.channel_id, ranking_date=ranking_date)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        db.refresh(db_obj)
+        return db_obj
+
+    def replace_daily_snapshot(
+        self,
+        db: Session,
+        *,
+        channel_id: int,
+        ranking_date: date,
+        items: List[BlogPostRankingSnapshotItem],
+    ) -> Tuple[int, int]:
+        """
+        채널의 하루치 순위 스냅샷을 교체합니다. 기존 행 삭제, executemany INSERT,
+        리더보드 재계산을 한 트랜잭션으로 처리하며 (추가된 행 수, 교체된 행 수)를 반환합니다.
+        """
+        day, next_day = _day_range(ranking_date)
+        # 같은 포스트가 중복되면 마지막 값을 사용
+        unique_items = list({item.post_url: item for item in items}.values())
+        now = datetime.utcnow()
+        try:
+            replaced = db.query(BlogPostRanking).filter(
+                BlogPostRanking.channel_id == channel_id,
+                BlogPostRanking.ranking_date >= day,
+                BlogPostRanking.ranking_date < next_day,
+            ).delete(synchronize_session=False)
+            if unique_items:
+                db.execute(insert(BlogPostRanking), [
+                    {
+                        "channel_id": channel_id,
+                        **item.dict(),
+                        "ranking_date": day,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for item in unique_items
+                ])
+            self.rebuild_leaderboards(
+                db, channel_id=channel_id, ranking_date=ranking_date, items=unique_items
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(unique_items), replaced
+
+    def rebuild_leaderboards(
+        self,
+        db: Session,
+        *,
+        channel_id: int,
+        ranking_date: date,
+        items: Optional[List[Any]] = None,
+    ) -> None:
+        """
+        채널/일자의 지표별 상위 LEADERBOARD_SIZE개 포스트를 다시 계산합니다.
+        items가 없으면 해당 일자의 순위 행을 조회해서 사용합니다. 커밋은 호출자가 합니다.
+        """
+        if items is None:
+            day, next_day = _day_range(ranking_date)
+            items = db.query(BlogPostRanking).filter(
+                BlogPostRanking.channel_id == channel_id,
+                BlogPostRanking.ranking_date >= day,
+                BlogPostRanking.ranking_date < next_day,
+            ).all()
+
+        db.query(BlogPostLeaderboard).filter(
+            BlogPostLeaderboard.channel_id == channel_id,
+            BlogPostLeaderboard.ranking_date == ranking_date,
+        ).delete(synchronize_session=False)
+
+        entries = []
+        for metric in RankingMetric:
+            top = heapq.nlargest(LEADERBOARD_SIZE, items, key=lambda item: getattr(item, metric.value) or 0)
+            for rank, item in enumerate(top, start=1):
+                entries.append({
+                    "channel_id": channel_id,
+                    "ranking_date": ranking_date,
+                    "metric": metric,
+                    "rank": rank,
+                    "post_url": item.post_url,
+                    "title": item.title,
+                    "views": item.views or 0,
+                    "likes": item.likes or 0,
+                    "comments": item.comments or 0,
+                    "shares": item.shares or 0,
+                })
+        if entries:
+            db.execute(insert(BlogPostLeaderboard), entries)
+
+    def get_top(
+        self,
+        db: Session,
+        *,
+        channel_id: int,
+        metric: RankingMetric,
+        start: date,
+        end: date,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        기간 내 지표 상위 포스트를 리더보드에서 조회합니다.
+        포스트별로 기간 중 최댓값을 기준으로 정렬합니다. 어떤 포스트가 기간 상위 N개에
+        들면 최댓값을 기록한 날의 상위 N개에도 포함되므로 rank <= N인 행만 읽으면 됩니다.
+        """
+        limit = min(limit, LEADERBOARD_SIZE)
+        rows = db.query(BlogPostLeaderboard).filter(
+            BlogPostLeaderboard.channel_id == channel_id,
+            BlogPostLeaderboard.metric == metric,
+            BlogPostLeaderboard.ranking_date >= start,
+            BlogPostLeaderboard.ranking_date <= end,
+            BlogPostLeaderboard.rank <= limit,
+        ).all()
+
+        best: Dict[str, BlogPostLeaderboard] = {}
+        for row in rows:
+            current = best.get(row.post_url)
+            if current is None or getattr(row, metric.value) > getattr(current, metric.value):
+                best[row.post_url] = row
+
+        top = heapq.nlargest(limit, best.values(), key=lambda row: getattr(row, metric.value))
+        return [
+            {
+                "rank": rank,
+                "post_url": row.post_url,
+                "title": row.title,
+                "ranking_date": row.ranking_date,
+                "views": row.views,
+                "likes": row.likes,
+                "comments": row.comments,
+                "shares": row.shares,
+            }
+            for rank, row in enumerate(top, start=1)
+        ]
+
+def _as_date(value: Any) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+def _day_range(value: date) -> Tuple[datetime, datetime]:
+    start = datetime.combine(value, time.min)
+    return start, start + timedelta(days=1)
 
 social_channel = CRUDSocialChannel(SocialChannel)
 blog_post_ranking = CRUDBlogPostRanking(BlogPostRanking) 
\ No newline at end of file
@@ -0,0 +1,26 @@
+import logging
+from app.crud.crud_campaign_location import campaign_location as crud_campaign_location
+from app.crud.crud_influencer import influencer as crud_influencer
+from app.db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+def backfill_regions(batch_size: int = 500) -> None:
+    """
+    저장된 지역 코드를 현재 행정구역 데이터로 다시 계산합니다.
+    - influencer_regions: 모든 인플루언서의 preferred_regions로 다시 생성
+    - campaign_locations.region_code: 저장된 주소로 다시 해석
+    색인 도입 직후 한 번, 그리고 REGION_DONG_DATA_PATH의 데이터를 바꿀 때마다 실행합니다.
+    여러 번 실행해도 결과는 같습니다.
+    """
+    db = SessionLocal()
+    try:
+        influencers = crud_influencer.rebuild_regions(db, batch_size=batch_size)
+        locations = crud_campaign_location.rebuild_region_codes(db, batch_size=batch_size)
+    finally:
+        db.close()
+    print(f"지역 색인 재계산 완료: 인플루언서 {influencers}명, 캠페인 장소 {locations}곳 변경")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    backfill_regions()
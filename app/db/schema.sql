@@ -1,13 +1,17 @@
 -- 기존 테이블 삭제 (외래 키 제약조건 고려)
 SET FOREIGN_KEY_CHECKS = 0;
 
+DROP TABLE IF EXISTS channel_analytics_rollups;
+DROP TABLE IF EXISTS blog_post_leaderboards;
 DROP TABLE IF EXISTS blog_post_rankings;
+DROP TABLE IF EXISTS influencer_regions;
 DROP TABLE IF EXISTS influencer_platforms;
 DROP TABLE IF EXISTS influencer_stats;
 DROP TABLE IF EXISTS influencers;
 DROP TABLE IF EXISTS social_channels;
 DROP TABLE IF EXISTS campaign_applications;
 DROP TABLE IF EXISTS campaigns;
+DROP TABLE IF EXISTS categories;
 DROP TABLE IF EXISTS users;
 
 SET FOREIGN_KEY_CHECKS = 1;
@@ -24,10 +28,21 @@ CREATE TABLE users (
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
+-- 카테고리 테이블 (parent_id 자기 참조 트리)
+CREATE TABLE categories (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    description VARCHAR(255),
+    parent_id BIGINT,
+    is_active BOOLEAN DEFAULT true,
+    CONSTRAINT fk_categories_parent FOREIGN KEY (parent_id) REFERENCES categories(id)
+);
+
 -- 캠페인 테이블
 CREATE TABLE campaigns (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
     user_id BIGINT NOT NULL,
+    category_id BIGINT,
     title VARCHAR(255) NOT NULL,
     description TEXT,
     status ENUM('DRAFT', 'ACTIVE', 'PAUSED', 'COMPLETED', 'CANCELLED') DEFAULT 'DRAFT',
@@ -35,11 +50,13 @@ CREATE TABLE campaigns (
     end_date DATETIME,
     budget INT,
     max_participants INT,
+    current_applications INT NOT NULL DEFAULT 0,
     requirements TEXT,
     is_active BOOLEAN DEFAULT true,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    CONSTRAINT fk_campaigns_users FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+    CONSTRAINT fk_campaigns_users FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    CONSTRAINT fk_campaigns_categories FOREIGN KEY (category_id) REFERENCES categories(id)
 );
 
 -- 캠페인 신청 테이블
@@ -47,14 +64,57 @@ CREATE TABLE campaign_applications (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
     campaign_id BIGINT NOT NULL,
     user_id BIGINT NOT NULL,
-    status ENUM('PENDING', 'APPROVED', 'REJECTED', 'WITHDRAWN') DEFAULT 'PENDING',
+    status ENUM('PENDING', 'APPROVED', 'REJECTED', 'WITHDRAWN', 'WAITLISTED') DEFAULT 'PENDING',
     application_text TEXT,
+    score DOUBLE,
+    waitlist_rank INT,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT uq_campaign_applications_campaign_user UNIQUE (campaign_id, user_id),
     CONSTRAINT fk_campaign_applications_campaigns FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
     CONSTRAINT fk_campaign_applications_users FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
 );
 
+-- 캠페인 일정 테이블
+CREATE TABLE campaign_schedules (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    campaign_id BIGINT NOT NULL UNIQUE,
+    application_start_date DATETIME NOT NULL,
+    application_end_date DATETIME NOT NULL,
+    influencer_announcement_date DATETIME NOT NULL,
+    content_start_date DATETIME NOT NULL,
+    content_end_date DATETIME NOT NULL,
+    result_announcement_date DATETIME NOT NULL,
+    max_applicants INT NOT NULL,
+    selected_applicants INT NOT NULL,
+    selection_method ENUM('top_n', 'lottery') NOT NULL DEFAULT 'top_n',
+    waitlist_size INT NOT NULL DEFAULT 0,
+    selected_at DATETIME,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT fk_campaign_schedules_campaigns FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE
+);
+
+-- 캠페인 장소 테이블
+CREATE TABLE campaign_locations (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    campaign_id BIGINT NOT NULL UNIQUE,
+    address VARCHAR(255) NOT NULL,
+    latitude DOUBLE NOT NULL,
+    longitude DOUBLE NOT NULL,
+    geohash VARCHAR(12) NOT NULL,
+    region VARCHAR(50),
+    city VARCHAR(50),
+    district VARCHAR(50),
+    region_code INT,
+    street VARCHAR(100),
+    building_name VARCHAR(100),
+    postal_code VARCHAR(10),
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT fk_campaign_locations_campaigns FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE
+);
+
 -- 소셜 채널 테이블
 CREATE TABLE social_channels (
     channel_id BIGINT AUTO_INCREMENT PRIMARY KEY,
@@ -64,11 +124,36 @@ CREATE TABLE social_channels (
     followers INT DEFAULT 0,
     posts INT DEFAULT 0,
     engagement_rate DECIMAL(5,2) DEFAULT 0.00,
+    last_sync_at DATETIME,
+    last_sync_attempt_at DATETIME,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     CONSTRAINT fk_social_channels_users FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
 );
 
+-- 채널 지표 일/주/월 롤업 테이블 (조회수 등은 구간 마지막 스냅샷의 누적값)
+CREATE TABLE channel_analytics_rollups (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    channel_id BIGINT NOT NULL,
+    period VARCHAR(10) NOT NULL,
+    period_start DATE NOT NULL,
+    snapshot_count INT DEFAULT 0,
+    first_snapshot_at DATETIME,
+    last_snapshot_at DATETIME,
+    followers_start INT,
+    followers_end INT,
+    followers_delta INT DEFAULT 0,
+    views INT DEFAULT 0,
+    likes INT DEFAULT 0,
+    comments INT DEFAULT 0,
+    shares INT DEFAULT 0,
+    engagement_rate DECIMAL(7,2) DEFAULT 0.00,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT uq_channel_rollup_period UNIQUE (channel_id, period, period_start),
+    CONSTRAINT fk_channel_analytics_rollups_social_channels FOREIGN KEY (channel_id) REFERENCES social_channels(channel_id) ON DELETE CASCADE
+);
+
 -- 블로그 포스트 순위 테이블
 CREATE TABLE blog_post_rankings (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
@@ -85,6 +170,23 @@ CREATE TABLE blog_post_rankings (
     CONSTRAINT fk_blog_post_rankings_social_channels FOREIGN KEY (channel_id) REFERENCES social_channels(channel_id) ON DELETE CASCADE
 );
 
+-- 블로그 포스트 일별 리더보드 테이블
+CREATE TABLE blog_post_leaderboards (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    channel_id BIGINT NOT NULL,
+    ranking_date DATE NOT NULL,
+    metric VARCHAR(10) NOT NULL,
+    `rank` INT NOT NULL,
+    post_url VARCHAR(255),
+    title VARCHAR(255),
+    views INT DEFAULT 0,
+    likes INT DEFAULT 0,
+    comments INT DEFAULT 0,
+    shares INT DEFAULT 0,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_blog_post_leaderboards_social_channels FOREIGN KEY (channel_id) REFERENCES social_channels(channel_id) ON DELETE CASCADE
+);
+
 -- 인플루언서 테이블
 CREATE TABLE influencers (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
@@ -245,6 +347,15 @@ CREATE TABLE influencer_platforms (
     CONSTRAINT fk_influencer_platforms_influencers FOREIGN KEY (influencer_id) REFERENCES influencers(id) ON DELETE CASCADE
 );
 
+-- 인플루언서 선호 지역 색인 테이블 (행정구역 코드 구간)
+CREATE TABLE influencer_regions (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    influencer_id BIGINT NOT NULL,
+    region_code_start INT NOT NULL,
+    region_code_end INT NOT NULL,
+    CONSTRAINT fk_influencer_regions_influencers FOREIGN KEY (influencer_id) REFERENCES influencers(id) ON DELETE CASCADE
+);
+
 -- 인덱스 생성
 CREATE INDEX idx_influencers_user_id ON influencers(user_id);
 CREATE INDEX idx_influencer_stats_influencer_id ON influencer_stats(influencer_id);
@@ -253,6 +364,17 @@ CREATE INDEX idx_influencer_platforms_platform_name ON influencer_platforms(plat
 CREATE INDEX idx_social_channels_user_id ON social_channels(user_id);
 CREATE INDEX idx_social_channels_platform ON social_channels(platform);
 CREATE INDEX idx_campaigns_user_id ON campaigns(user_id);
+CREATE INDEX idx_campaigns_updated_at ON campaigns(updated_at);
+CREATE INDEX idx_campaigns_category_id ON campaigns(category_id);
+CREATE INDEX idx_categories_parent_id ON categories(parent_id);
 CREATE INDEX idx_campaign_applications_campaign_id ON campaign_applications(campaign_id);
 CREATE INDEX idx_campaign_applications_user_id ON campaign_applications(user_id);
-CREATE INDEX idx_blog_post_rankings_channel_id ON blog_post_rankings(channel_id); 
\ No newline at end of file
+CREATE INDEX idx_campaign_schedules_announcement ON campaign_schedules(influencer_announcement_date);
+CREATE INDEX idx_campaign_locations_geohash ON campaign_locations(geohash);
+CREATE INDEX idx_campaign_locations_lat_lng ON campaign_locations(latitude, longitude);
+CREATE INDEX idx_campaign_locations_region_code ON campaign_locations(region_code);
+CREATE INDEX idx_influencer_regions_influencer_id ON influencer_regions(influencer_id);
+CREATE INDEX idx_influencer_regions_range ON influencer_regions(region_code_start, region_code_end);
+CREATE INDEX idx_blog_post_rankings_channel_id ON blog_post_rankings(channel_id);
+CREATE INDEX idx_blog_post_rankings_channel_date_views ON blog_post_rankings(channel_id, ranking_date, views);
+CREATE INDEX idx_blog_post_leaderboards_lookup ON blog_post_leaderboards(channel_id, metric, ranking_date, `rank`); 
\ No newline at end of file
@@ -2,8 +2,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.api.v1.endpoints import media
 from app.db.base_class import Base
 from app.db.session import engine
+from app.core.images import shutdown_pool
+from app.core.campaign_lifecycle import lifecycle_scheduler
+from app.core.cache import cache
+from app.core.responses import ORJSONResponse
+import asyncio
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
@@ -15,6 +21,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -27,9 +34,32 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+# 종료 시 이미지 처리 프로세스 풀 정리
+app.add_event_handler("shutdown", shutdown_pool)
+# 종료 시 공유 캐시 연결 정리
+app.add_event_handler("shutdown", cache.shared.close)
+
+# 캠페인 일정 스케줄러 (CampaignSchedule 날짜에 따라 상태 전환/선정 실행)
+_background_tasks = set()
+
+@app.on_event("startup")
+async def start_campaign_scheduler():
+    if settings.CAMPAIGN_SCHEDULER_ENABLED:
+        task = asyncio.create_task(lifecycle_scheduler.run_forever())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+@app.on_event("shutdown")
+async def stop_campaign_scheduler():
+    for task in list(_background_tasks):
+        task.cancel()
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# 업로드 미디어 제공 (내용 주소 키, ETag/Range 지원)
+app.include_router(media.router, prefix=settings.MEDIA_URL, tags=["media"])
+
 @app.get("/")
 async def root():
     return {
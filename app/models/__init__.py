@@ -2,7 +2,7 @@ from app.db.base_class import Base
 
 from app.models.user import User, UserType
 from app.models.campaign import Campaign, CampaignApplication, CampaignStatus
-from app.models.review import ReviewContent, ReviewImage, ReviewStatus
+from app.models.review import ReviewContent, ReviewImage, ReviewMetricSnapshot, ReviewStatus
 from app.models.payment import Payment, PaymentStatus
 from app.models.social_channel import SocialChannel, BlogPostRanking, SocialPlatform
 
@@ -15,6 +15,7 @@ __all__ = [
     "CampaignStatus",
     "ReviewContent",
     "ReviewImage",
+    "ReviewMetricSnapshot",
     "ReviewStatus",
     "Payment",
     "PaymentStatus",
@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Enum as SQLEnum, DateTime
+from sqlalchemy import Column, Integer, String, Date, Boolean, Float, ForeignKey, Enum as SQLEnum, DateTime, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 import enum
@@ -11,11 +11,31 @@ class CampaignStatus(str, enum.Enum):
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
 
+class ApplicationStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    APPROVED = "APPROVED"  # 선정
+    REJECTED = "REJECTED"
+    WITHDRAWN = "WITHDRAWN"
+    WAITLISTED = "WAITLISTED"  # 선정자 취소 시 waitlist_rank 순으로 승계
+
+class SelectionMethod(str, enum.Enum):
+    TOP_N = "top_n"  # 점수 상위 N명
+    LOTTERY = "lottery"  # 점수 가중 추첨
+
+class AdmissionStatus(str, enum.Enum):
+    """캠페인 신청 접수 결과"""
+    ADMITTED = "admitted"
+    NOT_FOUND = "not_found"
+    NOT_ACTIVE = "not_active"
+    FULL = "full"
+    DUPLICATE = "duplicate"
+
 class Campaign(Base):
     __tablename__ = "campaigns"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True, index=True)
     title = Column(String)
     description = Column(String)
     status = Column(SQLEnum(CampaignStatus))
@@ -23,27 +43,84 @@ class Campaign(Base):
     end_date = Column(Date)
     budget = Column(Integer)
     max_participants = Column(Integer)
+    current_applications = Column(Integer, default=0, nullable=False)  # 조건부 UPDATE로만 증가
     requirements = Column(String)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # 피드 증분 갱신 기준
 
     # Relationships
     user = relationship("User", back_populates="campaigns")
+    category = relationship("Category", back_populates="campaigns")
     applications = relationship("CampaignApplication", back_populates="campaign")
+    schedule = relationship("CampaignSchedule", back_populates="campaign", uselist=False)
+    location = relationship("CampaignLocation", back_populates="campaign", uselist=False)
 
 class CampaignApplication(Base):
     __tablename__ = "campaign_applications"
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "user_id", name="uq_campaign_applications_campaign_user"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"))
     user_id = Column(Integer, ForeignKey("users.id"))
-    status = Column(String, default="PENDING")
+    status = Column(String, default=ApplicationStatus.PENDING.value)
     application_text = Column(String)
+    score = Column(Float, nullable=True)  # 선정 시 계산된 점수
+    waitlist_rank = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     campaign = relationship("Campaign", back_populates="applications")
     user = relationship("User", back_populates="campaign_applications")
-    review_contents = relationship("ReviewContent", back_populates="campaign_application") 
\ No newline at end of file
+    review_contents = relationship("ReviewContent", back_populates="campaign_application") 
+
+class CampaignSchedule(Base):
+    __tablename__ = "campaign_schedules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id"), unique=True, nullable=False)
+    application_start_date = Column(DateTime, nullable=False)  # 신청 시작일
+    application_end_date = Column(DateTime, nullable=False)  # 신청 종료일
+    influencer_announcement_date = Column(DateTime, nullable=False, index=True)  # 인플루언서 발표일
+    content_start_date = Column(DateTime, nullable=False)  # 콘텐츠 등록 시작일
+    content_end_date = Column(DateTime, nullable=False)  # 콘텐츠 등록 종료일
+    result_announcement_date = Column(DateTime, nullable=False)  # 결과 발표일
+    max_applicants = Column(Integer, nullable=False)  # 최대 신청자 수
+    selected_applicants = Column(Integer, nullable=False)  # 선정 인원
+    selection_method = Column(SQLEnum(SelectionMethod), default=SelectionMethod.TOP_N, nullable=False)
+    waitlist_size = Column(Integer, default=0, nullable=False)  # 대기자 수
+    selected_at = Column(DateTime, nullable=True)  # 선정 완료 시각
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    campaign = relationship("Campaign", back_populates="schedule")
+
+class CampaignLocation(Base):
+    """체험단 방문 장소. geohash 접두사 범위 조회로 반경 검색 후보를 좁힙니다."""
+    __tablename__ = "campaign_locations"
+    __table_args__ = (
+        Index("idx_campaign_locations_lat_lng", "latitude", "longitude"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id"), unique=True, nullable=False)
+    address = Column(String(255), nullable=False)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    geohash = Column(String(12), nullable=False, index=True)
+    region = Column(String(50))
+    city = Column(String(50))
+    district = Column(String(50))
+    region_code = Column(Integer, nullable=True, index=True)  # app.core.regions 행정구역 코드
+    street = Column(String(100), nullable=True)
+    building_name = Column(String(100), nullable=True)
+    postal_code = Column(String(10), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    campaign = relationship("Campaign", back_populates="location")
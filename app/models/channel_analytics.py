@@ -1,6 +1,9 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, Date, ForeignKey, DateTime, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.orm import relationship
+from app.db.base_class import Base
 from .base import BaseModel
+import enum
 
 class ChannelAnalytics(BaseModel):
     __tablename__ = "channel_analytics"
@@ -15,4 +18,34 @@ class ChannelAnalytics(BaseModel):
     total_shares = Column(Integer)
 
     # Relationships
-    channel = relationship("SocialChannel", back_populates="channel_analytics") 
\ No newline at end of file
+    channel = relationship("SocialChannel", back_populates="channel_analytics")
+
+class RollupPeriod(str, enum.Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"  # 월요일 시작
+    MONTHLY = "monthly"
+
+class ChannelAnalyticsRollup(Base):
+    """ChannelAnalytics 스냅샷을 일/주/월 단위로 미리 집계한 테이블"""
+    __tablename__ = "channel_analytics_rollups"
+    __table_args__ = (
+        UniqueConstraint("channel_id", "period", "period_start", name="uq_channel_rollup_period"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(Integer, ForeignKey("social_channels.id"), nullable=False, index=True)
+    period = Column(SQLEnum(RollupPeriod), nullable=False)
+    period_start = Column(Date, nullable=False)
+    snapshot_count = Column(Integer, default=0)
+    first_snapshot_at = Column(DateTime)
+    last_snapshot_at = Column(DateTime)
+    followers_start = Column(Integer)  # 구간 첫 스냅샷의 팔로워 수
+    followers_end = Column(Integer)  # 구간 마지막 스냅샷의 팔로워 수
+    followers_delta = Column(Integer, default=0)
+    views = Column(Integer, default=0)
+    likes = Column(Integer, default=0)
+    comments = Column(Integer, default=0)
+    shares = Column(Integer, default=0)
+    engagement_rate = Column(Float, default=0.0)  # (좋아요+댓글+공유) / 조회수 * 100
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
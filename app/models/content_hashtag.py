@@ -1,13 +1,20 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from app.db.base_class import Base
 
-class ContentHashtag(BaseModel):
+class ContentHashtag(Base):
     __tablename__ = "content_hashtags"
+    __table_args__ = (
+        UniqueConstraint("content_id", "hashtag_id", name="uq_content_hashtag"),
+    )
 
-    content_id = Column(Integer, ForeignKey("review_contents.id"))
-    hashtag_id = Column(Integer, ForeignKey("hashtags.id"))
+    id = Column(Integer, primary_key=True, index=True)
+    content_id = Column(Integer, ForeignKey("review_contents.id"), nullable=False, index=True)
+    hashtag_id = Column(Integer, ForeignKey("hashtags.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    content = relationship("ReviewContent", back_populates="hashtags")
-    hashtag = relationship("Hashtag", back_populates="contents") 
\ No newline at end of file
+    content = relationship("ReviewContent")
+    hashtag = relationship("Hashtag", back_populates="contents")
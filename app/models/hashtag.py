@@ -1,11 +1,46 @@
-from sqlalchemy import Column, String
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from app.db.base_class import Base
 
-class Hashtag(BaseModel):
+class Hashtag(Base):
     __tablename__ = "hashtags"
 
-    tag_name = Column(String, unique=True, index=True)
+    id = Column(Integer, primary_key=True, index=True)
+    tag_name = Column(String(100), unique=True, index=True)  # 정규화된 태그 (# 없이 소문자)
+    usage_count = Column(Integer, default=0, nullable=False)  # 태그가 달린 리뷰 수
+    last_used_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    contents = relationship("ContentHashtag", back_populates="hashtag") 
\ No newline at end of file
+    contents = relationship("ContentHashtag", back_populates="hashtag")
+
+class HashtagDailyUsage(Base):
+    """태그별 일자별 사용량 증감. 최근 N일 인기 태그 집계의 원천 데이터입니다."""
+    __tablename__ = "hashtag_daily_usage"
+    __table_args__ = (
+        UniqueConstraint("hashtag_id", "usage_date", name="uq_hashtag_daily_usage"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    hashtag_id = Column(Integer, ForeignKey("hashtags.id"), nullable=False)
+    usage_date = Column(Date, nullable=False, index=True)
+    usage_count = Column(Integer, default=0, nullable=False)
+
+class HashtagTrend(Base):
+    """window_days 구간별로 미리 계산해 둔 인기 태그 순위"""
+    __tablename__ = "hashtag_trends"
+    __table_args__ = (
+        Index("idx_hashtag_trends_window_rank", "window_days", "rank"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    window_days = Column(Integer, nullable=False)
+    rank = Column(Integer, nullable=False)
+    hashtag_id = Column(Integer, ForeignKey("hashtags.id"), nullable=False)
+    usage_count = Column(Integer, default=0, nullable=False)  # 구간 내 사용 횟수
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    hashtag = relationship("Hashtag")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Float, JSON, ForeignKey, DateTime, Table, Numeric, Text
+from sqlalchemy import Column, Integer, String, Boolean, Float, JSON, ForeignKey, DateTime, Table, Numeric, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -35,6 +35,21 @@ class InfluencerStats(Base):
 
     influencer = relationship("Influencer", back_populates="stats", uselist=False)
 
+class InfluencerRegion(Base):
+    """
+    preferred_regions를 행정구역 코드 구간으로 색인한 행.
+    캠페인 지역 코드 c를 선호하는 인플루언서는 region_code_start <= c <= region_code_end 로 찾습니다.
+    """
+    __tablename__ = "influencer_regions"
+    __table_args__ = (
+        Index("idx_influencer_regions_range", "region_code_start", "region_code_end"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    influencer_id = Column(Integer, ForeignKey("influencers.id", ondelete="CASCADE"), nullable=False, index=True)
+    region_code_start = Column(Integer, nullable=False)
+    region_code_end = Column(Integer, nullable=False)
+
 class Influencer(Base):
     __tablename__ = "influencers"
 
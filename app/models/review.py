@@ -1,20 +1,32 @@
 from datetime import date, datetime
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Enum as SQLEnum, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Date, Boolean, Float, ForeignKey, Enum as SQLEnum, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 import enum
 
 class ReviewStatus(str, enum.Enum):
+    DRAFT = "draft"
     PENDING = "pending"
+    SUBMITTED = "submitted"
     APPROVED = "approved"
     REJECTED = "rejected"
+    COMPLETED = "completed"
 
 class ReviewContent(Base):
     __tablename__ = "review_contents"
+    __table_args__ = (
+        # 한국어 검색을 위해 MySQL 내장 ngram 파서로 제목/본문 전문 색인을 둡니다.
+        Index(
+            "ft_review_contents_title_content", "title", "content",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     campaign_application_id = Column(Integer, ForeignKey("campaign_applications.id"))
+    campaign_id = Column(Integer, ForeignKey("campaigns.id"), index=True)
     influencer_id = Column(Integer, ForeignKey("users.id"))
+    title = Column(String(200), nullable=True)
     content = Column(String)
     rating = Column(Integer)
     hashtags = Column(JSON)  # JSON array
@@ -25,7 +37,15 @@ class ReviewContent(Base):
     likes = Column(Integer, default=0)
     comments = Column(Integer, default=0)
     shares = Column(Integer, default=0)
+    engagement_rate = Column(Float, default=0.0)  # (좋아요+댓글+공유) / 조회수 * 100
+    metrics_updated_at = Column(DateTime, nullable=True)  # 마지막 지표 갱신 시각
+    metrics_attempted_at = Column(DateTime, nullable=True)  # 성공 여부와 관계없이 마지막으로 지표 갱신을 시도한 시각
     status = Column(SQLEnum(ReviewStatus))
+    submission_date = Column(DateTime, nullable=True)
+    approval_date = Column(DateTime, nullable=True)
+    completion_date = Column(DateTime, nullable=True)
+    rejection_reason = Column(String, nullable=True)
+    required_modifications = Column(String, nullable=True)
     brand_feedback = Column(String)
     brand_rating = Column(Integer)
     brand_comment = Column(String)
@@ -36,6 +56,7 @@ class ReviewContent(Base):
     campaign_application = relationship("CampaignApplication", back_populates="review_contents")
     influencer = relationship("User", back_populates="review_contents")
     images_list = relationship("ReviewImage", back_populates="review_content")
+    metric_snapshots = relationship("ReviewMetricSnapshot", back_populates="review_content")
 
 class ReviewImage(Base):
     __tablename__ = "review_images"
@@ -45,8 +66,34 @@ class ReviewImage(Base):
     image_url = Column(String)
     caption = Column(String)
     order = Column(Integer, default=0)
+    storage_key = Column(String, nullable=True)  # 저장소 내용 주소 키
+    content_hash = Column(String(64), index=True)  # sha256
+    content_type = Column(String(100))
+    file_size = Column(Integer)
+    thumbnail_url = Column(String, nullable=True)
+    variants = Column(JSON, nullable=True)  # {"thumb": 저장소 키, "web": 저장소 키}
+    variants_status = Column(String(20), default="pending")  # pending / ready / failed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    review_content = relationship("ReviewContent", back_populates="images_list") 
\ No newline at end of file
+    review_content = relationship("ReviewContent", back_populates="images_list") 
+
+class ReviewMetricSnapshot(Base):
+    """게시된 리뷰의 시점별 반응 지표 (주기적 갱신 시 한 건씩 적재)"""
+    __tablename__ = "review_metric_snapshots"
+    __table_args__ = (
+        Index("idx_review_metric_snapshots_review_fetched", "review_content_id", "fetched_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    review_content_id = Column(Integer, ForeignKey("review_contents.id"), nullable=False)
+    views = Column(Integer, default=0)
+    likes = Column(Integer, default=0)
+    comments = Column(Integer, default=0)
+    shares = Column(Integer, default=0)
+    engagement_rate = Column(Float, default=0.0)
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    review_content = relationship("ReviewContent", back_populates="metric_snapshots")
@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum as SQLEnum, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Enum as SQLEnum, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 import enum
@@ -9,6 +9,8 @@ class SocialPlatform(str, enum.Enum):
     NAVER = "naver"
     GOOGLE = "google"
     APPLE = "apple"
+    INSTAGRAM = "instagram"
+    YOUTUBE = "youtube"
 
 class SocialChannel(Base):
     __tablename__ = "social_channels"
@@ -28,6 +30,7 @@ class SocialChannel(Base):
     followers = Column(Integer, default=0)
     posts = Column(Integer, default=0)
     last_sync_at = Column(DateTime, nullable=True)
+    last_sync_attempt_at = Column(DateTime, nullable=True)  # 성공 여부와 관계없이 마지막으로 동기화를 시도한 시각
     platform_specific_data = Column(String, nullable=True)  # JSON string
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -38,6 +41,10 @@ class SocialChannel(Base):
 
 class BlogPostRanking(Base):
     __tablename__ = "blog_post_rankings"
+    __table_args__ = (
+        # 채널/기간별 상위 N개 조회용 복합 인덱스
+        Index("idx_blog_post_rankings_channel_date_views", "channel_id", "ranking_date", "views"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     channel_id = Column(Integer, ForeignKey("social_channels.id"))
@@ -52,4 +59,28 @@ class BlogPostRanking(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    channel = relationship("SocialChannel", back_populates="blog_post_rankings") 
\ No newline at end of file
+    channel = relationship("SocialChannel", back_populates="blog_post_rankings")
+
+class RankingMetric(str, enum.Enum):
+    VIEWS = "views"
+    LIKES = "likes"
+
+class BlogPostLeaderboard(Base):
+    """채널/일자/지표별로 미리 계산된 상위 포스트 목록"""
+    __tablename__ = "blog_post_leaderboards"
+    __table_args__ = (
+        Index("idx_blog_post_leaderboards_lookup", "channel_id", "metric", "ranking_date", "rank"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(Integer, ForeignKey("social_channels.id"), nullable=False)
+    ranking_date = Column(Date, nullable=False)
+    metric = Column(SQLEnum(RankingMetric), nullable=False)
+    rank = Column(Integer, nullable=False)
+    post_url = Column(String)
+    title = Column(String)
+    views = Column(Integer, default=0)
+    likes = Column(Integer, default=0)
+    comments = Column(Integer, default=0)
+    shares = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -24,6 +24,17 @@ from .social_channel import (
     BlogPostRankingUpdate,
     BlogPostRankingList
 )
+from .influencer import (
+    Influencer,
+    InfluencerCreate,
+    InfluencerResponse,
+    InfluencerUpdate,
+    InfluencerStats,
+    InfluencerStatsUpdate,
+    InfluencerPlatform,
+    InfluencerPlatformCreate,
+    InfluencerPlatformUpdate
+)
 from .review import ReviewCreate, ReviewResponse, ReviewUpdate, ReviewContent, ReviewContentCreate, ReviewContentUpdate, ReviewImage, ReviewImageCreate, ReviewImageUpdate
 from .payment import (
     Payment, PaymentCreate, PaymentUpdate, PaymentResponse, PaymentInDB,
@@ -1,7 +1,8 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List
 from pydantic import BaseModel
 from app.schemas.campaign_status import CampaignStatus
+from app.models.campaign import SelectionMethod
 
 class CampaignBase(BaseModel):
     title: str
@@ -13,6 +14,7 @@ class CampaignBase(BaseModel):
     max_participants: int
     requirements: str
     is_active: bool = True
+    category_id: Optional[int] = None
 
 class CampaignCreate(CampaignBase):
     user_id: int
@@ -91,4 +93,12 @@ class CampaignApplication(CampaignApplicationInDBBase):
     pass
 
 class CampaignApplicationInDB(CampaignApplicationInDBBase):
-    pass 
\ No newline at end of file
+    pass 
+
+class CampaignSelectionResult(BaseModel):
+    campaign_id: int
+    method: SelectionMethod
+    selected: int
+    waitlisted: int
+    rejected: int
+    selected_at: datetime
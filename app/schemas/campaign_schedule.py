@@ -1,6 +1,7 @@
 from typing import Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
+from app.models.campaign import SelectionMethod
 
 class CampaignSchedule(BaseModel):
     application_start_date: datetime = Field(..., description="신청 시작일")
@@ -10,4 +11,14 @@ class CampaignSchedule(BaseModel):
     content_end_date: datetime = Field(..., description="콘텐츠 등록 종료일")
     result_announcement_date: datetime = Field(..., description="결과 발표일")
     max_applicants: int = Field(..., description="최대 신청자 수")
-    selected_applicants: int = Field(..., description="선정된 신청자 수") 
\ No newline at end of file
+    selected_applicants: int = Field(..., description="선정된 신청자 수")
+    selection_method: SelectionMethod = Field(SelectionMethod.TOP_N, description="선정 방식")
+    waitlist_size: int = Field(0, ge=0, description="대기자 수")
+
+class CampaignScheduleResponse(CampaignSchedule):
+    id: int
+    campaign_id: int
+    selected_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 class CategoryBase(BaseModel):
@@ -20,4 +20,15 @@ class CategoryResponse(CategoryBase):
     id: int
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class CategoryTreeNode(BaseModel):
+    """카테고리 트리 노드 스키마 (lft/rgt: nested set 구간)"""
+    id: int
+    name: str
+    description: Optional[str] = None
+    parent_id: Optional[int] = None
+    depth: int
+    lft: int
+    rgt: int
+    children: List["CategoryTreeNode"] = []
@@ -26,4 +26,15 @@ class HashtagList(BaseModel):
     hashtags: List[HashtagResponse]
     total: int
     page: int
-    size: int 
\ No newline at end of file
+    size: int 
+
+class HashtagTrendItem(BaseModel):
+    rank: int
+    name: str
+    usage_count: int = Field(..., description="구간 내 사용 횟수")
+    total_usage_count: int = Field(..., description="전체 사용 횟수")
+
+class HashtagTrendList(BaseModel):
+    window_days: int
+    computed_at: Optional[datetime] = None
+    items: List[HashtagTrendItem]
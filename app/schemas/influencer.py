@@ -254,6 +254,8 @@ class InfluencerUpdate(BaseModel):
     available_for_collaboration: Optional[bool] = None
     minimum_fee: Optional[float] = None
     maximum_fee: Optional[float] = None
+    stats: Optional[InfluencerStats] = None
+    platforms: Optional[List[InfluencerPlatform]] = None
 
 class InfluencerInDBBase(InfluencerBase):
     id: int
@@ -270,6 +272,9 @@ class Influencer(InfluencerInDBBase):
 class InfluencerInDB(InfluencerInDBBase):
     pass
 
+class InfluencerResponse(InfluencerInDBBase):
+    pass
+
 class InfluencerStatsBase(BaseModel):
     followers: int = 0
     following: int = 0
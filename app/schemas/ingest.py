@@ -0,0 +1,12 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+class IngestError(BaseModel):
+    line: int = Field(..., description="입력 스트림의 줄 번호")
+    detail: str = Field(..., description="실패 사유")
+
+class IngestResult(BaseModel):
+    received: int = Field(..., description="수신한 레코드 수")
+    applied: int = Field(..., description="반영된 레코드 수")
+    failed: int = Field(..., description="실패한 레코드 수")
+    errors: List[IngestError] = Field(default=[], description="실패한 레코드 목록")
@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import List, Optional
+from datetime import date
 from pydantic import BaseModel, Field
 
 class Location(BaseModel):
@@ -10,4 +11,23 @@ class Location(BaseModel):
     district: str = Field(..., description="구/군")
     street: Optional[str] = Field(None, description="도로명")
     building_name: Optional[str] = Field(None, description="건물명")
-    postal_code: Optional[str] = Field(None, description="우편번호") 
\ No newline at end of file
+    postal_code: Optional[str] = Field(None, description="우편번호") 
+
+class CampaignLocationResponse(Location):
+    campaign_id: int
+    geohash: str
+    region_code: Optional[int] = Field(None, description="행정구역 코드")
+
+    class Config:
+        from_attributes = True
+
+class NearbyCampaign(BaseModel):
+    campaign_id: int
+    title: str
+    end_date: Optional[date] = None
+    distance_km: float = Field(..., description="기준 지점과의 거리(km)")
+    location: Location
+
+class NearbyCampaignList(BaseModel):
+    total: int
+    items: List[NearbyCampaign]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime, date
 from enum import Enum
 from app.models.review import ReviewStatus
@@ -82,6 +82,12 @@ class ReviewImage(ReviewImageBase):
 
 class ReviewImageResponse(ReviewImageBase):
     id: int
+    content_hash: Optional[str] = None
+    content_type: Optional[str] = None
+    file_size: Optional[int] = None
+    thumbnail_url: Optional[str] = None
+    variants: Optional[Dict[str, str]] = None
+    variants_status: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -108,18 +114,89 @@ class ReviewStats(BaseModel):
     class Config:
         from_attributes = True
 
+class CampaignReviewAnalytics(BaseModel):
+    campaign_id: int
+    total_reviews: int
+    status_counts: Dict[str, int]
+    total_views: int
+    total_likes: int
+    total_comments: int
+    total_shares: int
+    average_views: float
+    average_likes: float
+    average_comments: float
+    engagement_rate: float
+    average_completion_hours: Optional[float] = None
+    generated_at: datetime
+
+class ReviewSearchHit(BaseModel):
+    id: int
+    campaign_id: Optional[int] = None
+    influencer_id: Optional[int] = None
+    title: Optional[str] = None
+    snippet: str
+    status: Optional[ReviewStatus] = None
+    score: float
+
+class ReviewSearchResult(BaseModel):
+    query: str
+    terms: List[str]
+    total: int
+    items: List[ReviewSearchHit]
+
+class ReviewMetricSnapshotResponse(BaseModel):
+    views: int
+    likes: int
+    comments: int
+    shares: int
+    engagement_rate: float
+    fetched_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ReviewModerationAction(str, Enum):
+    APPROVE = "approve"
+    REJECT = "reject"
+
+class ReviewModerationItem(BaseModel):
+    review_id: int
+    action: ReviewModerationAction
+    rejection_reason: Optional[str] = None
+    required_modifications: Optional[str] = None
+
+class ReviewModerationRequest(BaseModel):
+    items: List[ReviewModerationItem] = Field(..., min_length=1, max_length=1000)
+
+class ReviewModerationItemResult(BaseModel):
+    review_id: int
+    action: ReviewModerationAction
+    success: bool
+    status: Optional[ReviewStatus] = None
+    detail: Optional[str] = None
+
+class ReviewModerationResult(BaseModel):
+    processed: int
+    succeeded: int
+    failed: int
+    results: List[ReviewModerationItemResult]
+
 class ReviewBase(BaseModel):
     campaign_id: int
     user_id: int
     rating: int
+    title: Optional[str] = None
     content: str
+    hashtags: List[str] = []
     is_public: bool = True
 
 class ReviewCreate(ReviewBase):
     pass
 
 class ReviewUpdate(BaseModel):
+    title: Optional[str] = None
     content: Optional[str] = None
+    hashtags: Optional[List[str]] = None
     rating: Optional[int] = None
 
 class ReviewResponse(ReviewBase):
@@ -2,12 +2,16 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, date
 from enum import Enum
+from app.models.channel_analytics import RollupPeriod
+from app.models.social_channel import RankingMetric
 
 class SocialPlatform(str, Enum):
     KAKAO = "kakao"
     NAVER = "naver"
     GOOGLE = "google"
     APPLE = "apple"
+    INSTAGRAM = "instagram"
+    YOUTUBE = "youtube"
 
 class SocialChannelBase(BaseModel):
     platform: SocialPlatform
@@ -63,6 +67,48 @@ class SocialChannelStats(BaseModel):
     class Config:
         from_attributes = True
 
+class ChannelRollupResponse(BaseModel):
+    period: RollupPeriod
+    period_start: date
+    snapshot_count: int
+    followers_start: Optional[int] = None
+    followers_end: Optional[int] = None
+    followers_delta: int
+    views: Optional[int] = None  # 구간 마지막 스냅샷의 누적 조회수 (누적값을 받은 적이 없으면 None)
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    shares: Optional[int] = None
+    engagement_rate: float
+    views_gain: Optional[int] = None  # 이전 구간 대비 조회수 증가량
+    views_moving_average: Optional[float] = None
+    followers_delta_moving_average: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+class ChannelRollupList(BaseModel):
+    channel_id: int
+    period: RollupPeriod
+    window: int
+    items: List[ChannelRollupResponse]
+
+class SocialChannelSnapshot(BaseModel):
+    """야간 동기화 등 대량 수집 시 채널 한 개의 지표 스냅샷"""
+    channel_id: int
+    followers_count: Optional[int] = Field(None, ge=0)
+    posts: Optional[int] = Field(None, ge=0)
+    average_views: Optional[int] = Field(None, ge=0)
+    average_likes: Optional[int] = Field(None, ge=0)
+    average_comments: Optional[int] = Field(None, ge=0)
+    average_shares: Optional[int] = Field(None, ge=0)
+    engagement_rate: Optional[float] = Field(None, ge=0)
+    # 누적 지표. 플랫폼이 제공하지 않으면 None이며, 이때 저장된 누적값은 유지됩니다.
+    total_views: Optional[int] = Field(None, ge=0)
+    total_likes: Optional[int] = Field(None, ge=0)
+    total_comments: Optional[int] = Field(None, ge=0)
+    total_shares: Optional[int] = Field(None, ge=0)
+    synced_at: Optional[datetime] = None
+
 class BlogPostRankingBase(BaseModel):
     post_url: str
     title: str
@@ -125,4 +171,40 @@ class BlogPostRankingList(BaseModel):
         from_attributes = True
 
 class BlogPostRankingInDB(BlogPostRanking):
-    pass 
\ No newline at end of file
+    pass
+
+class BlogPostRankingSnapshotItem(BaseModel):
+    post_url: str
+    title: str
+    views: int = Field(0, ge=0)
+    likes: int = Field(0, ge=0)
+    comments: int = Field(0, ge=0)
+    shares: int = Field(0, ge=0)
+
+class BlogPostRankingBatch(BaseModel):
+    """한 채널의 하루치 포스트 순위 스냅샷"""
+    ranking_date: date
+    items: List[BlogPostRankingSnapshotItem] = Field(..., max_length=10000)
+
+class BlogPostRankingBatchResult(BaseModel):
+    channel_id: int
+    ranking_date: date
+    inserted: int
+    replaced: int
+
+class BlogPostTopItem(BaseModel):
+    rank: int
+    post_url: str
+    title: Optional[str] = None
+    ranking_date: date
+    views: int
+    likes: int
+    comments: int
+    shares: int
+
+class BlogPostTopList(BaseModel):
+    channel_id: int
+    metric: RankingMetric
+    start: date
+    end: date
+    items: List[BlogPostTopItem]
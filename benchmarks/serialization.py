@@ -0,0 +1,117 @@
+"""
+목록 응답 직렬화 벤치마크.
+
+FastAPI 기본 경로(response_model 검증 → jsonable_encoder → json.dumps)와
+model_list_response 경로(model_validate → model_dump(mode="json") → orjson)를
+100/1000건 인플루언서·리뷰 목록으로 비교합니다.
+
+    python -m benchmarks.serialization [--repeat 50]
+"""
+from typing import Any, Callable, List, Type
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+import argparse
+import json
+import statistics
+import time
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+from app import schemas
+from app.core.responses import dumps_json
+
+SIZES = (100, 1000)
+
+def make_influencers(count: int) -> List[SimpleNamespace]:
+    """ORM 행처럼 속성으로 읽히는 인플루언서 샘플"""
+    now = datetime(2026, 1, 1)
+    return [
+        SimpleNamespace(
+            id=i,
+            user_id=10_000 + i,
+            bio=f"뷰티·패션 리뷰어 {i}",
+            categories=["beauty", "fashion"],
+            platforms=[
+                {"platform_name": "instagram", "username": f"user{i}", "profile_url": f"https://instagram.com/user{i}",
+                 "followers": 1000 + i, "posts": 120, "engagement_rate": 3.2},
+                {"platform_name": "youtube", "username": f"user{i}", "profile_url": f"https://youtube.com/@user{i}",
+                 "followers": 500 + i, "posts": 40, "engagement_rate": 4.1},
+            ],
+            stats={"followers": 1500 + i, "following": 300, "total_posts": 160,
+                   "average_likes": 80, "average_comments": 12, "engagement_rate": 3.6},
+            preferred_brands=["브랜드A", "브랜드B"],
+            preferred_categories=["beauty"],
+            preferred_price_range={"min": 100000.0, "max": 500000.0},
+            preferred_regions=["서울 강남구", "경기 성남시"],
+            content_style=["vlog", "review"],
+            available_for_collaboration=True,
+            minimum_fee=100000.0,
+            maximum_fee=500000.0,
+            preferred_payment_methods=["bank_transfer"],
+            preferred_delivery_methods=["parcel"],
+            preferred_communication_methods=["email"],
+            preferred_content_deadline=14,
+            preferred_content_review=True,
+            preferred_content_guidelines=None,
+            preferred_content_format=["image", "video"],
+            created_at=now - timedelta(days=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+def make_reviews(count: int) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=i,
+            campaign_id=1 + i % 50,
+            user_id=10_000 + i,
+            rating=1 + i % 5,
+            title=f"체험 후기 {i}",
+            content="제품을 2주 동안 사용해 본 솔직한 후기입니다. " * 8,
+            hashtags=["체험단", "협찬", "뷰티"],
+            is_public=True,
+            created_at=date(2026, 1, 1),
+            updated_at=date(2026, 1, 2),
+        )
+        for i in range(count)
+    ]
+
+def default_path(model: Type[BaseModel], rows: List[Any]) -> bytes:
+    # FastAPI 기본: 반환값을 response_model로 검증/직렬화한 뒤 jsonable_encoder + json.dumps (JSONResponse.render)
+    adapter = TypeAdapter(List[model])
+    content = jsonable_encoder(adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json"))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def fast_path(model: Type[BaseModel], rows: List[Any]) -> bytes:
+    # model_list_response: 행마다 한 번 검증 → model_dump(mode="json") → orjson
+    return dumps_json([model.model_validate(row, from_attributes=True).model_dump(mode="json") for row in rows])
+
+def measure(func: Callable[[], bytes], repeat: int) -> float:
+    func()  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'payload':<22}{'items':>7}{'default (ms)':>15}{'orjson (ms)':>14}{'speedup':>10}")
+    for name, model, factory in (
+        # 목록 엔드포인트가 model_list_response에 넘기는 것과 같은 모델
+        ("InfluencerResponse", schemas.InfluencerResponse, make_influencers),
+        ("ReviewResponse", schemas.ReviewResponse, make_reviews),
+    ):
+        for size in SIZES:
+            rows = factory(size)
+            assert json.loads(default_path(model, rows)) == json.loads(fast_path(model, rows))
+            default_ms = measure(lambda: default_path(model, rows), args.repeat)
+            fast_ms = measure(lambda: fast_path(model, rows), args.repeat)
+            print(f"{name:<22}{size:>7}{default_ms:>15.2f}{fast_ms:>14.2f}{default_ms / fast_ms:>9.1f}x")
+
+if __name__ == "__main__":
+    main()